@@ -0,0 +1,68 @@
+import time
+import argparse
+
+from ngen.engine import Preferences
+from ngen.api import Scene, Entity, Transform, CameraPerspective
+
+from .synthetic import SyntheticMesh, SyntheticTexture, scatter_positions
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+CAMERA_YAWS = [0.0, 45.0, 90.0, 180.0]
+
+def build_scene(count: int, extent: float) -> Scene:
+    mesh = SyntheticMesh()
+    texture = SyntheticTexture()
+    entities = [Entity(Transform(list(position), [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), mesh, texture) for position in scatter_positions(count, extent)]
+    camera = CameraPerspective(Transform([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), 60.0, 0.1, extent)
+    return Scene([0.0, 0.0, 0.0, 1.0], camera, *entities)
+
+def brute_force(scene: Scene, frustum) -> int:
+    bounds_min, bounds_max = scene.get_bounding_volume_hierarchy().get_bounds()
+    return int(frustum.intersects_aabbs(bounds_min, bounds_max).sum())
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Measure BVH frustum culling cost against the number of objects culled.")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = DEFAULT_SIZES)
+    parser.add_argument("--moving", type = float, default = 0.01, help = "fraction of entities moved before each cull")
+    parser.add_argument("--repeat", type = int, default = 5)
+    arguments = parser.parse_args()
+
+    Preferences.set_window_width(1280)
+    Preferences.set_window_height(720)
+
+    print(f"{'entities':>10} {'yaw':>6} {'build ms':>10} {'refit ms':>10} {'cull ms':>10} {'culled':>10} {'check':>6}")
+
+    for size in arguments.sizes:
+        scene = build_scene(size, 100.0)
+        camera = scene.get_camera()
+        entities = [scene_object for scene_object in scene.get_scene_objects()]
+        moving = entities[:max(1, int(size * arguments.moving))]
+
+        start = time.perf_counter()
+        scene.update_bounds()
+        build = (time.perf_counter() - start) * 1000.0
+
+        for yaw in CAMERA_YAWS:
+            camera.get_transform().set_rotation([0.0, yaw, 0.0])
+            refit = cull = 0.0
+
+            for _ in range(arguments.repeat):
+                for entity in moving:
+                    entity.get_transform().translate([0.01, 0.0, 0.0])
+
+                start = time.perf_counter()
+                scene.update_bounds()
+                refit += time.perf_counter() - start
+
+                frustum = camera.get_frustum()
+                start = time.perf_counter()
+                visible = scene.cull(frustum)
+                cull += time.perf_counter() - start
+
+            culled = size - len(visible)
+            check = "ok" if len(visible) == brute_force(scene, frustum) else "FAIL"
+
+            print(f"{size:>10} {yaw:>6.0f} {build:>10.1f} {refit / arguments.repeat * 1000.0:>10.2f} {cull / arguments.repeat * 1000.0:>10.2f} {culled:>10} {check:>6}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,67 @@
+import os
+import time
+import argparse
+
+os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
+import numpy as np
+
+from ngen.engine.application import Application
+from ngen.engine.preferences import Preferences
+from ngen.engine.obj_parser import ObjParser
+from ngen.api.scene import Scene
+from ngen.api.entity import Entity
+from ngen.api.transform import Transform
+from ngen.api.camera import CameraPerspective
+from ngen.graphics.mesh import Mesh
+from ngen.graphics.geometry import Geometry
+
+from .synthetic import generate_grid_obj, scatter_positions
+
+def spin(entity: Entity, delta_time: float) -> None:
+    entity.get_transform().rotate(delta_time * 45.0, Transform.AXIS_Y)
+
+def build_scene(mesh: Mesh, entity_count: int) -> Scene:
+    camera = CameraPerspective(Transform([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), 60.0, 0.1, 200.0)
+    positions = scatter_positions(entity_count, 20.0)
+    positions[:, 2] = np.abs(positions[:, 2]) + 5.0
+    entities = [Entity(Transform(position, [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), mesh, None, None, spin) for position in positions]
+    return Scene([0.1, 0.2, 0.3, 1.0], camera, *entities)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Render a synthetic scene offscreen and measure frame throughput with readback.")
+    parser.add_argument("--frames", type = int, default = 120)
+    parser.add_argument("--entities", type = int, default = 200)
+    parser.add_argument("--width", type = int, default = 640)
+    parser.add_argument("--height", type = int, default = 360)
+    parser.add_argument("--backend", default = Preferences.get_headless_backend())
+    arguments = parser.parse_args()
+
+    Preferences.set_headless(True)
+    Preferences.set_headless_backend(arguments.backend)
+    Preferences.set_window_width(arguments.width)
+    Preferences.set_window_height(arguments.height)
+
+    application = Application()
+    mesh = Mesh(*Geometry.build_indexed(*ObjParser.parse_bytes(generate_grid_obj(2_000))))
+
+    print(f"{'readback':>10} {'frames':>7} {'seconds':>9} {'fps':>8} {'identical':>10}")
+
+    reference = None
+
+    for buffer_count, label in ((1, "sync"), (2, "pbo x2"), (3, "pbo x3")):
+        Preferences.set_readback_buffer_count(buffer_count)
+        checksums = []
+
+        start = time.perf_counter()
+        application.render_frames(build_scene(mesh, arguments.entities), arguments.frames, lambda frame: checksums.append(int(frame.sum(dtype=np.uint64))))
+        elapsed = time.perf_counter() - start
+
+        reference = checksums if reference is None else reference
+        print(f"{label:>10} {len(checksums):>7} {elapsed:>9.3f} {arguments.frames / elapsed:>8.1f} {str(checksums == reference):>10}")
+
+    mesh.free()
+    application.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
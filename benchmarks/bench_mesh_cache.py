@@ -0,0 +1,44 @@
+import os
+import time
+import argparse
+import tempfile
+
+from ngen.engine.loader import Loader
+from ngen.engine.mesh_cache import MeshCache
+from ngen.engine.preferences import Preferences
+
+from .synthetic import FaceFormat, generate_grid_obj
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+def timed(callable) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = callable()
+    return time.perf_counter() - start, result
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Measure cold (parse and write cache) and warm (memory-mapped cache) mesh loads.")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = DEFAULT_SIZES)
+    arguments = parser.parse_args()
+
+    Preferences.set_mesh_cache_enabled(True)
+
+    print(f"{'faces':>12} {'vertices':>10} {'cold s':>10} {'warm s':>10} {'speedup':>8} {'cache MB':>10}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in arguments.sizes:
+            path = os.path.join(directory, f"grid_{size}.obj")
+
+            with open(path, 'wb') as file_stream:
+                file_stream.write(generate_grid_obj(size, FaceFormat.VERTEX_TEXCOORD_NORMAL))
+
+            cold, _ = timed(lambda: Loader.load_mesh_buffers(path))
+            warm, (vertex_buffer, index_buffer, _) = timed(lambda: Loader.load_mesh_buffers(path))
+            cache_size = os.path.getsize(MeshCache.get_cache_path(path)) / (1024 * 1024)
+
+            print(f"{size:>12} {vertex_buffer.shape[0]:>10} {cold:>10.3f} {warm:>10.4f} {cold / warm:>8.0f} {cache_size:>10.1f}")
+
+            del vertex_buffer, index_buffer
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+import argparse
+
+import ngen.engine
+from ngen.engine.obj_parser import ObjParser
+from ngen.graphics.mesh import Mesh
+from ngen.graphics.geometry import Geometry
+
+from .gl_stub import RecordingGL
+from .synthetic import generate_grid_obj
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+FORMATS = [
+    ("float", False, False),
+    ("float+retain", False, True),
+    ("quantized", True, False),
+    ("quantized+retain", True, True),
+]
+
+def megabytes(value: int) -> float:
+    return value / (1024 * 1024)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Report CPU and GPU memory per mesh for full-precision and compact vertex formats.")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = DEFAULT_SIZES)
+    arguments = parser.parse_args()
+
+    print(f"{'faces':>10} {'format':<18} {'full CPU MB':>12} {'CPU MB':>8} {'full GPU MB':>12} {'GPU MB':>8} {'GPU ratio':>10} {'max error':>10}")
+
+    with RecordingGL():
+        for size in arguments.sizes:
+            vertex_buffer, index_buffer, attributes = Geometry.build_indexed(*ObjParser.parse_bytes(generate_grid_obj(size)))
+
+            for name, quantized, retain_geometry in FORMATS:
+                mesh = Mesh(vertex_buffer, index_buffer, attributes, quantized, retain_geometry)
+                report = mesh.get_memory_report()
+                error = 0.0
+
+                if quantized:
+                    restored = Geometry.dequantize(*Geometry.quantize(vertex_buffer, *mesh.get_bounds()))
+                    error = float(abs(restored[:, :Geometry.OFFSET_NORMAL] - vertex_buffer[:, :Geometry.OFFSET_NORMAL]).max())
+
+                print(f"{size:>10} {name:<18} {megabytes(report['full_cpu_bytes']):>12.2f} {megabytes(report['cpu_bytes']):>8.2f} {megabytes(report['full_gpu_bytes']):>12.2f} {megabytes(report['gpu_bytes']):>8.2f} {report['gpu_bytes'] / report['full_gpu_bytes']:>10.2f} {error:>10.2e}")
+
+                mesh.free()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
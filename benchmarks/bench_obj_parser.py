@@ -0,0 +1,99 @@
+import io
+import time
+import tracemalloc
+import argparse
+
+from ngen.engine.obj_parser import ObjParser
+
+from .synthetic import FaceFormat, generate_grid_obj
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+
+def parse_legacy(file_stream) -> tuple[list, list, list, list]:
+    CHAR_FACE = 'f'
+    CHAR_VERTEX = 'v'
+    CHAR_NORMAL = 'vn'
+    CHAR_COMMENT = '#'
+    CHAR_SEPARATOR = '/'
+    CHAR_TEXCOORDS = 'vt'
+
+    INDEX_VERTEX = 0
+    INDEX_TEXCOORD = 1
+    INDEX_NORMAL = 2
+
+    faces = []
+    normals = []
+    vertices = []
+    texcoords = []
+
+    for line in file_stream:
+
+        if not line.startswith(CHAR_COMMENT):
+            values = line.split()
+
+            if values:
+                if values[0] == CHAR_VERTEX:
+                    vertices.append(list(map(float, values[1:4])))
+                elif values[0] == CHAR_NORMAL:
+                    normals.append(list(map(float, values[1:4])))
+                elif values[0] == CHAR_TEXCOORDS:
+                    texcoords.append(list(map(float, values[1:3])))
+                elif values[0] == CHAR_FACE:
+
+                    face = []
+                    norms = []
+                    texcoords_face = []
+
+                    for value in values[1:]:
+                        face_components = value.split(CHAR_SEPARATOR)
+
+                        face.append(int(face_components[INDEX_VERTEX]))
+                        norms.append((int(face_components[INDEX_NORMAL]) if len(face_components) >= 3 and face_components[INDEX_NORMAL] else 0))
+                        texcoords_face.append((int(face_components[INDEX_TEXCOORD]) if len(face_components) >= 2 and face_components[INDEX_TEXCOORD] else 0))
+
+                    faces.append((face, norms, texcoords_face))
+
+    return faces, normals, vertices, texcoords
+
+def measure(callable, repeat: int) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        callable()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+def measure_peak_memory(callable) -> float:
+    tracemalloc.start()
+    callable()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Compare the vectorized OBJ parser with the line-by-line loader.")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = DEFAULT_SIZES)
+    parser.add_argument("--repeat", type = int, default = 3)
+    parser.add_argument("--legacy-limit", type = int, default = 1_000_000, help = "skip the legacy loader above this face count")
+    arguments = parser.parse_args()
+
+    print(f"{'faces':>12} {'bytes':>14} {'legacy s':>10} {'numpy s':>10} {'speedup':>8} {'legacy MB':>10} {'numpy MB':>10}")
+
+    for size in arguments.sizes:
+        data = generate_grid_obj(size, FaceFormat.VERTEX_TEXCOORD_NORMAL)
+
+        parse_vectorized = lambda: ObjParser.parse_bytes(data)
+        parse_line_by_line = lambda: parse_legacy(io.StringIO(data.decode("ascii")))
+        run_legacy = size <= arguments.legacy_limit
+
+        vectorized = measure(parse_vectorized, arguments.repeat)
+        vectorized_memory = measure_peak_memory(parse_vectorized)
+        legacy = measure(parse_line_by_line, arguments.repeat) if run_legacy else float("nan")
+        legacy_memory = measure_peak_memory(parse_line_by_line) if run_legacy else float("nan")
+
+        print(f"{size:>12} {len(data):>14} {legacy:>10.3f} {vectorized:>10.3f} {legacy / vectorized:>8.1f} {legacy_memory:>10.1f} {vectorized_memory:>10.1f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
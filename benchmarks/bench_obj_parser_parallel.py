@@ -0,0 +1,51 @@
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+
+from ngen.engine.obj_parser import ObjParser
+
+from .synthetic import FaceFormat, generate_grid_obj
+
+DEFAULT_FACES = 4_000_000
+
+def timed(callable) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = callable()
+    return time.perf_counter() - start, result
+
+def is_identical(expected: tuple[np.ndarray, ...], actual: tuple[np.ndarray, ...]) -> bool:
+    return all(a.dtype == b.dtype and a.shape == b.shape and a.tobytes() == b.tobytes() for a, b in zip(expected, actual))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Measure chunked multi-process OBJ parsing against the single-process parser.")
+    parser.add_argument("--faces", type = int, default = DEFAULT_FACES)
+    parser.add_argument("--workers", type = int, nargs = "+", default = list(range(1, (os.cpu_count() or 1) + 1)))
+    parser.add_argument("--negative-indices", action = "store_true")
+    parser.add_argument("--repeat", type = int, default = 3)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "grid.obj")
+
+        with open(path, 'wb') as file_stream:
+            file_stream.write(generate_grid_obj(arguments.faces, FaceFormat.VERTEX_TEXCOORD_NORMAL, arguments.negative_indices))
+
+        print(f"file: {os.path.getsize(path) / (1024 * 1024):.1f} MB, {arguments.faces} faces, {os.cpu_count()} cores")
+
+        baseline_time = min(timed(lambda: ObjParser.parse(path))[0] for _ in range(arguments.repeat))
+        expected = ObjParser.parse(path)
+
+        print(f"{'workers':>8} {'chunks':>7} {'seconds':>10} {'speedup':>8} {'identical':>10}")
+        print(f"{'serial':>8} {1:>7} {baseline_time:>10.3f} {1.0:>8.2f} {'-':>10}")
+
+        for workers in arguments.workers:
+            elapsed = min(timed(lambda: ObjParser.parse_parallel(path, workers))[0] for _ in range(arguments.repeat))
+            actual = ObjParser.parse_parallel(path, workers)
+            chunks = len(ObjParser.split_chunks(path, workers))
+
+            print(f"{workers:>8} {chunks:>7} {elapsed:>10.3f} {baseline_time / elapsed:>8.2f} {str(is_identical(expected, actual)):>10}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,88 @@
+import time
+import argparse
+
+import ngen.engine
+import ngen.api.transform as transform_module
+from ngen.api import Transform, TransformStore
+
+from .synthetic import scatter_positions
+
+def measure_ns(callable, iterations: int) -> float:
+    start = time.perf_counter_ns()
+
+    for _ in range(iterations):
+        callable()
+
+    return (time.perf_counter_ns() - start) / iterations
+
+def run_frames(transforms: list[Transform], moving: list[Transform], frames: int, delta_time: float) -> float:
+    start = time.perf_counter()
+
+    for _ in range(frames):
+        for transform in moving:
+            transform.rotate(90.0 * delta_time, Transform.AXIS_Y)
+            transform.translate([0.0, 0.0, delta_time])
+
+        for transform in transforms:
+            transform.load_transformations()
+
+    return (time.perf_counter() - start) / frames
+
+def run_store_frames(store: TransformStore, frames: int, delta_time: float) -> float:
+    transforms = store.get_transforms()
+    start = time.perf_counter()
+
+    for _ in range(frames):
+        store.update(delta_time)
+
+        for transform in transforms:
+            transform.load_transformations()
+
+    return (time.perf_counter() - start) / frames
+
+def spin_and_advance(delta_time: float, positions, rotations, scales) -> None:
+    rotations[:, Transform.Y] += 90.0 * delta_time
+    positions[:, Transform.Z] += delta_time
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Microbenchmark the Transform update/render hot loop.")
+    parser.add_argument("--objects", type = int, default = 10_000)
+    parser.add_argument("--moving", type = float, nargs = "+", default = [0.0, 0.1, 1.0])
+    parser.add_argument("--frames", type = int, default = 20)
+    parser.add_argument("--iterations", type = int, default = 100_000)
+    arguments = parser.parse_args()
+
+    uploads = []
+    transform_module.glLoadMatrixf = uploads.append
+    transform_module.glMultMatrixf = uploads.append
+
+    transform = Transform([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0])
+
+    print(f"{'operation':<32} {'ns/op':>10}")
+    print(f"{'translate':<32} {measure_ns(lambda: transform.translate([0.0, 0.0, 0.001]), arguments.iterations):>10.0f}")
+    print(f"{'rotate':<32} {measure_ns(lambda: transform.rotate(0.1, Transform.AXIS_Y), arguments.iterations):>10.0f}")
+    print(f"{'rotate + load matrix':<32} {measure_ns(lambda: (transform.rotate(0.1, Transform.AXIS_Y), transform.load_transformations()), arguments.iterations):>10.0f}")
+    print(f"{'load matrix (cached)':<32} {measure_ns(transform.load_transformations, arguments.iterations):>10.0f}")
+    print(f"{'get_vector_forward (cached)':<32} {measure_ns(transform.get_vector_forward, arguments.iterations):>10.0f}")
+    print()
+
+    transforms = [Transform(list(position), [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]) for position in scatter_positions(arguments.objects, 100.0)]
+
+    print(f"{'objects':>10} {'moving':>8} {'frame ms':>10} {'uploads/frame':>14}")
+
+    for fraction in arguments.moving:
+        moving = transforms[:int(arguments.objects * fraction)]
+        uploads.clear()
+        frame = run_frames(transforms, moving, arguments.frames, 1.0 / 60.0)
+        print(f"{arguments.objects:>10} {fraction:>8.0%} {frame * 1000.0:>10.2f} {len(uploads) // arguments.frames:>14}")
+
+    store = TransformStore()
+    store.create_batch(scatter_positions(arguments.objects, 100.0), [[0.0, 0.0, 0.0]] * arguments.objects, [[1.0, 1.0, 1.0]] * arguments.objects)
+    store.add_system(spin_and_advance)
+
+    uploads.clear()
+    frame = run_store_frames(store, arguments.frames, 1.0 / 60.0)
+    print(f"{arguments.objects:>10} {'store':>8} {frame * 1000.0:>10.2f} {len(uploads) // arguments.frames:>14}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
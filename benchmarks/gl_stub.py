@@ -0,0 +1,124 @@
+import sys
+import ctypes
+import itertools
+import numpy as np
+from collections import Counter
+from OpenGL.GL import GL_FRAMEBUFFER_COMPLETE
+
+class _NullContext:
+
+    def __init__(self, *_) -> None:
+        pass
+
+    def free(self) -> None:
+        pass
+
+class _RecordedFunction:
+
+    def __init__(self, name: str, calls: Counter, log: list | None, handler) -> None:
+        self._name = name
+        self._calls = calls
+        self._log = log
+        self._handler = handler
+
+    def __call__(self, *arguments):
+        self._calls[self._name] += 1
+
+        if self._log is not None:
+            self._log.append((self._name, arguments))
+
+        return self._handler(*arguments) if self._handler is not None else None
+
+class RecordingGL:
+
+    _SHADER_FUNCTIONS = ("compileShader", "compileProgram")
+
+    def __init__(self, log_calls: bool = False) -> None:
+        self._calls = Counter()
+        self._log = [] if log_calls else None
+        self._originals = []
+        self._identifiers = itertools.count(1)
+        self._scratch = ctypes.create_string_buffer(1)
+        self._bound_texture = None
+        self._texture_sizes = {}
+
+    def get_calls(self) -> Counter:
+        return self._calls
+
+    def get_call_count(self) -> int:
+        return sum(self._calls.values())
+
+    def get_log(self) -> list[tuple[str, tuple]]:
+        return self._log if self._log is not None else []
+
+    def reset(self) -> None:
+        self._calls.clear()
+
+        if self._log is not None:
+            self._log.clear()
+
+    def __enter__(self) -> 'RecordingGL':
+        handlers = {
+            "glCheckFramebufferStatus": lambda *_: GL_FRAMEBUFFER_COMPLETE,
+            "glBufferData": self._buffer_data,
+            "glMapBuffer": lambda *_: ctypes.addressof(self._scratch),
+            "glGetBufferSubData": lambda target, offset, size: np.zeros(size, dtype=np.uint8),
+            "glBindTexture": self._bind_texture,
+            "glTexImage2D": self._tex_image_2d,
+            "glGetTexImage": self._get_tex_image,
+            "glGetUniformLocation": lambda *_: 0,
+            "glGetAttribLocation": lambda *_: 0,
+            "glGetString": lambda *_: b"RecordingGL",
+            "glInitGl30VERSION": lambda: True,
+            "glInitHalfFloatVertexARB": lambda: True,
+        }
+
+        for module_name, module in list(sys.modules.items()):
+            if module is None or not module_name.startswith("ngen"):
+                continue
+
+            for name, value in list(vars(module).items()):
+                if not callable(value) or not (name.startswith("gl") or name in RecordingGL._SHADER_FUNCTIONS):
+                    continue
+
+                if name.startswith("glGen") or name.startswith("glCreate") or name in RecordingGL._SHADER_FUNCTIONS:
+                    handler = self._generate
+                else:
+                    handler = handlers.get(name)
+
+                self._patch(module, name, _RecordedFunction(name, self._calls, self._log, handler))
+
+            if hasattr(module, "HeadlessContext"):
+                self._patch(module, "HeadlessContext", _NullContext)
+
+        return self
+
+    def __exit__(self, *_) -> None:
+        for module, name, value in reversed(self._originals):
+            setattr(module, name, value)
+
+        self._originals.clear()
+
+    def _patch(self, module: object, name: str, value: object) -> None:
+        self._originals.append((module, name, getattr(module, name)))
+        setattr(module, name, value)
+
+    def _generate(self, count: int = 1, *_) -> int | list[int]:
+        if not isinstance(count, int) or count == 1:
+            return next(self._identifiers)
+
+        return [next(self._identifiers) for _ in range(count)]
+
+    def _buffer_data(self, target: int, size: int, *_) -> None:
+        if isinstance(size, int) and size > len(self._scratch):
+            self._scratch = ctypes.create_string_buffer(size)
+
+    def _bind_texture(self, target: int, texture: int) -> None:
+        self._bound_texture = texture
+
+    def _tex_image_2d(self, target: int, level: int, internal_format: int, width: int, height: int, *_) -> None:
+        if level == 0:
+            self._texture_sizes[self._bound_texture] = width * height
+
+    def _get_tex_image(self, *_) -> np.ndarray:
+        return np.zeros(self._texture_sizes.get(self._bound_texture, 0) * 4, dtype=np.uint8)
\ No newline at end of file
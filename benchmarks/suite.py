@@ -0,0 +1,265 @@
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+import contextlib
+import numpy as np
+from PIL import Image
+from typing import Any, Callable, NamedTuple
+
+import ngen.engine
+from ngen.engine.loader import Loader
+from ngen.engine.obj_parser import ObjParser
+from ngen.engine.application import Application
+from ngen.engine.preferences import Preferences
+from ngen.graphics.mesh import Mesh
+from ngen.graphics.texture import Texture
+from ngen.graphics.texture_cache import TextureCache
+from ngen.graphics.geometry import Geometry
+from ngen.graphics.mesh_simplifier import MeshSimplifier
+from ngen.api.transform import Transform
+
+from .gl_stub import RecordingGL
+from .synthetic import FaceFormat, generate_grid_obj, scatter_positions, build_entity_scene, build_static_scene, build_textured_scene, build_occluded_scene, build_light_scene, build_chain_scene
+
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.25
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+class Scenario(NamedTuple):
+    name: str
+    unit: str
+    work: int
+    prepare: Callable[[], Any]
+    run: Callable[[Any], None]
+
+def scaled(value: int, scale: float) -> int:
+    return max(1, int(value * scale))
+
+def measure(scenario: Scenario, repeat: int) -> dict:
+    state = scenario.prepare()
+    seconds = []
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        scenario.run(state)
+        seconds.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    scenario.run(state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(seconds)
+
+    return {
+        "seconds": best,
+        "throughput": scenario.work / best,
+        "unit": scenario.unit,
+        "peak_mb": peak / (1024 * 1024),
+        **(state.get("extra", {}) if isinstance(state, dict) else {}),
+    }
+
+def create_mesh(face_count: int, retain_geometry: bool = False) -> Mesh:
+    return Mesh(*Geometry.build_indexed(*ObjParser.parse_bytes(generate_grid_obj(face_count))), False, retain_geometry)
+
+def render_scene(application: Application, build: Callable[[], Any], frames: int, recording: RecordingGL | None) -> tuple[Callable[[], dict], Callable[[dict], None]]:
+    def prepare() -> dict:
+        return {"scene": build(), "extra": {}}
+
+    def run(state: dict) -> None:
+        if recording is not None:
+            recording.reset()
+
+        application.render_frames(state["scene"], frames, lambda frame: None)
+
+        if recording is not None:
+            state["extra"]["gl_calls_per_frame"] = recording.get_call_count() / frames
+
+    return prepare, run
+
+def create_scenarios(application: Application, directory: str, scale: float, frames: int, recording: RecordingGL | None) -> list[Scenario]:
+    obj_faces = scaled(200_000, scale)
+    obj_path = os.path.join(directory, "grid.obj")
+
+    with open(obj_path, 'wb') as file_stream:
+        file_stream.write(generate_grid_obj(obj_faces, FaceFormat.VERTEX_TEXCOORD_NORMAL))
+
+    texture_size = max(4, int(1024 * scale ** 0.5))
+    texture_path = os.path.join(directory, "albedo.png")
+    texture_texels = np.random.default_rng(0).integers(0, 256, size=(texture_size, texture_size, 4), dtype=np.uint8)
+    Image.fromarray(texture_texels, "RGBA").save(texture_path)
+
+    compile_faces = scaled(200_000, scale)
+    compile_buffers = Geometry.build_indexed(*ObjParser.parse(obj_path))
+
+    lod_faces = scaled(50_000, scale)
+    lod_buffers = Geometry.build_indexed(*ObjParser.parse_bytes(generate_grid_obj(lod_faces)))
+
+    transform_count = scaled(20_000, scale)
+    small_mesh = create_mesh(200)
+    picking_mesh = create_mesh(200, True)
+    wall_mesh = create_mesh(2, True)
+    huge_mesh = create_mesh(scaled(500_000, scale))
+
+    small_count = scaled(2_000, scale)
+    textures = [Texture.from_pixels(64, 64, bytes(64 * 64 * 4)) for _ in range(scaled(64, scale))]
+    light_count = scaled(64, scale)
+    chain_count = scaled(8, scale)
+    chain_depth = 64
+
+    ray_points = np.stack(np.meshgrid(np.arange(0, Preferences.get_window_width(), 4), np.arange(0, Preferences.get_window_height(), 4)), axis=2).reshape(-1, 2).astype(np.float64)
+
+    def prepare_raycast() -> dict:
+        scene = build_entity_scene(picking_mesh, small_count, 40.0)
+        scene.raycast_screen_batch(ray_points)
+        return {"scene": scene}
+
+    def with_occlusion_culling(enabled: bool, run: Callable[[dict], None]) -> Callable[[dict], None]:
+        def run_toggled(state: dict) -> None:
+            Preferences.set_occlusion_culling_enabled(enabled)
+            run(state)
+            Preferences.set_occlusion_culling_enabled(True)
+            state["extra"]["objects_occluded"] = application.get_objects_occluded()
+
+        return run_toggled
+
+    def occlusion_scene(enabled: bool) -> tuple[Callable[[], dict], Callable[[dict], None]]:
+        prepare, run = render_scene(application, lambda: build_occluded_scene(small_mesh, wall_mesh, small_count, 40.0), frames, recording)
+        return prepare, with_occlusion_culling(enabled, run)
+
+    def prepare_transforms() -> dict:
+        return {"transforms": [Transform(position, [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]) for position in scatter_positions(transform_count, 50.0)]}
+
+    def run_transforms(state: dict) -> None:
+        for transform in state["transforms"]:
+            transform.rotate(1.0, Transform.AXIS_Y)
+            transform.translate([0.0, 0.0, 0.01])
+            transform.get_model_matrix()
+
+    return [
+        Scenario("obj_load", "faces/s", obj_faces, lambda: None, lambda _: Geometry.build_indexed(*Loader.parse_mesh(obj_path))),
+        Scenario("texture_load", "texels/s", texture_size * texture_size, lambda: None, lambda _: TextureCache.release(Loader.load_texture(texture_path))),
+        Scenario("mesh_compile", "faces/s", compile_faces, lambda: None, lambda _: Mesh(*compile_buffers).free()),
+        Scenario("lod_build", "faces/s", lod_faces, lambda: None, lambda _: MeshSimplifier.build_lod_chain(*lod_buffers[:2], Preferences.get_lod_levels(), Preferences.get_lod_reduction())),
+        Scenario("transform_math", "transforms/s", transform_count, prepare_transforms, run_transforms),
+        Scenario("raycast", "rays/s", ray_points.shape[0], prepare_raycast, lambda state: state["scene"].raycast_screen_batch(ray_points)),
+        Scenario("many_small_entities", "frames/s", frames, *render_scene(application, lambda: build_entity_scene(small_mesh, small_count, 40.0), frames, recording)),
+        Scenario("static_entities", "frames/s", frames, *render_scene(application, lambda: build_static_scene(small_mesh, small_count, 40.0), frames, recording)),
+        Scenario("many_textures", "frames/s", frames, *render_scene(application, lambda: build_textured_scene(create_mesh(200), textures, small_count, 40.0), frames, recording)),
+        Scenario("few_huge_meshes", "frames/s", frames, *render_scene(application, lambda: build_entity_scene(huge_mesh, 4, 5.0), frames, recording)),
+        Scenario("occluded_entities", "frames/s", frames, *occlusion_scene(True)),
+        Scenario("occluded_entities_unculled", "frames/s", frames, *occlusion_scene(False)),
+        Scenario("many_lights", "frames/s", frames, *render_scene(application, lambda: build_light_scene(small_mesh, small_count // 4, light_count, 40.0), frames, recording)),
+        Scenario("deep_transform_chain", "frames/s", frames, *render_scene(application, lambda: build_chain_scene(small_mesh, chain_count, chain_depth), frames, recording)),
+    ]
+
+def get_parameters(arguments: argparse.Namespace) -> dict:
+    return {"gl": arguments.gl, "scale": arguments.scale, "frames": arguments.frames}
+
+def compare_parameters(parameters: dict, baseline: dict) -> list[str]:
+    reference = baseline.get("parameters", {})
+    return [f"--{name} {value} vs baseline {reference.get(name)}" for name, value in parameters.items() if reference.get(name) != value]
+
+def compare(results: dict, baseline: dict, threshold: float, memory_threshold: float) -> list[str]:
+    regressions = []
+
+    for name, result in results.items():
+        reference = baseline["results"].get(name)
+
+        if reference is None:
+            continue
+
+        if result["seconds"] > reference["seconds"] * (1.0 + threshold):
+            regressions.append(f"{name}: {result['seconds']:.4f}s vs baseline {reference['seconds']:.4f}s")
+
+        if result["peak_mb"] > reference["peak_mb"] * (1.0 + memory_threshold) + 0.1:
+            regressions.append(f"{name}: {result['peak_mb']:.1f} MB vs baseline {reference['peak_mb']:.1f} MB")
+
+        if result.get("gl_calls_per_frame", 0.0) > reference.get("gl_calls_per_frame", float("inf")) * (1.0 + threshold):
+            regressions.append(f"{name}: {result['gl_calls_per_frame']:.0f} GL calls per frame vs baseline {reference['gl_calls_per_frame']:.0f}")
+
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Run the synthetic scene suite and compare against a stored baseline.")
+    parser.add_argument("--gl", choices = ("stub", "real"), default = "stub", help = "'real' renders through a headless context and needs PYOPENGL_PLATFORM=egl")
+    parser.add_argument("--scale", type = float, default = 1.0)
+    parser.add_argument("--frames", type = int, default = 30)
+    parser.add_argument("--repeat", type = int, default = 5)
+    parser.add_argument("--only", nargs = "+")
+    parser.add_argument("--baseline", default = DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action = "store_true")
+    parser.add_argument("--threshold", type = float, default = DEFAULT_THRESHOLD)
+    parser.add_argument("--memory-threshold", type = float, default = DEFAULT_MEMORY_THRESHOLD)
+    parser.add_argument("--output")
+    arguments = parser.parse_args()
+
+    Preferences.set_headless(True)
+    Preferences.set_window_width(320)
+    Preferences.set_window_height(180)
+    Preferences.set_mesh_cache_enabled(False)
+
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory, (RecordingGL() if arguments.gl == "stub" else contextlib.nullcontext()) as recording:
+        application = Application()
+
+        for scenario in create_scenarios(application, directory, arguments.scale, arguments.frames, recording):
+            if arguments.only and scenario.name not in arguments.only:
+                continue
+
+            results[scenario.name] = measure(scenario, arguments.repeat)
+            result = results[scenario.name]
+            gl_calls = f"{result['gl_calls_per_frame']:>10.0f}" if "gl_calls_per_frame" in result else f"{'-':>10}"
+
+            print(f"{scenario.name:<22} {result['seconds']:>9.4f}s {result['throughput']:>14,.0f} {result['unit']:<13} {result['peak_mb']:>8.1f} MB {gl_calls} gl/frame")
+
+        application.close()
+
+    report = {"parameters": get_parameters(arguments), "results": results}
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file_stream:
+            json.dump(report, file_stream, indent=2)
+
+    if arguments.save_baseline:
+        with open(arguments.baseline, 'w') as file_stream:
+            json.dump(report, file_stream, indent=2)
+
+        print(f"baseline written to {arguments.baseline}")
+        return
+
+    if not os.path.exists(arguments.baseline):
+        print(f"no baseline at {arguments.baseline}; run with --save-baseline to create one")
+        return
+
+    with open(arguments.baseline) as file_stream:
+        baseline = json.load(file_stream)
+
+    mismatches = compare_parameters(report["parameters"], baseline)
+
+    if mismatches:
+        for mismatch in mismatches:
+            print(f"MISMATCH {mismatch}")
+
+        sys.exit(f"baseline at {arguments.baseline} was recorded with different parameters; rerun with matching parameters or --save-baseline")
+
+    regressions = compare(results, baseline, arguments.threshold, arguments.memory_threshold)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    if regressions:
+        sys.exit(1)
+
+    print(f"no regressions beyond {arguments.threshold:.0%} time / {arguments.memory_threshold:.0%} memory")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,141 @@
+import numpy as np
+
+import ngen.engine
+from ngen.graphics.mesh import Mesh
+from ngen.graphics.texture import Texture
+from ngen.api.scene import Scene
+from ngen.api.entity import Entity
+from ngen.api.transform import Transform
+from ngen.api.scene_object import SceneObject
+from ngen.api.camera import CameraPerspective
+from ngen.api.light import LightPoint, LightSource
+
+class FaceFormat:
+    VERTEX = "{v}"
+    VERTEX_TEXCOORD = "{v}/{t}"
+    VERTEX_NORMAL = "{v}//{n}"
+    VERTEX_TEXCOORD_NORMAL = "{v}/{t}/{n}"
+
+def generate_grid_obj(face_count: int, face_format: str = FaceFormat.VERTEX_TEXCOORD_NORMAL, negative_indices: bool = False) -> bytes:
+    quads = max(1, -(-face_count // 2))
+    columns = max(1, int(np.sqrt(quads)))
+    rows = -(-quads // columns)
+
+    u, v = np.meshgrid(np.linspace(0.0, 1.0, columns + 1), np.linspace(0.0, 1.0, rows + 1))
+    positions = np.stack((u.ravel(), np.sin(u.ravel() * 6.0) * 0.1, v.ravel()), axis=1)
+    texcoords = np.stack((u.ravel(), v.ravel()), axis=1)
+
+    lines = [f"# synthetic grid {columns}x{rows}"]
+    lines.extend(f"v {x:.6f} {y:.6f} {z:.6f}" for x, y, z in positions)
+    lines.extend(f"vt {s:.6f} {t:.6f}" for s, t in texcoords)
+    lines.append("vn 0.000000 1.000000 0.000000")
+
+    vertex_count = len(positions)
+    row_stride = columns + 1
+    emitted = 0
+
+    for quad in range(quads):
+        row, column = divmod(quad, columns)
+        a = row * row_stride + column + 1
+        corners = ((a, a + row_stride, a + 1), (a + 1, a + row_stride, a + row_stride + 1))
+
+        for triangle in corners:
+            if emitted == face_count:
+                break
+
+            if negative_indices:
+                lines.append("f " + " ".join(face_format.format(v = index - vertex_count - 1, t = index - vertex_count - 1, n = -1) for index in triangle))
+            else:
+                lines.append("f " + " ".join(face_format.format(v = index, t = index, n = 1) for index in triangle))
+
+            emitted += 1
+
+    lines.append("")
+    return "\n".join(lines).encode("ascii")
+
+class SyntheticMesh:
+
+    def __init__(self, bounds_min: list[float] = (-0.5, -0.5, -0.5), bounds_max: list[float] = (0.5, 0.5, 0.5)) -> None:
+        self._bounds_min = np.asarray(bounds_min, dtype=np.float32)
+        self._bounds_max = np.asarray(bounds_max, dtype=np.float32)
+
+    def get_bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        return self._bounds_min, self._bounds_max
+
+    def get_bounding_sphere(self) -> tuple[np.ndarray, float]:
+        return (self._bounds_min + self._bounds_max) * 0.5, float(np.linalg.norm(self._bounds_max - self._bounds_min) * 0.5)
+
+    def free(self) -> None:
+        pass
+
+class SyntheticTexture:
+
+    def __init__(self, texture_id: int = 1) -> None:
+        self._texture_id = texture_id
+
+    def get_id(self) -> int:
+        return self._texture_id
+
+    def get_size_bytes(self) -> int:
+        return 0
+
+    def free(self) -> None:
+        pass
+
+def scatter_positions(count: int, extent: float, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).uniform(-extent, extent, size=(count, 3))
+
+def spin(scene_object: SceneObject, delta_time: float) -> None:
+    scene_object.get_transform().rotate(delta_time * 45.0, [0.0, 1.0, 0.0])
+
+def create_camera() -> CameraPerspective:
+    return CameraPerspective(Transform([0.0, 0.0, -60.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), 60.0, 0.1, 500.0)
+
+def build_entity_scene(mesh: Mesh, count: int, extent: float, seed: int = 0) -> Scene:
+    entities = [Entity(Transform(position, [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), mesh, None, None, spin) for position in scatter_positions(count, extent, seed)]
+    return Scene([0.1, 0.1, 0.1, 1.0], create_camera(), *entities)
+
+def build_static_scene(mesh: Mesh, count: int, extent: float, seed: int = 0) -> Scene:
+    entities = [Entity(Transform(position, [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), mesh) for position in scatter_positions(count, extent, seed)]
+
+    for entity in entities:
+        entity.set_is_static(True)
+
+    return Scene([0.1, 0.1, 0.1, 1.0], create_camera(), *entities)
+
+def build_textured_scene(mesh: Mesh, textures: list[Texture], count: int, extent: float, seed: int = 0) -> Scene:
+    entities = [Entity(Transform(position, [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), mesh, textures[index % len(textures)], None, spin) for index, position in enumerate(scatter_positions(count, extent, seed))]
+    return Scene([0.1, 0.1, 0.1, 1.0], create_camera(), *entities)
+
+def build_occluded_scene(mesh: Mesh, wall_mesh: Mesh, count: int, extent: float, seed: int = 0) -> Scene:
+    scene = build_entity_scene(mesh, count, extent, seed)
+
+    wall = Entity(Transform([-extent, -extent, -extent - 5.0], [-90.0, 0.0, 0.0], [extent * 2.0, extent * 2.0, extent * 2.0]), wall_mesh)
+    wall.set_is_occluder(True)
+    scene.instantiate(wall)
+
+    return scene
+
+def build_light_scene(mesh: Mesh, entity_count: int, light_count: int, extent: float, seed: int = 0) -> Scene:
+    scene = build_entity_scene(mesh, entity_count, extent, seed)
+    sources = list(LightSource)
+
+    for index, position in enumerate(scatter_positions(light_count, extent, seed + 1)):
+        scene.instantiate(LightPoint(Transform(position, [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), sources[index % len(sources)], [1.0, 1.0, 1.0, 1.0], 0.05, 1.0, 0.0, None, spin))
+
+    return scene
+
+def build_chain_scene(mesh: Mesh, chain_count: int, depth: int, seed: int = 0) -> Scene:
+    entities = []
+
+    for root_position in scatter_positions(chain_count, 20.0, seed):
+        parent = Entity(Transform(root_position, [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), mesh, None, None, spin)
+        entities.append(parent)
+
+        for _ in range(depth - 1):
+            child = Entity(Transform([0.0, 0.5, 0.0], [0.0, 5.0, 0.0], [0.99, 0.99, 0.99]), mesh)
+            child.set_parent(parent)
+            entities.append(child)
+            parent = child
+
+    return Scene([0.1, 0.1, 0.1, 1.0], create_camera(), *entities)
\ No newline at end of file
@@ -1,6 +1,9 @@
 from .scene import Scene
 from .entity import Entity
+from .raycast_hit import RaycastHit
+from .instanced_entity import InstancedEntity
 from .transform import Transform
+from .transform_store import TransformStore
 from .scene_object import SceneObject
 from .camera import CameraPerspective, CameraOrthographic
 from .light import LightSource, LightDirectional, LightPoint, LightSpot
\ No newline at end of file
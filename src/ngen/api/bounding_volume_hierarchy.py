@@ -0,0 +1,199 @@
+import numpy as np
+
+from .frustum import Frustum
+from ..graphics.geometry import Geometry
+
+class BoundingVolumeHierarchy:
+
+    _LEAF_SIZE = 32
+
+    def __init__(self, bounds_min: np.ndarray, bounds_max: np.ndarray, leaf_size: int = _LEAF_SIZE) -> None:
+        self._leaf_size = leaf_size
+        self._item_min = np.array(bounds_min, dtype=np.float32).reshape(-1, 3)
+        self._item_max = np.array(bounds_max, dtype=np.float32).reshape(-1, 3)
+        self._order = np.arange(self._item_min.shape[0])
+        self._leaf_of_item = np.zeros(self._item_min.shape[0], dtype=np.int64)
+
+        self._node_min = []
+        self._node_max = []
+        self._node_left = []
+        self._node_right = []
+        self._node_start = []
+        self._node_count = []
+        self._node_parent = []
+
+        if self._item_min.shape[0] > 0:
+            self._build_node(0, self._item_min.shape[0], -1, (self._item_min + self._item_max) * 0.5)
+
+        self._node_min = np.array(self._node_min, dtype=np.float32).reshape(-1, 3)
+        self._node_max = np.array(self._node_max, dtype=np.float32).reshape(-1, 3)
+        self._node_left = np.array(self._node_left, dtype=np.int64)
+        self._node_right = np.array(self._node_right, dtype=np.int64)
+        self._node_start = np.array(self._node_start, dtype=np.int64)
+        self._node_count = np.array(self._node_count, dtype=np.int64)
+        self._node_parent = np.array(self._node_parent, dtype=np.int64)
+
+    def get_item_count(self) -> int:
+        return self._item_min.shape[0]
+
+    def get_node_count(self) -> int:
+        return self._node_parent.size
+
+    def get_bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        return self._item_min, self._item_max
+
+    def refit(self, items: np.ndarray, bounds_min: np.ndarray, bounds_max: np.ndarray) -> None:
+        if items.size == 0:
+            return
+
+        self._item_min[items] = bounds_min
+        self._item_max[items] = bounds_max
+
+        leaves = np.unique(self._leaf_of_item[items])
+        ordered = self._gather_ranges(leaves)
+        offsets = np.concatenate(([0], np.cumsum(self._node_count[leaves])[:-1]))
+
+        self._node_min[leaves] = np.minimum.reduceat(self._item_min[ordered], offsets)
+        self._node_max[leaves] = np.maximum.reduceat(self._item_max[ordered], offsets)
+
+        nodes = np.unique(self._node_parent[leaves])
+        nodes = nodes[nodes >= 0]
+
+        while nodes.size:
+            self._node_min[nodes] = np.minimum(self._node_min[self._node_left[nodes]], self._node_min[self._node_right[nodes]])
+            self._node_max[nodes] = np.maximum(self._node_max[self._node_left[nodes]], self._node_max[self._node_right[nodes]])
+
+            nodes = np.unique(self._node_parent[nodes])
+            nodes = nodes[nodes >= 0]
+
+    def query(self, frustum: Frustum) -> np.ndarray:
+        if self._node_parent.size == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        visible = []
+        frontier = np.zeros(1, dtype=np.int64)
+
+        while frontier.size:
+            classes = frustum.classify_aabbs(self._node_min[frontier], self._node_max[frontier])
+
+            visible.append(self._gather_ranges(frontier[classes == Frustum.INSIDE]))
+
+            crossing = frontier[classes == Frustum.INTERSECTING]
+            is_leaf = self._node_left[crossing] < 0
+
+            candidates = self._gather_ranges(crossing[is_leaf])
+            visible.append(candidates[frustum.intersects_aabbs(self._item_min[candidates], self._item_max[candidates])])
+
+            internal = crossing[~is_leaf]
+            frontier = np.concatenate((self._node_left[internal], self._node_right[internal]))
+
+        return np.concatenate(visible)
+
+    def query_overlaps(self, bounds_min: np.ndarray, bounds_max: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if self._node_parent.size == 0 or len(bounds_min) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        bounds_min = np.asarray(bounds_min, dtype=np.float32).reshape(-1, 3)
+        bounds_max = np.asarray(bounds_max, dtype=np.float32).reshape(-1, 3)
+
+        query_indices = []
+        item_indices = []
+        queries = np.arange(bounds_min.shape[0])
+        nodes = np.zeros(bounds_min.shape[0], dtype=np.int64)
+
+        while nodes.size:
+            overlapping = BoundingVolumeHierarchy._overlaps(self._node_min[nodes], self._node_max[nodes], bounds_min[queries], bounds_max[queries])
+            queries, nodes = queries[overlapping], nodes[overlapping]
+
+            is_leaf = self._node_left[nodes] < 0
+            leaves = nodes[is_leaf]
+
+            items = self._gather_ranges(leaves)
+            item_queries = np.repeat(queries[is_leaf], self._node_count[leaves])
+            overlapping = BoundingVolumeHierarchy._overlaps(self._item_min[items], self._item_max[items], bounds_min[item_queries], bounds_max[item_queries])
+
+            query_indices.append(item_queries[overlapping])
+            item_indices.append(items[overlapping])
+
+            internal = nodes[~is_leaf]
+            queries = np.tile(queries[~is_leaf], 2)
+            nodes = np.concatenate((self._node_left[internal], self._node_right[internal]))
+
+        return np.concatenate(query_indices), np.concatenate(item_indices)
+
+    def query_rays(self, origins: np.ndarray, directions: np.ndarray, max_distance: float) -> tuple[np.ndarray, np.ndarray]:
+        if self._node_parent.size == 0 or len(origins) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+
+        with np.errstate(divide='ignore'):
+            inverse_directions = 1.0 / np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+
+        ray_indices = []
+        item_indices = []
+        rays = np.arange(origins.shape[0])
+        nodes = np.zeros(origins.shape[0], dtype=np.int64)
+
+        while nodes.size:
+            entry, exit = Geometry.intersect_rays_aabbs(origins[rays], inverse_directions[rays], self._node_min[nodes], self._node_max[nodes])
+            is_hit = (entry <= exit) & (exit >= 0.0) & (entry <= max_distance)
+            rays, nodes = rays[is_hit], nodes[is_hit]
+
+            is_leaf = self._node_left[nodes] < 0
+            leaves = nodes[is_leaf]
+
+            items = self._gather_ranges(leaves)
+            item_rays = np.repeat(rays[is_leaf], self._node_count[leaves])
+            entry, exit = Geometry.intersect_rays_aabbs(origins[item_rays], inverse_directions[item_rays], self._item_min[items], self._item_max[items])
+            is_hit = (entry <= exit) & (exit >= 0.0) & (entry <= max_distance)
+
+            ray_indices.append(item_rays[is_hit])
+            item_indices.append(items[is_hit])
+
+            internal = nodes[~is_leaf]
+            rays = np.tile(rays[~is_leaf], 2)
+            nodes = np.concatenate((self._node_left[internal], self._node_right[internal]))
+
+        return np.concatenate(ray_indices), np.concatenate(item_indices)
+
+    @staticmethod
+    def _overlaps(first_min: np.ndarray, first_max: np.ndarray, second_min: np.ndarray, second_max: np.ndarray) -> np.ndarray:
+        return (first_min <= second_max).all(axis=1) & (first_max >= second_min).all(axis=1)
+
+    def _gather_ranges(self, nodes: np.ndarray) -> np.ndarray:
+        counts = self._node_count[nodes]
+        total = int(counts.sum())
+
+        if total == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        shifts = self._node_start[nodes] - (np.cumsum(counts) - counts)
+        return self._order[np.repeat(shifts, counts) + np.arange(total)]
+
+    def _build_node(self, start: int, stop: int, parent: int, centers: np.ndarray) -> int:
+        index = len(self._node_parent)
+        items = self._order[start:stop]
+
+        self._node_min.append(self._item_min[items].min(axis=0))
+        self._node_max.append(self._item_max[items].max(axis=0))
+        self._node_start.append(start)
+        self._node_count.append(stop - start)
+        self._node_parent.append(parent)
+        self._node_left.append(-1)
+        self._node_right.append(-1)
+
+        if stop - start <= self._leaf_size:
+            self._leaf_of_item[items] = index
+            return index
+
+        item_centers = centers[items]
+        axis = int(np.argmax(item_centers.max(axis=0) - item_centers.min(axis=0)))
+        middle = (start + stop) // 2
+
+        self._order[start:stop] = items[np.argpartition(item_centers[:, axis], middle - start)]
+
+        self._node_left[index] = self._build_node(start, middle, index, centers)
+        self._node_right[index] = self._build_node(middle, stop, index, centers)
+
+        return index
\ No newline at end of file
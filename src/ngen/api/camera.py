@@ -1,7 +1,11 @@
+import math
+import numpy as np
+from abc import abstractmethod
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from typing import Callable
 
+from .frustum import Frustum
 from .transform import Transform
 from .scene_object import SceneObject
 from ..engine.preferences import Preferences
@@ -14,6 +18,40 @@ class Camera(SceneObject):
         self._clipping_plane_near = clipping_plane_near
         self._camera_render_delegate = render_delegate
 
+    @abstractmethod
+    def get_frustum(self) -> Frustum:
+        pass
+
+    @abstractmethod
+    def get_screen_sizes(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def get_rays(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        pass
+
+    @abstractmethod
+    def get_projection_matrix(self) -> np.ndarray:
+        pass
+
+    def get_view_matrix(self) -> np.ndarray:
+        eye, forward, up, right = Frustum._get_basis(self._transform.get_position(), self._transform.get_vector_forward(), self._transform.get_vector_up())
+
+        view = np.identity(4)
+        view[0, :3], view[0, 3] = right, -(right @ eye)
+        view[1, :3], view[1, 3] = up, -(up @ eye)
+        view[2, :3], view[2, 3] = -forward, forward @ eye
+
+        return view
+
+    def get_view_projection_matrix(self) -> np.ndarray:
+        return self.get_projection_matrix() @ self.get_view_matrix()
+
+    @staticmethod
+    def _get_screen_offsets(points: np.ndarray) -> np.ndarray:
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return np.stack(((points[:, 0] + 0.5) / Preferences.get_window_width() * 2.0 - 1.0, 1.0 - (points[:, 1] + 0.5) / Preferences.get_window_height() * 2.0), axis=1)
+
     def _render(self) -> None:
         glMatrixMode(GL_PROJECTION)
         glLoadIdentity()
@@ -32,6 +70,38 @@ class CameraPerspective(Camera):
     def set_fov(self, value: float) -> None:
         self._fov = value
 
+    def get_frustum(self) -> Frustum:
+        return Frustum.from_perspective(self._transform.get_position(), self._transform.get_vector_forward(), self._transform.get_vector_up(), self._fov, Preferences.get_aspect_ratio(), self._clipping_plane_near, self._clipping_plane_far)
+
+    def get_screen_sizes(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        distances = np.linalg.norm(centers - self._transform.get_position(), axis=1)
+        return radii / (np.maximum(distances, self._clipping_plane_near) * math.tan(math.radians(self._fov) / 2.0))
+
+    def get_rays(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        eye, forward, up, right = Frustum._get_basis(self._transform.get_position(), self._transform.get_vector_forward(), self._transform.get_vector_up())
+        offsets = Camera._get_screen_offsets(points)
+
+        HALF_HEIGHT = math.tan(math.radians(self._fov) / 2.0)
+        HALF_WIDTH = HALF_HEIGHT * Preferences.get_aspect_ratio()
+
+        directions = forward + offsets[:, 0:1] * HALF_WIDTH * right + offsets[:, 1:2] * HALF_HEIGHT * up
+        directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+
+        return np.repeat(eye[np.newaxis], offsets.shape[0], axis=0), directions
+
+    def get_projection_matrix(self) -> np.ndarray:
+        FOCAL_LENGTH = 1.0 / math.tan(math.radians(self._fov) / 2.0)
+        NEAR, FAR = self._clipping_plane_near, self._clipping_plane_far
+
+        projection = np.zeros((4, 4))
+        projection[0, 0] = FOCAL_LENGTH / Preferences.get_aspect_ratio()
+        projection[1, 1] = FOCAL_LENGTH
+        projection[2, 2] = (FAR + NEAR) / (NEAR - FAR)
+        projection[2, 3] = 2.0 * FAR * NEAR / (NEAR - FAR)
+        projection[3, 2] = -1.0
+
+        return projection
+
     def _render_perspective_camera(self) -> None:
         gluPerspective(self._fov, Preferences.get_aspect_ratio(), self._clipping_plane_near, self._clipping_plane_far)
 
@@ -40,6 +110,30 @@ class CameraOrthographic(Camera):
     def __init__(self, transform: Transform, clipping_plane_near: float, clipping_plane_far: float, start_delegate: Callable[['CameraOrthographic'], None] = None, *update_delegates: Callable[['CameraOrthographic', float], None]) -> None:
         super().__init__(transform, clipping_plane_near, clipping_plane_far, self._render_orthographic_camera, start_delegate, *update_delegates)
 
+    def get_frustum(self) -> Frustum:
+        return Frustum.from_orthographic(self._transform.get_position(), self._transform.get_vector_forward(), self._transform.get_vector_up(), Preferences.get_window_width() / 2.0, Preferences.get_window_height() / 2.0, self._clipping_plane_near, self._clipping_plane_far)
+
+    def get_screen_sizes(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        return radii / (Preferences.get_window_height() / 2.0)
+
+    def get_rays(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        eye, forward, up, right = Frustum._get_basis(self._transform.get_position(), self._transform.get_vector_forward(), self._transform.get_vector_up())
+        offsets = Camera._get_screen_offsets(points)
+
+        origins = eye + offsets[:, 0:1] * (Preferences.get_window_width() / 2.0) * right + offsets[:, 1:2] * (Preferences.get_window_height() / 2.0) * up
+        return origins, np.repeat(forward[np.newaxis], offsets.shape[0], axis=0)
+
+    def get_projection_matrix(self) -> np.ndarray:
+        NEAR, FAR = self._clipping_plane_near, self._clipping_plane_far
+
+        projection = np.identity(4)
+        projection[0, 0] = 2.0 / Preferences.get_window_width()
+        projection[1, 1] = 2.0 / Preferences.get_window_height()
+        projection[2, 2] = -2.0 / (FAR - NEAR)
+        projection[2, 3] = -(FAR + NEAR) / (FAR - NEAR)
+
+        return projection
+
     def _render_orthographic_camera(self) -> None:
         VIEWPORT_CENTER_WIDTH = Preferences.get_window_width() / 2.0
         VIEWPORT_CENTER_HEIGHT = Preferences.get_window_height() / 2.0
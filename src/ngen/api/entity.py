@@ -4,27 +4,161 @@ from typing import Callable
 from ..graphics.mesh import Mesh
 from .transform import Transform
 from .scene_object import SceneObject
-from ..graphics.texture import Texture, StandardTextures
+from ..graphics.texture import Texture
+from ..graphics.material import Material
+from ..graphics.texture_cache import TextureCache
+from ..engine.light_manager import LightManager
+from ..engine.asset_request import AssetRequest
 
 class Entity(SceneObject):
 
+    _mesh_version = 0
+    _occluder_version = 0
+
     def __init__(self, transform: Transform, mesh: Mesh, texture_albedo: Texture = None, start_delegate: Callable[['Entity'], None] = None, *update_delegates: Callable[['Entity', float], None]) -> None:
         super().__init__(transform, self._render, start_delegate, *update_delegates)
         self._mesh = mesh
-        self._texture_albedo = texture_albedo if texture_albedo is not None else Texture(StandardTextures.MISSING_ALBEDO.value)
+        self._lod_level = 0
+        self._texture_variant = 0
+        self._texture_albedo = TextureCache.retain(texture_albedo) if texture_albedo is not None else TextureCache.get_missing_albedo()
+        self._material = None
+        self._polygon_mode = GL_FILL
+        self._is_transparent = False
+        self._is_static = False
+        self._is_batched = False
+        self._is_occluder = False
+        self._mesh_request = None
+        self._texture_albedo_request = None
 
     def get_mesh(self) -> Mesh:
         return self._mesh
 
+    def set_mesh(self, value: Mesh) -> None:
+        self._mesh = value
+        self._lod_level = 0
+        self._texture_variant = 0
+        Entity._mesh_version += 1
+
+    def get_mesh_request(self) -> AssetRequest | None:
+        return self._mesh_request
+
+    def set_mesh_request(self, request: AssetRequest | None) -> None:
+        self._mesh_request = request
+
+        if request is not None:
+            request.add_done_callback(lambda mesh: self._apply_mesh_request(request, mesh))
+
+    def get_lod_level(self) -> int:
+        return self._lod_level
+
+    def set_lod_level(self, value: int) -> None:
+        self._lod_level = value
+
+    def get_lod_mesh(self) -> Mesh:
+        return self._mesh.get_lod(self._lod_level)
+
+    def get_texture_variant(self) -> int:
+        return self._texture_variant
+
+    def set_texture_variant(self, value: int) -> None:
+        self._texture_variant = value
+
+    def get_texture_albedo(self) -> Texture:
+        return self._texture_albedo
+
+    def set_texture_albedo(self, value: Texture) -> None:
+        previous = self._texture_albedo
+        self._texture_albedo = TextureCache.retain(value) if value is not None else TextureCache.get_missing_albedo()
+        TextureCache.release(previous)
+
+    def get_texture_albedo_request(self) -> AssetRequest | None:
+        return self._texture_albedo_request
+
+    def set_texture_albedo_request(self, request: AssetRequest | None) -> None:
+        self._texture_albedo_request = request
+
+        if request is not None:
+            request.add_done_callback(lambda texture: self._apply_texture_albedo_request(request, texture))
+
+    def get_material(self) -> Material | None:
+        return self._material
+
+    def set_material(self, value: Material | None) -> None:
+        self._material = value
+
+    def get_polygon_mode(self) -> int:
+        return self._polygon_mode
+
+    def set_polygon_mode(self, value: int) -> None:
+        self._polygon_mode = value
+
+    def get_is_transparent(self) -> bool:
+        return self._is_transparent
+
+    def set_is_transparent(self, value: bool) -> None:
+        self._is_transparent = value
+
+    def get_is_static(self) -> bool:
+        return self._is_static
+
+    def set_is_static(self, value: bool) -> None:
+        self._is_static = value
+
+    def get_is_batched(self) -> bool:
+        return self._is_batched
+
+    def set_is_batched(self, value: bool) -> None:
+        self._is_batched = value
+
+    def get_is_occluder(self) -> bool:
+        return self._is_occluder
+
+    def set_is_occluder(self, value: bool) -> None:
+        self._is_occluder = value
+        Entity._occluder_version += 1
+
+    def submit(self, render_queue: 'RenderQueue') -> None:
+        if self._is_active and self._mesh is not None and not self._is_batched:
+            render_queue.submit(self)
+
+    @staticmethod
+    def get_mesh_version() -> int:
+        return Entity._mesh_version
+
+    @staticmethod
+    def get_occluder_version() -> int:
+        return Entity._occluder_version
+
+    def _apply_mesh_request(self, request: AssetRequest, mesh: Mesh) -> None:
+        if request is not self._mesh_request:
+            mesh.free()
+            return
+
+        self._mesh_request = None
+        self.set_mesh(mesh)
+
+    def _apply_texture_albedo_request(self, request: AssetRequest, texture: Texture) -> None:
+        if request is not self._texture_albedo_request:
+            TextureCache.release(texture)
+            return
+
+        self._texture_albedo_request = None
+        previous = self._texture_albedo
+        self._texture_albedo = texture
+        TextureCache.release(previous)
+
     def _render(self) -> None:
+        if self._mesh is None:
+            return
+
         glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
 
-        glPolygonMode(GL_FRONT, GL_FILL)
+        glPolygonMode(GL_FRONT, self._polygon_mode)
 
         glBindTexture(GL_TEXTURE_2D, self._texture_albedo.get_id())
 
-        self._transform.apply_transformations()
-        self._mesh.build()
+        LightManager.bind(self)
+        self._transform.load_transformations()
+        self.get_lod_mesh().build(self._texture_variant)
 
         glBindTexture(GL_TEXTURE_2D, 0)
\ No newline at end of file
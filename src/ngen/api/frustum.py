@@ -0,0 +1,84 @@
+import math
+import numpy as np
+
+class Frustum:
+
+    OUTSIDE = 0
+    INTERSECTING = 1
+    INSIDE = 2
+
+    def __init__(self, planes: np.ndarray) -> None:
+        self._planes = planes
+        self._normals = planes[:, :3]
+        self._distances = planes[:, 3]
+
+    def get_planes(self) -> np.ndarray:
+        return self._planes
+
+    def classify_aabbs(self, bounds_min: np.ndarray, bounds_max: np.ndarray) -> np.ndarray:
+        centers = (bounds_min + bounds_max) * 0.5
+        extents = (bounds_max - bounds_min) * 0.5
+
+        center_distances = centers @ self._normals.T + self._distances
+        radii = extents @ np.abs(self._normals).T
+
+        result = np.full(centers.shape[0], Frustum.INTERSECTING, dtype=np.int8)
+        result[(center_distances - radii >= 0.0).all(axis=1)] = Frustum.INSIDE
+        result[(center_distances + radii < 0.0).any(axis=1)] = Frustum.OUTSIDE
+
+        return result
+
+    def intersects_aabbs(self, bounds_min: np.ndarray, bounds_max: np.ndarray) -> np.ndarray:
+        centers = (bounds_min + bounds_max) * 0.5
+        extents = (bounds_max - bounds_min) * 0.5
+        return ((centers @ self._normals.T + self._distances + extents @ np.abs(self._normals).T) >= 0.0).all(axis=1)
+
+    def intersects_spheres(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        return ((centers @ self._normals.T + self._distances) >= -radii[:, np.newaxis]).all(axis=1)
+
+    @staticmethod
+    def from_perspective(position: list[float], forward: list[float], up: list[float], fov: float, aspect_ratio: float, clipping_plane_near: float, clipping_plane_far: float) -> 'Frustum':
+        eye, forward, up, right = Frustum._get_basis(position, forward, up)
+
+        HALF_HEIGHT = math.tan(math.radians(fov) / 2.0)
+        HALF_WIDTH = HALF_HEIGHT * aspect_ratio
+
+        normals = np.array([
+            right + forward * HALF_WIDTH,
+            -right + forward * HALF_WIDTH,
+            up + forward * HALF_HEIGHT,
+            -up + forward * HALF_HEIGHT,
+        ])
+        normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+
+        planes = np.empty((6, 4))
+        planes[:4, :3] = normals
+        planes[:4, 3] = -(normals @ eye)
+        planes[4] = [*forward, -(forward @ eye) - clipping_plane_near]
+        planes[5] = [*-forward, (forward @ eye) + clipping_plane_far]
+
+        return Frustum(planes)
+
+    @staticmethod
+    def from_orthographic(position: list[float], forward: list[float], up: list[float], half_width: float, half_height: float, clipping_plane_near: float, clipping_plane_far: float) -> 'Frustum':
+        eye, forward, up, right = Frustum._get_basis(position, forward, up)
+
+        planes = np.array([
+            [*right, -(right @ eye) + half_width],
+            [*-right, (right @ eye) + half_width],
+            [*up, -(up @ eye) + half_height],
+            [*-up, (up @ eye) + half_height],
+            [*forward, -(forward @ eye) - clipping_plane_near],
+            [*-forward, (forward @ eye) + clipping_plane_far],
+        ])
+
+        return Frustum(planes)
+
+    @staticmethod
+    def _get_basis(position: list[float], forward: list[float], up: list[float]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        eye = np.asarray(position, dtype=np.float64)
+        forward = np.asarray(forward, dtype=np.float64)
+        forward = forward / np.linalg.norm(forward)
+        right = np.cross(forward, np.asarray(up, dtype=np.float64))
+        right = right / np.linalg.norm(right)
+        return eye, forward, np.cross(right, forward), right
\ No newline at end of file
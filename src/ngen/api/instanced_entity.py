@@ -0,0 +1,250 @@
+import ctypes
+import numpy as np
+from OpenGL.GL import *
+from typing import Callable
+
+from ..graphics.mesh import Mesh
+from .transform import Transform
+from .scene_object import SceneObject
+from ..graphics.shader import Shader
+from ..graphics.texture import Texture
+from ..graphics.texture_cache import TextureCache
+from ..engine.light_manager import LightManager
+
+class InstancedEntity(SceneObject):
+
+    _MATRIX_COLUMNS = 4
+    _INITIAL_CAPACITY = 64
+    _MATRIX_SIZE = 16 * np.dtype(np.float32).itemsize
+    _COLUMN_SIZE = 4 * np.dtype(np.float32).itemsize
+
+    _VERTEX_SHADER = """#version 120
+
+        attribute mat4 instance_model;
+
+        uniform vec4 lights[64];
+        uniform int light_count;
+        uniform vec4 dequantization;
+
+        varying vec4 color;
+        varying vec2 texcoord;
+
+        void main() {
+            vec4 position = gl_ModelViewMatrix * instance_model * vec4(dequantization.xyz + gl_Vertex.xyz * dequantization.w, 1.0);
+            vec3 normal = normalize(gl_NormalMatrix * (mat3(instance_model) * gl_Normal));
+            vec4 lighting = gl_LightModel.ambient;
+
+            for (int i = 0; i < 16; i++) {
+                if (i < light_count) {
+                    vec4 light_position = lights[i * 4];
+                    vec4 attenuation_factors = lights[i * 4 + 2];
+                    vec4 spot = lights[i * 4 + 3];
+
+                    vec3 direction = light_position.xyz - position.xyz * light_position.w;
+                    float distance = length(direction);
+                    float attenuation = 1.0;
+                    direction /= max(distance, 0.000001);
+
+                    if (light_position.w != 0.0) {
+                        attenuation /= attenuation_factors.x + attenuation_factors.y * distance + attenuation_factors.z * distance * distance;
+
+                        if (spot.w > -1.5) {
+                            float cosine = dot(-direction, normalize(spot.xyz));
+                            attenuation *= cosine >= spot.w ? pow(max(cosine, 0.0), attenuation_factors.w) : 0.0;
+                        }
+                    }
+
+                    lighting += attenuation * lights[i * 4 + 1] * (1.0 + max(dot(normal, direction), 0.0));
+                }
+            }
+
+            color = gl_Color * lighting;
+            texcoord = gl_MultiTexCoord0.xy;
+            gl_Position = gl_ProjectionMatrix * position;
+        }
+    """
+
+    _FRAGMENT_SHADER = """#version 120
+
+        uniform sampler2D albedo;
+
+        varying vec4 color;
+        varying vec2 texcoord;
+
+        void main() {
+            gl_FragColor = texture2D(albedo, texcoord) * color;
+        }
+    """
+
+    _shader = None
+    _light_revision = -1
+    _is_instancing_supported = None
+
+    def __init__(self, transform: Transform, mesh: Mesh, texture_albedo: Texture = None, start_delegate: Callable[['InstancedEntity'], None] = None, *update_delegates: Callable[['InstancedEntity', float], None]) -> None:
+        super().__init__(transform, self._render, start_delegate, *update_delegates)
+        self._mesh = mesh
+        self._texture_albedo = TextureCache.retain(texture_albedo) if texture_albedo is not None else TextureCache.get_missing_albedo()
+
+        self._instances = []
+        self._instance_buffer = None
+        self._instance_buffer_capacity = 0
+        self._matrices = np.zeros((InstancedEntity._INITIAL_CAPACITY, InstancedEntity._MATRIX_COLUMNS, InstancedEntity._MATRIX_COLUMNS), dtype=np.float32)
+        self._revisions = np.full(InstancedEntity._INITIAL_CAPACITY, -1, dtype=np.int64)
+
+    def get_mesh(self) -> Mesh:
+        return self._mesh
+
+    def get_texture_albedo(self) -> Texture:
+        return self._texture_albedo
+
+    def get_instances(self) -> list[Transform]:
+        return self._instances
+
+    def get_instance_count(self) -> int:
+        return len(self._instances)
+
+    def add_instance(self, transform: Transform) -> int:
+        index = len(self._instances)
+
+        if index == self._matrices.shape[0]:
+            self._matrices = np.concatenate((self._matrices, np.zeros_like(self._matrices)))
+            self._revisions = np.concatenate((self._revisions, np.full_like(self._revisions, -1)))
+
+        self._instances.append(transform)
+        self._revisions[index] = -1
+        return index
+
+    def remove_instance(self, index: int) -> None:
+        last = len(self._instances) - 1
+        self._instances[index] = self._instances[last]
+        self._revisions[index] = -1
+        self._instances.pop()
+
+    def free(self) -> None:
+        if self._instance_buffer is not None:
+            glDeleteBuffers(1, [self._instance_buffer])
+            self._instance_buffer = None
+            self._instance_buffer_capacity = 0
+
+    def _update_matrices(self) -> tuple[int, int] | None:
+        COUNT = len(self._instances)
+        revisions = np.fromiter((instance.get_revision() for instance in self._instances), dtype=np.int64, count=COUNT)
+        changed = np.flatnonzero(revisions != self._revisions[:COUNT])
+
+        if changed.size == 0:
+            return None
+
+        instances = [self._instances[index] for index in changed]
+        positions = np.array([instance.get_position() for instance in instances], dtype=np.float64)
+        rotations = np.array([instance.get_rotation() for instance in instances], dtype=np.float64)
+        scales = np.array([instance.get_scale() for instance in instances], dtype=np.float64)
+
+        self._matrices[changed] = Transform.compose_matrices(positions, rotations, scales).transpose(0, 2, 1)
+        self._revisions[changed] = revisions[changed]
+
+        return int(changed[0]), int(changed[-1]) + 1
+
+    def _render(self) -> None:
+        changed_range = self._update_matrices()
+
+        if not self._instances:
+            return
+
+        glMatrixMode(GL_MODELVIEW)
+
+        glPolygonMode(GL_FRONT, GL_FILL)
+
+        glBindTexture(GL_TEXTURE_2D, self._texture_albedo.get_id())
+
+        self._transform.load_transformations()
+
+        if InstancedEntity._supports_instancing():
+            self._render_instanced(changed_range)
+        else:
+            self._render_batched()
+
+        glBindTexture(GL_TEXTURE_2D, 0)
+
+    def _render_instanced(self, changed_range: tuple[int, int] | None) -> None:
+        self._upload_instances(changed_range)
+
+        SHADER = InstancedEntity._shader
+        LOCATION = SHADER.get_attribute_location("instance_model")
+
+        SHADER.use()
+        glUniform1i(SHADER.get_uniform_location("albedo"), 0)
+        glUniform4fv(SHADER.get_uniform_location("dequantization"), 1, self._mesh.get_dequantization())
+
+        if InstancedEntity._light_revision != LightManager.get_shader_revision():
+            lights, light_count = LightManager.get_shader_lights()
+            glUniform4fv(SHADER.get_uniform_location("lights"), lights.shape[0], lights)
+            glUniform1i(SHADER.get_uniform_location("light_count"), light_count)
+            InstancedEntity._light_revision = LightManager.get_shader_revision()
+
+        self._mesh.bind()
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._instance_buffer)
+
+        for column in range(InstancedEntity._MATRIX_COLUMNS):
+            glEnableVertexAttribArray(LOCATION + column)
+            glVertexAttribPointer(LOCATION + column, InstancedEntity._MATRIX_COLUMNS, GL_FLOAT, GL_FALSE, InstancedEntity._MATRIX_SIZE, ctypes.c_void_p(column * InstancedEntity._COLUMN_SIZE))
+            glVertexAttribDivisor(LOCATION + column, 1)
+
+        self._mesh.draw_instanced(len(self._instances))
+
+        for column in range(InstancedEntity._MATRIX_COLUMNS):
+            glVertexAttribDivisor(LOCATION + column, 0)
+            glDisableVertexAttribArray(LOCATION + column)
+
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        self._mesh.unbind()
+
+        glUseProgram(0)
+
+    def _render_batched(self) -> None:
+        LightManager.bind_default()
+        self._transform.load_transformations()
+
+        glFrontFace(GL_CCW)
+        glEnable(GL_TEXTURE_2D)
+
+        self._mesh.bind()
+
+        for matrix in self._matrices[:len(self._instances)]:
+            glPushMatrix()
+            glMultMatrixf(matrix)
+            self._mesh.draw()
+            glPopMatrix()
+
+        self._mesh.unbind()
+
+        glDisable(GL_TEXTURE_2D)
+
+    def _upload_instances(self, changed_range: tuple[int, int] | None) -> None:
+        if self._instance_buffer is None:
+            self._instance_buffer = glGenBuffers(1)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._instance_buffer)
+
+        if self._instance_buffer_capacity < len(self._instances):
+            self._instance_buffer_capacity = self._matrices.shape[0]
+            glBufferData(GL_ARRAY_BUFFER, self._matrices.nbytes, self._matrices, GL_DYNAMIC_DRAW)
+        elif changed_range is not None:
+            START, STOP = changed_range
+            glBufferSubData(GL_ARRAY_BUFFER, START * InstancedEntity._MATRIX_SIZE, (STOP - START) * InstancedEntity._MATRIX_SIZE, self._matrices[START:STOP])
+
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    @staticmethod
+    def _supports_instancing() -> bool:
+        if InstancedEntity._is_instancing_supported is None:
+            InstancedEntity._is_instancing_supported = bool(glDrawElementsInstanced) and bool(glVertexAttribDivisor)
+
+            if InstancedEntity._is_instancing_supported:
+                try:
+                    InstancedEntity._shader = Shader(InstancedEntity._VERTEX_SHADER, InstancedEntity._FRAGMENT_SHADER)
+                except RuntimeError:
+                    InstancedEntity._is_instancing_supported = False
+
+        return InstancedEntity._is_instancing_supported
\ No newline at end of file
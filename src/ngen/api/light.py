@@ -1,3 +1,4 @@
+import warnings
 from enum import Enum
 from OpenGL.GL import *
 from typing import Callable
@@ -23,32 +24,35 @@ class Light(SceneObject):
         DIRECTIONAL = 0.0
 
     def __init__(self, transform: Transform, type: Type, source: LightSource, color: list[float], render_delegate: Callable[[], None] = None, start_delegate: Callable[['Light'], None] = None, *update_delegates: Callable[['Light', float], None]) -> None:
-        super().__init__(transform, self._render, start_delegate, *update_delegates)
+        super().__init__(transform, None, start_delegate, *update_delegates)
         self._type = type
         self._color = color
         self._source = source
         self._render_delegate_light = render_delegate
 
+        if render_delegate is not None:
+            warnings.warn("Light render_delegate is deprecated; it now runs after LightManager uploads the light into a slot", DeprecationWarning, stacklevel=2)
+
+    def get_type(self) -> Type:
+        return self._type
+
+    def get_source(self) -> LightSource:
+        return self._source
+
     def get_color(self) -> list[float]:
         return self._color
 
     def set_color(self, value: list[float]) -> None:
         self._color = value
 
-    def _render(self) -> None:
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-
-        glLightfv(self._source.value, GL_POSITION, [*self._transform._position, self._type.value])
+    def get_attenuation(self) -> tuple[float, float, float]:
+        return 1.0, 0.0, 0.0
 
-        glLightfv(self._source.value, GL_AMBIENT, self._color)
-        glLightfv(self._source.value, GL_DIFFUSE, self._color)
-        glLightfv(self._source.value, GL_SPECULAR, self._color)
+    def get_spot(self) -> tuple[float, float]:
+        return 180.0, 0.0
 
-        if self._render_delegate_light is not None:
-            self._render_delegate_light()
-
-        glEnable(self._source.value)
+    def submit(self, render_queue: 'RenderQueue') -> None:
+        pass
 
 class LightDirectional(Light):
 
@@ -58,7 +62,7 @@ class LightDirectional(Light):
 class LightPoint(Light):
 
     def __init__(self, transform: Transform, source: LightSource, color: list[float], linear_attenuation: float, constant_attenuation: float, quadratic_attenuation: float, start_delegate: Callable[['LightPoint'], None] = None, *update_delegates: Callable[['LightPoint', float], None]) -> None:
-        super().__init__(transform, Light.Type.POINT, source, color, self._render_point_light, start_delegate, *update_delegates)
+        super().__init__(transform, Light.Type.POINT, source, color, None, start_delegate, *update_delegates)
         self._linear_attenuation = linear_attenuation
         self._constant_attenuation = constant_attenuation
         self._quadratic_attenuation = quadratic_attenuation
@@ -81,38 +85,16 @@ class LightPoint(Light):
     def set_quadratic_attenuation(self, value: float) -> None:
         self._quadratic_attenuation = value
 
-    def _render_point_light(self) -> None:
-        glLightf(self._source.value, GL_LINEAR_ATTENUATION, self._linear_attenuation)
-        glLightf(self._source.value, GL_CONSTANT_ATTENUATION, self._constant_attenuation)
-        glLightf(self._source.value, GL_QUADRATIC_ATTENUATION, self._quadratic_attenuation)
+    def get_attenuation(self) -> tuple[float, float, float]:
+        return self._constant_attenuation, self._linear_attenuation, self._quadratic_attenuation
 
-class LightSpot(Light):
+class LightSpot(LightPoint):
 
     def __init__(self, transform: Transform, source: LightSource, color: list[float], spot_cutoff: float, spot_exponent: float, linear_attenuation: float, constant_attenuation: float, quadratic_attenuation: float,  start_delegate: Callable[['LightSpot'], None] = None, *update_delegates: Callable[['LightSpot', float], None]) -> None:
-        super().__init__(transform, Light.Type.SPOT, source, color, self._render_spot_light, start_delegate, *update_delegates)
+        super().__init__(transform, source, color, linear_attenuation, constant_attenuation, quadratic_attenuation, start_delegate, *update_delegates)
+        self._type = Light.Type.SPOT
         self._spot_cutoff = spot_cutoff
         self._spot_exponent = spot_exponent
-        self._linear_attenuation = linear_attenuation
-        self._constant_attenuation = constant_attenuation
-        self._quadratic_attenuation = quadratic_attenuation
-
-    def get_constant_attenuation(self) -> float:
-        return self._constant_attenuation
-
-    def set_constant_attenuation(self, value: float) -> None:
-        self._constant_attenuation = value
-
-    def get_linear_attenuation(self) -> float:
-        return self._linear_attenuation
-
-    def set_linear_attenuation(self, value: float) -> None:
-        self._linear_attenuation = value
-
-    def get_quadratic_attenuation(self) -> float:
-        return self._quadratic_attenuation
-
-    def set_quadratic_attenuation(self, value: float) -> None:
-        self._quadratic_attenuation = value
 
     def get_spot_cutoff(self) -> float:
         return self._spot_cutoff
@@ -126,10 +108,5 @@ class LightSpot(Light):
     def set_spot_exponent(self, value: float) -> None:
         self._spot_exponent = value
 
-    def _render_spot_light(self) -> None:
-        glLightf(self._source.value, GL_LINEAR_ATTENUATION, self._linear_attenuation)
-        glLightf(self._source.value, GL_CONSTANT_ATTENUATION, self._constant_attenuation)
-        glLightf(self._source.value, GL_QUADRATIC_ATTENUATION, self._quadratic_attenuation)
-        glLightf(self._source.value, GL_SPOT_CUTOFF, self._spot_cutoff)
-        glLightf(self._source.value, GL_SPOT_EXPONENT, self._spot_exponent)
-        glLightfv(self._source.value, GL_SPOT_DIRECTION, self._transform.get_vector_forward())
\ No newline at end of file
+    def get_spot(self) -> tuple[float, float]:
+        return self._spot_cutoff, self._spot_exponent
\ No newline at end of file
@@ -0,0 +1,27 @@
+import numpy as np
+
+from .entity import Entity
+
+class RaycastHit:
+
+    def __init__(self, entity: Entity, distance: float, point: np.ndarray, barycentrics: np.ndarray, face: int) -> None:
+        self._entity = entity
+        self._distance = distance
+        self._point = point
+        self._barycentrics = barycentrics
+        self._face = face
+
+    def get_entity(self) -> Entity:
+        return self._entity
+
+    def get_distance(self) -> float:
+        return self._distance
+
+    def get_point(self) -> np.ndarray:
+        return self._point
+
+    def get_barycentrics(self) -> np.ndarray:
+        return self._barycentrics
+
+    def get_face(self) -> int:
+        return self._face
\ No newline at end of file
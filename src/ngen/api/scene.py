@@ -1,19 +1,54 @@
+import math
+import numpy as np
+
 from .camera import Camera
+from .light import Light
 from .entity import Entity
+from .frustum import Frustum
+from .transform import Transform
+from .raycast_hit import RaycastHit
 from .scene_object import SceneObject
+from .static_batcher import StaticBatcher
+from .transform_store import TransformStore
+from ..graphics.mesh import Mesh
+from ..graphics.geometry import Geometry
+from ..engine.preferences import Preferences
+from ..engine.texture_packer import TexturePacker
+from ..graphics.triangle_hierarchy import TriangleHierarchy
+from ..graphics.texture_cache import TextureCache
+from .instanced_entity import InstancedEntity
+from .bounding_volume_hierarchy import BoundingVolumeHierarchy
 
 class Scene:
 
+    _RAYCAST_LEAF_SIZE = 4
+
     def __init__(self, background_color: list[float], camera: Camera, *scene_objects: SceneObject) -> None:
         self._camera = camera
         self._background_color = background_color
-        self._scene_objects = list(scene_objects)
+        self._scene_objects = dict.fromkeys(scene_objects)
+        self._transform_stores = []
+        self._hierarchy_order = []
+        self._hierarchy_version = -1
+        self._mesh_version = -1
+        self._bounded_entities = []
+        self._bounds_revisions = None
+        self._bounds_version = 0
+        self._bounding_volume_hierarchy = None
+        self._lights = None
+        self._occluders = None
+        self._occluder_version = -1
+        self._static_batcher = None
+        self._raycast_entities = []
+        self._raycast_revisions = None
+        self._raycast_source = None
+        self._raycast_hierarchy = None
 
     def get_camera(self) -> Camera:
         return self._camera
 
-    def get_scene_objects(self) -> list:
-        return self._scene_objects
+    def get_scene_objects(self) -> list[SceneObject]:
+        return list(self._scene_objects)
 
     def get_background_color(self) -> list[float]:
         return self._background_color
@@ -21,11 +56,304 @@ class Scene:
     def set_background_color(self, value: list[float]) -> None:
         self._background_color = value
 
+    def get_transform_stores(self) -> list[TransformStore]:
+        return self._transform_stores
+
+    def add_transform_store(self, transform_store: TransformStore) -> None:
+        self._transform_stores.append(transform_store)
+
+    def remove_transform_store(self, transform_store: TransformStore) -> None:
+        self._transform_stores.remove(transform_store)
+
+    def get_bounding_volume_hierarchy(self) -> BoundingVolumeHierarchy:
+        self.update_bounds()
+        return self._bounding_volume_hierarchy
+
+    def get_bounded_entities(self) -> list[Entity]:
+        return self._bounded_entities
+
+    def get_bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._bounding_volume_hierarchy is None:
+            return np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.float32)
+
+        return self._bounding_volume_hierarchy.get_bounds()
+
+    def get_bounds_version(self) -> int:
+        return self._bounds_version
+
+    def get_lights(self) -> list[Light]:
+        if self._lights is None:
+            self._lights = [scene_object for scene_object in self._scene_objects if isinstance(scene_object, Light)]
+
+        return self._lights
+
+    def get_occluders(self) -> list[Entity]:
+        if self._occluders is None or self._occluder_version != Entity.get_occluder_version():
+            self._occluders = [scene_object for scene_object in self._scene_objects if isinstance(scene_object, Entity) and scene_object.get_is_occluder() and scene_object.get_mesh() is not None]
+            self._occluder_version = Entity.get_occluder_version()
+
+        return self._occluders
+
+    def get_static_batcher(self) -> StaticBatcher | None:
+        return self._static_batcher
+
+    def build_static_batches(self, chunk_size: float) -> None:
+        if self._static_batcher is None:
+            self._static_batcher = StaticBatcher(chunk_size)
+
+        for scene_object in list(self._scene_objects):
+            if isinstance(scene_object, Entity) and not scene_object.get_is_batched() and Scene._is_batchable(scene_object):
+                self._static_batcher.add(scene_object)
+
+        self.update_static_batches()
+
+    def update_static_batches(self) -> None:
+        if self._static_batcher is None:
+            return
+
+        added, removed = self._static_batcher.update()
+
+        for chunk in removed:
+            del self._scene_objects[chunk]
+            chunk.get_mesh().free()
+            TextureCache.release(chunk.get_texture_albedo())
+
+        for chunk in added:
+            self._scene_objects[chunk] = None
+
+        if added or removed:
+            self._bounding_volume_hierarchy = None
+
+    def query_overlaps(self, bounds_min: np.ndarray, bounds_max: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if self._bounding_volume_hierarchy is None:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        return self._bounding_volume_hierarchy.query_overlaps(bounds_min, bounds_max)
+
+    def raycast(self, origin: list[float], direction: list[float], max_distance: float = math.inf) -> RaycastHit | None:
+        entities, distances, barycentrics, faces = self.raycast_batch(np.asarray(origin, dtype=np.float64)[np.newaxis], np.asarray(direction, dtype=np.float64)[np.newaxis], max_distance)
+
+        if entities[0] is None:
+            return None
+
+        direction = np.asarray(direction, dtype=np.float64)
+        point = np.asarray(origin, dtype=np.float64) + direction / np.linalg.norm(direction) * distances[0]
+
+        return RaycastHit(entities[0], float(distances[0]), point, barycentrics[0], int(faces[0]))
+
+    def raycast_screen(self, x: float, y: float, max_distance: float = math.inf) -> RaycastHit | None:
+        origins, directions = self._camera.get_rays(np.array([[x, y]], dtype=np.float64))
+        return self.raycast(origins[0], directions[0], max_distance)
+
+    def raycast_screen_batch(self, points: np.ndarray, max_distance: float = math.inf) -> tuple[list[Entity | None], np.ndarray, np.ndarray, np.ndarray]:
+        return self.raycast_batch(*self._camera.get_rays(points), max_distance)
+
+    def raycast_batch(self, origins: np.ndarray, directions: np.ndarray, max_distance: float = math.inf) -> tuple[list[Entity | None], np.ndarray, np.ndarray, np.ndarray]:
+        origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+        directions = directions / np.maximum(np.linalg.norm(directions, axis=1), np.finfo(np.float64).tiny)[:, np.newaxis]
+        COUNT = origins.shape[0]
+
+        entities = [None] * COUNT
+        distances = np.full(COUNT, np.inf)
+        barycentrics = np.zeros((COUNT, 3), dtype=np.float64)
+        faces = np.full(COUNT, -1, dtype=np.int64)
+
+        self.update_raycast_bounds()
+        rays, items = self._raycast_hierarchy.query_rays(origins, directions, max_distance)
+
+        if rays.size == 0:
+            return entities, distances, barycentrics, faces
+
+        candidates, slots = np.unique(items, return_inverse=True)
+        inverses = np.linalg.inv(np.array([self._raycast_entities[index].get_transform().get_world_matrix() for index in candidates.tolist()], dtype=np.float64))[slots]
+
+        local_origins = np.einsum('nij,nj->ni', inverses[:, :3, :3], origins[rays]) + inverses[:, :3, 3]
+        local_directions = np.einsum('nij,nj->ni', inverses[:, :3, :3], directions[rays])
+
+        meshes = {}
+        mesh_of_candidate = np.fromiter((meshes.setdefault(self._raycast_entities[index].get_mesh(), len(meshes)) for index in candidates.tolist()), dtype=np.int64, count=candidates.size)
+
+        order = np.argsort(mesh_of_candidate[slots], kind='stable')
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(mesh_of_candidate[slots], minlength=len(meshes)))))
+
+        pair_distances = np.empty(rays.size, dtype=np.float64)
+        pair_barycentrics = np.empty((rays.size, 3), dtype=np.float64)
+        pair_faces = np.empty(rays.size, dtype=np.int64)
+
+        for mesh, start, stop in zip(meshes, bounds[:-1].tolist(), bounds[1:].tolist()):
+            pairs = order[start:stop]
+            pair_distances[pairs], pair_barycentrics[pairs], pair_faces[pairs] = mesh.get_triangle_hierarchy().intersect(local_origins[pairs], local_directions[pairs], max_distance)
+
+        hits = np.flatnonzero(pair_faces >= 0)
+        nearest = hits[TriangleHierarchy.select_nearest(rays[hits], pair_distances[hits])]
+        hit_rays = rays[nearest]
+
+        distances[hit_rays] = pair_distances[nearest]
+        barycentrics[hit_rays] = pair_barycentrics[nearest]
+        faces[hit_rays] = pair_faces[nearest]
+
+        for ray, item in zip(hit_rays.tolist(), items[nearest].tolist()):
+            entities[ray] = self._raycast_entities[item]
+
+        return entities, distances, barycentrics, faces
+
+    def update_raycast_bounds(self) -> None:
+        self.update_bounds()
+
+        if self._raycast_source is not self._bounding_volume_hierarchy:
+            if self._static_batcher is None:
+                self._raycast_entities = list(self._bounded_entities)
+            else:
+                chunks = set(self._static_batcher.get_chunks())
+                self._raycast_entities = [entity for entity in self._bounded_entities if entity not in chunks] + self._static_batcher.get_members()
+
+            self._raycast_revisions = Scene._get_revisions(self._raycast_entities)
+            self._raycast_hierarchy = BoundingVolumeHierarchy(*Scene._compute_world_bounds(self._raycast_entities), Scene._RAYCAST_LEAF_SIZE)
+            self._raycast_source = self._bounding_volume_hierarchy
+            return
+
+        revisions = Scene._get_revisions(self._raycast_entities)
+        changed = np.flatnonzero(revisions != self._raycast_revisions)
+
+        if changed.size:
+            self._raycast_hierarchy.refit(changed, *Scene._compute_world_bounds([self._raycast_entities[index] for index in changed]))
+            self._raycast_revisions = revisions
+
     def destroy(self, scene_object: SceneObject) -> None:
-        self._scene_objects.remove(scene_object)
+        for child in scene_object.get_children():
+            self.destroy(child)
+
+        if scene_object.get_parent() is not None:
+            scene_object.set_parent(None)
+
+        self._scene_objects.pop(scene_object, None)
+
+        if (isinstance(scene_object, Light)):
+            self._lights = None
 
         if (isinstance(scene_object, Entity)):
+            self._occluders = None
+            scene_object.set_mesh_request(None)
+            scene_object.set_texture_albedo_request(None)
+
+            if self._static_batcher is not None:
+                self._static_batcher.remove(scene_object)
+
+            TexturePacker.remove(scene_object)
+
+            if scene_object.get_mesh() is not None and not self._is_mesh_shared(scene_object.get_mesh()):
+                scene_object.get_mesh().free()
+
+            TextureCache.release(scene_object.get_texture_albedo())
+            self._bounding_volume_hierarchy = None
+
+        if (isinstance(scene_object, InstancedEntity)):
             scene_object.get_mesh().free()
+            scene_object.free()
+            TextureCache.release(scene_object.get_texture_albedo())
 
     def instantiate(self, scene_object: SceneObject) -> None:
-        self._scene_objects.append(scene_object)
\ No newline at end of file
+        self._scene_objects[scene_object] = None
+
+        if (isinstance(scene_object, Light)):
+            self._lights = None
+
+        if (isinstance(scene_object, Entity)):
+            self._occluders = None
+
+            if self._static_batcher is not None and Scene._is_batchable(scene_object):
+                self._static_batcher.add(scene_object)
+
+            self._bounding_volume_hierarchy = None
+
+    def update_hierarchy(self) -> None:
+        if self._hierarchy_version != Transform.get_hierarchy_version():
+            self._hierarchy_order = Scene._sort_hierarchy([scene_object.get_transform() for scene_object in self._scene_objects])
+            self._hierarchy_version = Transform.get_hierarchy_version()
+
+        for transform in self._hierarchy_order:
+            transform._refresh_world()
+
+    def update_bounds(self) -> None:
+        if self._bounding_volume_hierarchy is None or self._mesh_version != Entity.get_mesh_version():
+            self._mesh_version = Entity.get_mesh_version()
+            self._bounded_entities = [scene_object for scene_object in self._scene_objects if isinstance(scene_object, Entity) and scene_object.get_mesh() is not None and not scene_object.get_is_batched()]
+            self._bounds_revisions = Scene._get_revisions(self._bounded_entities)
+            self._bounding_volume_hierarchy = BoundingVolumeHierarchy(*Scene._compute_world_bounds(self._bounded_entities))
+            self._bounds_version += 1
+            return
+
+        revisions = Scene._get_revisions(self._bounded_entities)
+        changed = np.flatnonzero(revisions != self._bounds_revisions)
+
+        if changed.size:
+            self._bounding_volume_hierarchy.refit(changed, *Scene._compute_world_bounds([self._bounded_entities[index] for index in changed]))
+            self._bounds_revisions = revisions
+            self._bounds_version += 1
+
+    def cull(self, frustum: Frustum) -> list[Entity]:
+        self.update_bounds()
+        return [self._bounded_entities[index] for index in self._bounding_volume_hierarchy.query(frustum)]
+
+    def update_lods(self, camera: Camera) -> None:
+        if not self._bounded_entities:
+            return
+
+        bounds_min, bounds_max = self.get_bounds()
+        sizes = camera.get_screen_sizes((bounds_min + bounds_max) * 0.5, np.linalg.norm(bounds_max - bounds_min, axis=1) * 0.5)
+
+        thresholds = np.asarray(Preferences.get_lod_screen_sizes(), dtype=np.float64)
+        HYSTERESIS = Preferences.get_lod_hysteresis()
+
+        coarsest = (sizes[:, np.newaxis] < thresholds * (1.0 - HYSTERESIS)).sum(axis=1)
+        finest = (sizes[:, np.newaxis] < thresholds * (1.0 + HYSTERESIS)).sum(axis=1)
+
+        current = np.fromiter((entity.get_lod_level() for entity in self._bounded_entities), dtype=np.int64, count=len(self._bounded_entities))
+        lod_counts = np.fromiter((entity.get_mesh().get_lod_count() for entity in self._bounded_entities), dtype=np.int64, count=len(self._bounded_entities))
+        levels = np.minimum(np.clip(current, coarsest, finest), lod_counts - 1)
+
+        for index in np.flatnonzero(levels != current).tolist():
+            self._bounded_entities[index].set_lod_level(int(levels[index]))
+
+    @staticmethod
+    def _sort_hierarchy(transforms: list[Transform]) -> list[Transform]:
+        roots = {}
+
+        for transform in transforms:
+            while transform.get_parent() is not None:
+                transform = transform.get_parent()
+
+            if transform.get_children():
+                roots[transform] = None
+
+        order = []
+        pending = list(reversed(roots))
+
+        while pending:
+            transform = pending.pop()
+            order.append(transform)
+            pending.extend(reversed(transform.get_children()))
+
+        return order
+
+    def _is_mesh_shared(self, mesh: Mesh) -> bool:
+        return TexturePacker.uses_mesh(mesh) or (self._static_batcher is not None and self._static_batcher.uses_mesh(mesh))
+
+    @staticmethod
+    def _is_batchable(entity: Entity) -> bool:
+        return entity.get_is_static() and not entity.get_is_transparent() and entity.get_mesh() is not None
+
+    @staticmethod
+    def _get_revisions(entities: list[Entity]) -> np.ndarray:
+        return np.fromiter((entity.get_transform().get_world_revision() for entity in entities), dtype=np.int64, count=len(entities))
+
+    @staticmethod
+    def _compute_world_bounds(entities: list[Entity]) -> tuple[np.ndarray, np.ndarray]:
+        if not entities:
+            return np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.float32)
+
+        local_bounds = np.array([entity.get_mesh().get_bounds() for entity in entities], dtype=np.float64)
+        matrices = np.array([entity.get_transform().get_world_matrix() for entity in entities], dtype=np.float64)
+
+        return Geometry.transform_bounds(local_bounds[:, 0], local_bounds[:, 1], matrices)
\ No newline at end of file
@@ -1,5 +1,4 @@
 from abc import ABC
-from OpenGL.GL import *
 from typing import Callable
 
 from .transform import Transform
@@ -12,10 +11,29 @@ class SceneObject(ABC):
         self._start_delegate = start_delegate
         self._render_delegate = render_delegate
         self._update_delegates = update_delegates
+        self._parent = None
+        self._children = {}
 
     def get_transform(self) -> Transform:
         return self._transform
 
+    def get_parent(self) -> 'SceneObject':
+        return self._parent
+
+    def set_parent(self, parent: 'SceneObject') -> None:
+        self._transform.set_parent(None if parent is None else parent.get_transform())
+
+        if self._parent is not None:
+            del self._parent._children[self]
+
+        self._parent = parent
+
+        if parent is not None:
+            parent._children[self] = None
+
+    def get_children(self) -> list['SceneObject']:
+        return list(self._children)
+
     def get_is_active(self, value: bool) -> None:
         self._is_active = value
 
@@ -25,7 +43,9 @@ class SceneObject(ABC):
     def render(self) -> None:
         if self._is_active:
             self._render_delegate()
-            glFlush()
+
+    def submit(self, render_queue: 'RenderQueue') -> None:
+        self.render()
 
     def start(self) -> None:
         if self._is_active and self._start_delegate is not None:
@@ -0,0 +1,164 @@
+import math
+import numpy as np
+
+from .entity import Entity
+from .transform import Transform
+from ..graphics.mesh import Mesh
+from ..graphics.geometry import Geometry
+from ..engine.preferences import Preferences
+
+class StaticBatcher:
+
+    def __init__(self, chunk_size: float) -> None:
+        self._chunk_size = chunk_size
+        self._chunks = {}
+        self._members = {}
+        self._keys = {}
+        self._meshes = {}
+        self._mesh_users = {}
+        self._revisions = {}
+        self._dirty = set()
+        self._rebuilds = 0
+
+    def get_chunk_size(self) -> float:
+        return self._chunk_size
+
+    def get_chunks(self) -> list[Entity]:
+        return list(self._chunks.values())
+
+    def get_chunk_count(self) -> int:
+        return len(self._chunks)
+
+    def get_member_count(self) -> int:
+        return len(self._keys)
+
+    def get_members(self) -> list[Entity]:
+        return list(self._keys)
+
+    def get_rebuilds(self) -> int:
+        return self._rebuilds
+
+    def get_chunk_of(self, entity: Entity) -> Entity | None:
+        return self._chunks.get(self._keys.get(entity))
+
+    def contains(self, entity: Entity) -> bool:
+        return entity in self._keys
+
+    def uses_mesh(self, mesh: Mesh) -> bool:
+        return mesh in self._mesh_users
+
+    def add(self, entity: Entity) -> None:
+        key = self._get_key(entity)
+
+        self._members.setdefault(key, {})[entity] = None
+        self._keys[entity] = key
+        self._meshes[entity] = entity.get_mesh()
+        self._mesh_users[entity.get_mesh()] = self._mesh_users.get(entity.get_mesh(), 0) + 1
+        self._revisions[entity] = entity.get_transform().get_world_revision()
+        self._dirty.add(key)
+
+        entity.set_is_batched(True)
+
+    def remove(self, entity: Entity) -> None:
+        key = self._keys.pop(entity, None)
+
+        if key is None:
+            return
+
+        del self._members[key][entity]
+        del self._revisions[entity]
+
+        mesh = self._meshes.pop(entity)
+        self._mesh_users[mesh] -= 1
+
+        if self._mesh_users[mesh] == 0:
+            del self._mesh_users[mesh]
+        self._dirty.add(key)
+
+        entity.set_is_batched(False)
+
+    def update(self) -> tuple[list[Entity], list[Entity]]:
+        changed = [entity for entity, revision in self._revisions.items() if entity.get_transform().get_world_revision() != revision or entity.get_is_transparent()]
+
+        for entity in changed:
+            self.remove(entity)
+
+            if not entity.get_is_transparent():
+                self.add(entity)
+
+        added = []
+        removed = []
+        geometry = {}
+
+        for key in self._dirty:
+            chunk = self._chunks.pop(key, None)
+
+            if chunk is not None:
+                removed.append(chunk)
+
+            members = self._members.get(key)
+
+            if not members:
+                self._members.pop(key, None)
+                continue
+
+            chunk = self._build_chunk(list(members), geometry)
+            self._chunks[key] = chunk
+            added.append(chunk)
+            self._rebuilds += 1
+
+        self._dirty.clear()
+        return added, removed
+
+    def clear(self) -> list[Entity]:
+        for entity in self._keys:
+            entity.set_is_batched(False)
+
+        chunks = list(self._chunks.values())
+
+        self._chunks.clear()
+        self._members.clear()
+        self._keys.clear()
+        self._meshes.clear()
+        self._mesh_users.clear()
+        self._revisions.clear()
+        self._dirty.clear()
+
+        return chunks
+
+    def _get_key(self, entity: Entity) -> tuple:
+        bounds_min, bounds_max = Geometry.transform_bounds(*(bound[np.newaxis].astype(np.float64) for bound in entity.get_mesh().get_bounds()), entity.get_transform().get_world_matrix()[np.newaxis].astype(np.float64))
+        center = (bounds_min[0] + bounds_max[0]) * 0.5
+        cell = tuple(math.floor(value / self._chunk_size) for value in center.tolist())
+
+        return entity.get_texture_albedo(), entity.get_material(), entity.get_polygon_mode(), entity.get_mesh().get_attributes(), cell
+
+    def _build_chunk(self, members: list[Entity], geometry: dict[tuple[Mesh, int], tuple[np.ndarray, np.ndarray]]) -> Entity:
+        by_mesh = {}
+
+        for entity in members:
+            by_mesh.setdefault((entity.get_mesh(), entity.get_texture_variant()), []).append(entity)
+
+        vertex_buffers = []
+        index_buffers = []
+        vertex_offset = 0
+
+        for (mesh, variant), entities in by_mesh.items():
+            if (mesh, variant) not in geometry:
+                geometry[mesh, variant] = mesh.read_geometry(variant)
+
+            matrices = np.array([entity.get_transform().get_world_matrix() for entity in entities], dtype=np.float64)
+            vertex_buffer, index_buffer = Geometry.bake(*geometry[mesh, variant], matrices)
+
+            vertex_buffers.append(vertex_buffer)
+            index_buffers.append(index_buffer + vertex_offset)
+            vertex_offset += vertex_buffer.shape[0]
+
+        first = members[0]
+        mesh = Mesh(np.concatenate(vertex_buffers), np.concatenate(index_buffers).astype(np.uint32), first.get_mesh().get_attributes(), Preferences.get_mesh_quantization_enabled(), Preferences.get_mesh_retain_geometry())
+
+        chunk = Entity(Transform([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), mesh, first.get_texture_albedo())
+        chunk.set_material(first.get_material())
+        chunk.set_polygon_mode(first.get_polygon_mode())
+
+        return chunk
\ No newline at end of file
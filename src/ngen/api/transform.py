@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from OpenGL.GL import *
 
 class Transform:
@@ -11,68 +12,244 @@ class Transform:
     AXIS_Y = [0.0, 1.0, 0.0]
     AXIS_Z = [0.0, 0.0, 1.0]
 
+    _hierarchy_version = 0
+
     def __init__(self, position: list[float], rotation: list[float], scale: list[float]) -> None:
-        self._scale = scale
-        self._position = position
-        self._rotation = rotation
-        self._up = [0, 1, 0]
-        self._right = [1, 0, 0]
-        self._forward = [0, 0, -1]
-        self._update_vectors()
+        self._store = None
+        self._index = 0
+        self._vectors_revision = -1
+        self._up = np.array([0.0, 1.0, 0.0])
+        self._right = np.array([1.0, 0.0, 0.0])
+        self._forward = np.array([0.0, 0.0, -1.0])
+        self._parent = None
+        self._children = {}
+        self._world_inputs = None
+        self._world_revision = 0
+        self._world_gl_matrix = None
+        self._own_world_gl_matrix = None
+        self._bind(*Transform._allocate_storage(position, rotation, scale), None, 0)
 
     def get_scale(self) -> list[float]:
-        return self._scale
+        return self._scale.tolist()
 
     def set_scale(self, vector: list[float]) -> None:
-        self._scale = vector
+        self._scale[:] = vector
+        self._mark_dirty()
 
     def get_position(self) -> list[float]:
-        return self._position
+        return self._position.tolist()
 
     def set_position(self, vector: list[float]) -> None:
-        self._position = vector
+        self._position[:] = vector
+        self._mark_dirty()
 
     def get_rotation(self) -> list[float]:
-        return self._rotation
+        return self._rotation.tolist()
 
     def set_rotation(self, rotation: list[float]) -> None:
-        self._rotation = rotation
-        self._update_vectors()
+        self._rotation[:] = rotation
+        self._mark_dirty()
+
+    def get_revision(self) -> int:
+        return int(self._revision[0])
+
+    def get_world_revision(self) -> int:
+        self._get_world_gl_matrix()
+        return self._world_revision
+
+    def get_parent(self) -> 'Transform':
+        return self._parent
+
+    def set_parent(self, parent: 'Transform') -> None:
+        ancestor = parent
+
+        while ancestor is not None:
+            if ancestor is self:
+                raise ValueError("A transform cannot be parented to itself or to one of its descendants.")
+            ancestor = ancestor._parent
+
+        if self._parent is not None:
+            del self._parent._children[self]
+
+        self._parent = parent
+        self._world_inputs = None
+
+        if parent is not None:
+            parent._children[self] = None
+
+            if self._own_world_gl_matrix is None:
+                self._own_world_gl_matrix = np.identity(4, dtype=np.float32)
 
-    def get_vector_forward(self) -> list[float]:
+        Transform._hierarchy_version += 1
+
+    def get_children(self) -> list['Transform']:
+        return list(self._children)
+
+    def get_world_matrix(self) -> np.ndarray:
+        return self._get_world_gl_matrix().T
+
+    def get_world_position(self) -> np.ndarray:
+        return self._get_world_gl_matrix()[3, :3].astype(np.float64)
+
+    def get_store(self) -> 'TransformStore':
+        return self._store
+
+    def get_store_index(self) -> int:
+        return self._index
+
+    def get_model_matrix(self) -> np.ndarray:
+        return self._get_gl_matrix().T
+
+    def get_vector_forward(self) -> np.ndarray:
+        if self._vectors_revision != self._revision[0]:
+            self._update_vectors()
         return self._forward
 
-    def get_vector_backwards(self) -> list[float]:
-        return [-x for x in self._forward]
+    def get_vector_backwards(self) -> np.ndarray:
+        return -self.get_vector_forward()
 
-    def get_vector_up(self) -> list[float]:
+    def get_vector_up(self) -> np.ndarray:
+        if self._vectors_revision != self._revision[0]:
+            self._update_vectors()
         return self._up
 
-    def get_vector_down(self) -> list[float]:
-        return [-x for x in self._up]
+    def get_vector_down(self) -> np.ndarray:
+        return -self.get_vector_up()
 
-    def get_vector_right(self) -> list[float]:
+    def get_vector_right(self) -> np.ndarray:
+        if self._vectors_revision != self._revision[0]:
+            self._update_vectors()
         return self._right
 
-    def get_vector_left(self) -> list[float]:
-        return [-x for x in self._right]
+    def get_vector_left(self) -> np.ndarray:
+        return -self.get_vector_right()
 
     def apply_transformations(self) -> None:
-        glTranslatef(*self._position)
-        glRotatef(self._rotation[Transform.X], *self.AXIS_X)
-        glRotatef(self._rotation[Transform.Y], *self.AXIS_Y)
-        glRotatef(self._rotation[Transform.Z], *self.AXIS_Z)
-        glScalef(*self._scale)
+        glMultMatrixf(self._get_gl_matrix())
+
+    def load_transformations(self) -> None:
+        glLoadMatrixf(self._get_world_gl_matrix())
 
     def scale(self, factors: list[float]) -> None:
-        self._scale = [s * f for s, f in zip(self._scale, factors)]
+        self._scale *= factors
+        self._mark_dirty()
 
     def translate(self, direction: list[float]) -> None:
-        self._position = [sum(x) for x in zip(self._position, direction)]
+        self._position += direction
+        self._mark_dirty()
 
     def rotate(self, angle: float, axis: list[float]) -> None:
-        self._rotation = [sum(x) for x in zip(self._rotation, [angle * a for a in axis])]
-        self._update_vectors()
+        self._rotation += np.multiply(angle, axis)
+        self._mark_dirty()
+
+    @staticmethod
+    def compose_matrices(positions: np.ndarray, rotations: np.ndarray, scales: np.ndarray) -> np.ndarray:
+        radians = np.radians(rotations)
+        cos = np.cos(radians)
+        sin = np.sin(radians)
+
+        cosX, cosY, cosZ = cos[:, Transform.X], cos[:, Transform.Y], cos[:, Transform.Z]
+        sinX, sinY, sinZ = sin[:, Transform.X], sin[:, Transform.Y], sin[:, Transform.Z]
+
+        matrices = np.zeros((positions.shape[0], 4, 4), dtype=np.float32)
+
+        matrices[:, 0, 0] = cosY * cosZ
+        matrices[:, 0, 1] = -cosY * sinZ
+        matrices[:, 0, 2] = sinY
+        matrices[:, 1, 0] = sinX * sinY * cosZ + cosX * sinZ
+        matrices[:, 1, 1] = -sinX * sinY * sinZ + cosX * cosZ
+        matrices[:, 1, 2] = -sinX * cosY
+        matrices[:, 2, 0] = -cosX * sinY * cosZ + sinX * sinZ
+        matrices[:, 2, 1] = cosX * sinY * sinZ + sinX * cosZ
+        matrices[:, 2, 2] = cosX * cosY
+
+        matrices[:, :3, :3] *= scales[:, np.newaxis, :]
+        matrices[:, :3, 3] = positions
+        matrices[:, 3, 3] = 1.0
+
+        return matrices
+
+    @staticmethod
+    def get_hierarchy_version() -> int:
+        return Transform._hierarchy_version
+
+    @staticmethod
+    def _allocate_storage(position: list[float], rotation: list[float], scale: list[float]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        return (
+            np.array([position], dtype=np.float64),
+            np.array([rotation], dtype=np.float64),
+            np.array([scale], dtype=np.float64),
+            np.zeros(1, dtype=np.int64),
+            np.full(1, -1, dtype=np.int64),
+            np.identity(4, dtype=np.float32)[np.newaxis].copy(),
+        )
+
+    def _bind(self, positions: np.ndarray, rotations: np.ndarray, scales: np.ndarray, revisions: np.ndarray, matrix_revisions: np.ndarray, gl_matrices: np.ndarray, store: 'TransformStore', index: int) -> None:
+        self._store = store
+        self._index = index
+        self._world_inputs = None
+        self._scale = scales[index]
+        self._position = positions[index]
+        self._rotation = rotations[index]
+        self._revision = revisions[index:index + 1]
+        self._matrix_revision = matrix_revisions[index:index + 1]
+        self._gl_matrix = gl_matrices[index]
+        self._gl_matrix_flat = self._gl_matrix.reshape(16)
+
+    def _detach(self) -> None:
+        REVISION = self.get_revision()
+        self._bind(*Transform._allocate_storage(self._position, self._rotation, self._scale), None, 0)
+        self._revision[0] = REVISION + 1
+
+    def _mark_dirty(self) -> None:
+        self._revision[0] += 1
+
+    def _get_gl_matrix(self) -> np.ndarray:
+        if self._matrix_revision[0] != self._revision[0]:
+            self._update_matrix()
+            self._matrix_revision[0] = self._revision[0]
+        return self._gl_matrix
+
+    def _get_world_gl_matrix(self) -> np.ndarray:
+        if self._parent is not None:
+            self._parent._get_world_gl_matrix()
+
+        self._refresh_world()
+        return self._world_gl_matrix
+
+    def _refresh_world(self) -> bool:
+        inputs = (int(self._revision[0]), -1 if self._parent is None else self._parent._world_revision)
+
+        if inputs == self._world_inputs:
+            return False
+
+        if self._parent is None:
+            self._world_gl_matrix = self._get_gl_matrix()
+        else:
+            self._world_gl_matrix = np.matmul(self._get_gl_matrix(), self._parent._world_gl_matrix, out=self._own_world_gl_matrix)
+
+        self._world_inputs = inputs
+        self._world_revision += 1
+        return True
+
+    def _update_matrix(self) -> None:
+        positionX, positionY, positionZ = self._position.tolist()
+        rotationX, rotationY, rotationZ = self._rotation.tolist()
+        scaleX, scaleY, scaleZ = self._scale.tolist()
+
+        cosX = math.cos(math.radians(rotationX))
+        sinX = math.sin(math.radians(rotationX))
+        cosY = math.cos(math.radians(rotationY))
+        sinY = math.sin(math.radians(rotationY))
+        cosZ = math.cos(math.radians(rotationZ))
+        sinZ = math.sin(math.radians(rotationZ))
+
+        self._gl_matrix_flat[:] = (
+            cosY * cosZ * scaleX, (sinX * sinY * cosZ + cosX * sinZ) * scaleX, (-cosX * sinY * cosZ + sinX * sinZ) * scaleX, 0.0,
+            -cosY * sinZ * scaleY, (-sinX * sinY * sinZ + cosX * cosZ) * scaleY, (cosX * sinY * sinZ + sinX * cosZ) * scaleY, 0.0,
+            sinY * scaleZ, -sinX * cosY * scaleZ, cosX * cosY * scaleZ, 0.0,
+            positionX, positionY, positionZ, 1.0,
+        )
 
     def _update_vectors(self) -> None:
         cosY = math.cos(math.radians(self._rotation[Transform.Y]))
@@ -92,4 +269,6 @@ class Transform:
 
         self._forward[Transform.X] = -cosP * sinY
         self._forward[Transform.Y] = sinP
-        self._forward[Transform.Z] = cosP * cosY
\ No newline at end of file
+        self._forward[Transform.Z] = cosP * cosY
+
+        self._vectors_revision = self._revision[0]
\ No newline at end of file
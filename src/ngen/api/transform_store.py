@@ -0,0 +1,140 @@
+import numpy as np
+from typing import Callable
+
+from .transform import Transform
+
+class TransformStore:
+
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        self._count = 0
+        self._free = []
+        self._systems = []
+        self._transforms = []
+        self._capacity = 0
+        self._scales = np.ones((0, 3), dtype=np.float64)
+        self._positions = np.zeros((0, 3), dtype=np.float64)
+        self._rotations = np.zeros((0, 3), dtype=np.float64)
+        self._revisions = np.zeros(0, dtype=np.int64)
+        self._matrix_revisions = np.zeros(0, dtype=np.int64)
+        self._gl_matrices = np.zeros((0, 4, 4), dtype=np.float32)
+        self._reallocate(max(1, capacity))
+
+    def get_count(self) -> int:
+        return self._count
+
+    def get_positions(self) -> np.ndarray:
+        return self._positions[:self._count]
+
+    def get_rotations(self) -> np.ndarray:
+        return self._rotations[:self._count]
+
+    def get_scales(self) -> np.ndarray:
+        return self._scales[:self._count]
+
+    def get_revisions(self) -> np.ndarray:
+        return self._revisions[:self._count]
+
+    def get_model_matrices(self) -> np.ndarray:
+        self.update_matrices()
+        return self._gl_matrices[:self._count].transpose(0, 2, 1)
+
+    def get_transforms(self) -> list[Transform]:
+        return [transform for transform in self._transforms[:self._count] if transform is not None]
+
+    def create(self, position: list[float], rotation: list[float], scale: list[float]) -> Transform:
+        return self.attach(Transform(position, rotation, scale))
+
+    def create_batch(self, positions: np.ndarray, rotations: np.ndarray, scales: np.ndarray) -> list[Transform]:
+        COUNT = len(positions)
+        START = self._reserve(COUNT)
+
+        transforms = [Transform(position, rotation, scale) for position, rotation, scale in zip(positions, rotations, scales)]
+
+        for offset, transform in enumerate(transforms):
+            self._bind(transform, START + offset)
+
+        return transforms
+
+    def attach(self, transform: Transform) -> Transform:
+        if transform.get_store() is not None:
+            transform.get_store().release(transform)
+
+        self._bind(transform, self._free.pop() if self._free else self._reserve(1))
+        return transform
+
+    def release(self, transform: Transform) -> None:
+        INDEX = transform.get_store_index()
+        transform._detach()
+        self._transforms[INDEX] = None
+        self._free.append(INDEX)
+
+    def add_system(self, system: Callable[[float, np.ndarray, np.ndarray, np.ndarray], None], start: int = 0, stop: int = None) -> None:
+        self._systems.append((system, start, stop))
+
+    def remove_system(self, system: Callable[[float, np.ndarray, np.ndarray, np.ndarray], None]) -> None:
+        self._systems = [entry for entry in self._systems if entry[0] is not system]
+
+    def update(self, delta_time: float) -> None:
+        for system, start, stop in self._systems:
+            STOP = self._count if stop is None else min(stop, self._count)
+            system(delta_time, self._positions[start:STOP], self._rotations[start:STOP], self._scales[start:STOP])
+            self._revisions[start:STOP] += 1
+
+        self.update_matrices()
+
+    def update_matrices(self) -> None:
+        dirty = np.flatnonzero(self._revisions[:self._count] != self._matrix_revisions[:self._count])
+
+        if dirty.size:
+            self._gl_matrices[dirty] = Transform.compose_matrices(self._positions[dirty], self._rotations[dirty], self._scales[dirty]).transpose(0, 2, 1)
+            self._matrix_revisions[dirty] = self._revisions[dirty]
+
+    def _bind(self, transform: Transform, index: int) -> None:
+        self._positions[index] = transform.get_position()
+        self._rotations[index] = transform.get_rotation()
+        self._scales[index] = transform.get_scale()
+        self._revisions[index] = transform.get_revision() + 1
+        self._matrix_revisions[index] = -1
+        self._transforms[index] = transform
+        transform._bind(self._positions, self._rotations, self._scales, self._revisions, self._matrix_revisions, self._gl_matrices, self, index)
+
+    def _reserve(self, count: int) -> int:
+        START = self._count
+
+        if START + count > self._capacity:
+            self._reallocate(max(START + count, self._capacity * 2))
+
+        self._count += count
+        return START
+
+    def _reallocate(self, capacity: int) -> None:
+        COUNT = self._count
+
+        scales = np.ones((capacity, 3), dtype=np.float64)
+        positions = np.zeros((capacity, 3), dtype=np.float64)
+        rotations = np.zeros((capacity, 3), dtype=np.float64)
+        revisions = np.zeros(capacity, dtype=np.int64)
+        matrix_revisions = np.full(capacity, -1, dtype=np.int64)
+        gl_matrices = np.zeros((capacity, 4, 4), dtype=np.float32)
+
+        scales[:COUNT] = self._scales[:COUNT]
+        positions[:COUNT] = self._positions[:COUNT]
+        rotations[:COUNT] = self._rotations[:COUNT]
+        revisions[:COUNT] = self._revisions[:COUNT]
+        matrix_revisions[:COUNT] = self._matrix_revisions[:COUNT]
+        gl_matrices[:COUNT] = self._gl_matrices[:COUNT]
+
+        self._scales = scales
+        self._positions = positions
+        self._rotations = rotations
+        self._revisions = revisions
+        self._matrix_revisions = matrix_revisions
+        self._gl_matrices = gl_matrices
+        self._capacity = capacity
+        self._transforms.extend([None] * (capacity - len(self._transforms)))
+
+        for index, transform in enumerate(self._transforms[:COUNT]):
+            if transform is not None:
+                transform._bind(self._positions, self._rotations, self._scales, self._revisions, self._matrix_revisions, self._gl_matrices, self, index)
\ No newline at end of file
@@ -1,3 +1,4 @@
 from .loader import Loader
 from .preferences import Preferences
+from .profiler import Profiler
 from .application import Application
\ No newline at end of file
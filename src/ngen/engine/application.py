@@ -1,9 +1,25 @@
 import glfw
+import numpy as np
 from OpenGL.GL import *
+from typing import Callable
 
 from ..api.scene import Scene
 from ..api.entity import Entity
+from ..api.instanced_entity import InstancedEntity
+from .loader import Loader
+from .profiler import Profiler
+from .light_manager import LightManager
+from .occlusion_culler import OcclusionCuller
+from .texture_packer import TexturePacker
 from .preferences import Preferences
+from .fixed_timestep_loop import FixedTimestepLoop
+from .render_queue import RenderQueue
+from .headless_context import HeadlessContext
+from ..graphics.framebuffer import Framebuffer
+from ..graphics.frame_reader import FrameReader
+from ..graphics.material import Material
+from ..graphics.shader_cache import ShaderCache
+from ..graphics.texture_cache import TextureCache
 
 class Application:
 
@@ -12,29 +28,41 @@ class Application:
     _VIEWPORT_OFFSET_X = 0
     _VIEWPORT_OFFSET_Y = 0
 
-    _MIN_DELTA_TIME = 0.005
-    _delta_time = _MIN_DELTA_TIME
-
     def __new__(cls):
         if not cls._instance:
             cls._instance = super(Application, cls).__new__(cls)
         return cls._instance
 
     def __init__(self) -> None:
-        if not glfw.init():
-            return
-
-        glfw.window_hint(glfw.DOUBLEBUFFER, glfw.TRUE)
-        glfw.window_hint(glfw.SAMPLES, Preferences.get_anti_aliasing_samples())
-
-        self._window = glfw.create_window(Preferences.get_window_width(), Preferences.get_window_height(), Preferences.get_window_title(), None, None)
-
-        if not self._window:
-            self._destroy()
-            return
-
-        glfw.make_context_current(self._window)
-        glfw.swap_interval(0)
+        self._objects_culled = 0
+        self._objects_occluded = 0
+        self._title_elapsed = 0.0
+        self._render_queue = RenderQueue()
+        self._occlusion_culler = OcclusionCuller()
+        self._loop = FixedTimestepLoop(Preferences.get_fixed_delta_time(), Preferences.get_max_substeps(), Preferences.get_target_frame_rate())
+        self._window = None
+        self._framebuffer = None
+        self._active_scene = None
+        self._headless_context = None
+
+        if Preferences.get_headless():
+            self._headless_context = HeadlessContext(Preferences.get_headless_backend(), Preferences.get_window_width(), Preferences.get_window_height())
+            self._framebuffer = Framebuffer(Preferences.get_window_width(), Preferences.get_window_height())
+        else:
+            if not glfw.init():
+                return
+
+            glfw.window_hint(glfw.DOUBLEBUFFER, glfw.TRUE)
+            glfw.window_hint(glfw.SAMPLES, Preferences.get_anti_aliasing_samples())
+
+            self._window = glfw.create_window(Preferences.get_window_width(), Preferences.get_window_height(), Preferences.get_window_title(), None, None)
+
+            if not self._window:
+                self._destroy()
+                return
+
+            glfw.make_context_current(self._window)
+            glfw.swap_interval(0)
 
         glEnable(GL_LIGHTING)
         glEnable(GL_DEPTH_TEST)
@@ -42,57 +70,239 @@ class Application:
         glEnable(GL_COLOR_MATERIAL)
 
     def get_fps(self) -> int:
-        return int(1 / self._delta_time)
+        return int(self._loop.get_fps())
 
     def get_delta_time(self) -> float:
-        return self._delta_time
+        return self._loop.get_frame_time()
+
+    def get_fixed_delta_time(self) -> float:
+        return self._loop.get_fixed_delta_time()
+
+    def get_interpolation_alpha(self) -> float:
+        return self._loop.get_interpolation_alpha()
+
+    def get_loop(self) -> FixedTimestepLoop:
+        return self._loop
+
+    def get_render_queue(self) -> RenderQueue:
+        return self._render_queue
+
+    def get_objects_culled(self) -> int:
+        return self._objects_culled
+
+    def get_objects_occluded(self) -> int:
+        return self._objects_occluded
+
+    def get_occlusion_culler(self) -> OcclusionCuller:
+        return self._occlusion_culler
+
+    def get_framebuffer(self) -> Framebuffer:
+        return self._framebuffer
+
+    def close(self) -> None:
+        self._destroy()
+
+    def render_frames(self, scene: Scene, frame_count: int, on_frame: Callable[[np.ndarray], None] = None) -> list[np.ndarray]:
+        if self._framebuffer is None:
+            raise RuntimeError("Offscreen rendering requires Preferences.set_headless(True) before the Application is created.")
+
+        self._active_scene = scene
+
+        self._start_scene()
+
+        WIDTH = self._framebuffer.get_width()
+        HEIGHT = self._framebuffer.get_height()
+
+        frames = []
+        consume = on_frame if on_frame is not None else frames.append
+        frame_reader = FrameReader(WIDTH, HEIGHT, Preferences.get_readback_buffer_count())
+
+        self._framebuffer.bind()
+
+        for _ in range(frame_count):
+            Profiler.begin_frame()
+
+            Loader.wait_for_uploads()
+            self._simulate(self._loop.get_fixed_delta_time())
+            self._render(WIDTH, HEIGHT)
+
+            with Profiler.scope("readback"):
+                frame = frame_reader.read()
+
+            if frame is not None:
+                consume(frame)
+
+            Profiler.end_frame()
+
+        for frame in frame_reader.flush():
+            consume(frame)
+
+        frame_reader.free()
+        self._framebuffer.unbind()
+
+        return frames
 
     def load_scene(self, scene: Scene) -> None:
         self._active_scene = scene
 
-        for scene_object in self._active_scene.get_scene_objects():
-            scene_object.start()
+        self._start_scene()
+
+        self._loop.reset()
 
         while not glfw.window_should_close(self._window):
+            Profiler.begin_frame()
+
             self._update()
-            glfw.poll_events()
+
+            with Profiler.scope("poll_events"):
+                glfw.poll_events()
+
+            Profiler.end_frame()
+
+    def _start_scene(self) -> None:
+        for scene_object in self._active_scene.get_scene_objects():
+            scene_object.start()
+
+        if Preferences.get_texture_atlas_enabled():
+            TexturePacker.pack(self._active_scene)
+
+        if Preferences.get_static_batching_enabled():
+            self._active_scene.build_static_batches(Preferences.get_static_batch_chunk_size())
 
     def _update(self) -> None:
         width, height = glfw.get_framebuffer_size(self._window)
+
+        self._loop.tick(self._simulate)
+        self._update_title()
+        self._render(width, height)
+
+        with Profiler.scope("swap_buffers"):
+            glfw.swap_buffers(self._window)
+
+        with Profiler.scope("limit_frame_rate"):
+            self._loop.limit_frame_rate()
+
+    def _update_title(self) -> None:
+        self._title_elapsed += self._loop.get_frame_time()
+
+        if self._title_elapsed >= Preferences.get_title_update_interval():
+            self._title_elapsed = 0.0
+            glfw.set_window_title(self._window, f"{Preferences.get_window_title()} | FPS: {self.get_fps()}")
+
+    def _render(self, width: int, height: int) -> None:
         glViewport(self._VIEWPORT_OFFSET_X, self._VIEWPORT_OFFSET_Y, width, height)
 
         Preferences.set_window_width(width)
         Preferences.set_window_height(height)
-        glfw.set_window_title(self._window, f"{Preferences.get_window_title()} | FPS: {self.get_fps()}")
-
-        start_time = glfw.get_time()
 
+        glClearColor(*self._active_scene.get_background_color())
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
-        self._active_scene.get_camera().update(self._delta_time)
+        with Profiler.scope("uploads"):
+            Loader.process_uploads(Preferences.get_upload_budget())
 
-        for scene_object in self._active_scene.get_scene_objects():
-            scene_object.update(self._delta_time)
+        with Profiler.scope("camera_render"):
+            self._active_scene.get_camera().render()
 
-        glClearColor(*self._active_scene.get_background_color())
+        with Profiler.scope("static_batches"):
+            self._active_scene.update_static_batches()
 
-        self._active_scene.get_camera().render()
+        with Profiler.scope("cull"):
+            visible_entities = self._cull()
 
-        for scene_object in self._active_scene.get_scene_objects():
-            scene_object.render()
+        with Profiler.scope("occlusion"):
+            visible_entities = self._cull_occluded(visible_entities)
 
-        finish_time = glfw.get_time()
+        with Profiler.scope("lod"):
+            if visible_entities is None:
+                self._active_scene.update_bounds()
 
-        self._delta_time = (finish_time - start_time)
+            self._active_scene.update_lods(self._active_scene.get_camera())
 
-        if  self._delta_time < Application._MIN_DELTA_TIME:
-             self._delta_time = Application._MIN_DELTA_TIME
+        with Profiler.scope("lights"):
+            LightManager.update(self._active_scene, self._active_scene.get_camera().get_transform().get_world_position())
 
-        glfw.swap_buffers(self._window)
+        with Profiler.scope("submit"):
+            for scene_object in self._active_scene.get_scene_objects():
+                if visible_entities is not None and isinstance(scene_object, Entity) and scene_object not in visible_entities:
+                    continue
 
-    def _destroy(self) -> None:
-        for scene_object in self._active_scene.get_scene_objects():
-            if isinstance(scene_object, Entity):
-                scene_object.get_mesh().free()
+                scene_object.submit(self._render_queue)
+
+        with Profiler.scope("render_queue"):
+            self._render_queue.flush(self._active_scene.get_camera().get_transform().get_position())
+
+        Profiler.count("draw_calls", self._render_queue.get_draw_calls())
+        Profiler.count("state_changes", self._render_queue.get_state_changes())
+        Profiler.count("program_switches", self._render_queue.get_program_switches())
+        Profiler.count("texture_binds", self._render_queue.get_texture_binds())
+        Profiler.count("triangles", self._render_queue.get_triangles())
+        Profiler.count("objects_culled", self._objects_culled)
+        Profiler.count("objects_occluded", self._objects_occluded)
+        Profiler.count("light_uploads", LightManager.get_uploads())
+
+    def _simulate(self, delta_time: float) -> None:
+        with Profiler.scope("camera_update"):
+            self._active_scene.get_camera().update(delta_time)
+
+        with Profiler.scope("transform_stores"):
+            for transform_store in self._active_scene.get_transform_stores():
+                transform_store.update(delta_time)
+
+        with Profiler.scope("object_updates"):
+            for scene_object in self._active_scene.get_scene_objects():
+                scene_object.update(delta_time)
 
-        glfw.terminate()
\ No newline at end of file
+        with Profiler.scope("hierarchy"):
+            self._active_scene.update_hierarchy()
+
+    def _cull(self) -> set[Entity] | None:
+        if not Preferences.get_frustum_culling_enabled():
+            self._objects_culled = 0
+            return None
+
+        visible_entities = set(self._active_scene.cull(self._active_scene.get_camera().get_frustum()))
+        self._objects_culled = self._active_scene.get_bounding_volume_hierarchy().get_item_count() - len(visible_entities)
+
+        return visible_entities
+
+    def _cull_occluded(self, visible_entities: set[Entity] | None) -> set[Entity] | None:
+        if not Preferences.get_occlusion_culling_enabled():
+            self._objects_occluded = 0
+            return visible_entities
+
+        visible_entities = self._occlusion_culler.cull(self._active_scene, self._active_scene.get_camera(), visible_entities)
+        self._objects_occluded = self._occlusion_culler.get_objects_occluded()
+
+        return visible_entities
+
+    def _destroy(self) -> None:
+        if self._active_scene is not None:
+            for scene_object in self._active_scene.get_scene_objects():
+                if isinstance(scene_object, Entity):
+                    if scene_object.get_mesh() is not None:
+                        scene_object.get_mesh().free()
+
+                    TextureCache.release(scene_object.get_texture_albedo())
+
+                if isinstance(scene_object, InstancedEntity):
+                    scene_object.get_mesh().free()
+                    scene_object.free()
+                    TextureCache.release(scene_object.get_texture_albedo())
+
+        Loader.shutdown()
+        LightManager.reset()
+        TexturePacker.reset()
+        self._occlusion_culler.reset()
+        Material.reset()
+        ShaderCache.clear()
+
+        if self._framebuffer is not None:
+            self._framebuffer.free()
+            self._framebuffer = None
+
+        if self._headless_context is not None:
+            self._headless_context.free()
+            self._headless_context = None
+        else:
+            glfw.terminate()
\ No newline at end of file
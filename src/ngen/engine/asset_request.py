@@ -0,0 +1,61 @@
+from typing import Any, Callable
+from concurrent.futures import Future
+
+class AssetRequest:
+
+    def __init__(self, path: str, future: Future, upload: Callable[[Any], Any]) -> None:
+        self._path = path
+        self._future = future
+        self._upload = upload
+        self._asset = None
+        self._error = None
+        self._is_done = False
+        self._callbacks = []
+
+    def get_path(self) -> str:
+        return self._path
+
+    def get_error(self) -> BaseException | None:
+        return self._error
+
+    def get_asset(self) -> Any:
+        if self._error is not None:
+            raise self._error
+        return self._asset
+
+    def is_done(self) -> bool:
+        return self._is_done
+
+    def is_ready_for_upload(self) -> bool:
+        return self._future.done()
+
+    def add_done_callback(self, callback: Callable[[Any], None]) -> None:
+        if not self._is_done:
+            self._callbacks.append(callback)
+        elif self._error is None:
+            callback(self._asset)
+
+    def wait(self) -> Any:
+        self.wait_for_upload()
+        return self.get_asset()
+
+    def wait_for_upload(self) -> None:
+        self._future.exception()
+        self._complete()
+
+    def _complete(self) -> None:
+        if self._is_done:
+            return
+
+        try:
+            self._asset = self._upload(self._future.result())
+        except Exception as error:
+            self._error = error
+
+        self._is_done = True
+
+        if self._error is None:
+            for callback in self._callbacks:
+                callback(self._asset)
+
+        self._callbacks.clear()
\ No newline at end of file
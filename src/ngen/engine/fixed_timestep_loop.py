@@ -0,0 +1,92 @@
+import time
+from typing import Callable
+
+class FixedTimestepLoop:
+
+    def __init__(self, fixed_delta_time: float, max_substeps: int, target_frame_rate: float = 0.0, clock: Callable[[], float] = time.perf_counter, sleep: Callable[[float], None] = time.sleep) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._fixed_delta_time = fixed_delta_time
+        self._max_substeps = max_substeps
+        self._target_frame_rate = target_frame_rate
+        self._accumulator = 0.0
+        self._frame_time = 0.0
+        self._frame_start = None
+        self._substeps = 0
+        self._dropped_time = 0.0
+        self._simulation_time = 0.0
+
+    def get_fixed_delta_time(self) -> float:
+        return self._fixed_delta_time
+
+    def set_fixed_delta_time(self, value: float) -> None:
+        self._fixed_delta_time = value
+
+    def get_max_substeps(self) -> int:
+        return self._max_substeps
+
+    def set_max_substeps(self, value: int) -> None:
+        self._max_substeps = value
+
+    def get_target_frame_rate(self) -> float:
+        return self._target_frame_rate
+
+    def set_target_frame_rate(self, value: float) -> None:
+        self._target_frame_rate = value
+
+    def get_frame_time(self) -> float:
+        return self._frame_time
+
+    def get_fps(self) -> float:
+        return 1.0 / self._frame_time if self._frame_time > 0.0 else 0.0
+
+    def get_substeps(self) -> int:
+        return self._substeps
+
+    def get_dropped_time(self) -> float:
+        return self._dropped_time
+
+    def get_simulation_time(self) -> float:
+        return self._simulation_time
+
+    def get_interpolation_alpha(self) -> float:
+        return self._accumulator / self._fixed_delta_time
+
+    def reset(self) -> None:
+        self._accumulator = 0.0
+        self._frame_time = 0.0
+        self._frame_start = self._clock()
+
+    def tick(self, update: Callable[[float], None]) -> int:
+        NOW = self._clock()
+
+        if self._frame_start is None:
+            self._frame_start = NOW
+
+        self._frame_time = NOW - self._frame_start
+        self._frame_start = NOW
+        self._accumulator += self._frame_time
+
+        self._substeps = 0
+
+        while self._accumulator >= self._fixed_delta_time and self._substeps < self._max_substeps:
+            update(self._fixed_delta_time)
+            self._accumulator -= self._fixed_delta_time
+            self._simulation_time += self._fixed_delta_time
+            self._substeps += 1
+
+        if self._accumulator >= self._fixed_delta_time:
+            dropped = self._accumulator - self._accumulator % self._fixed_delta_time
+            self._dropped_time += dropped
+            self._accumulator -= dropped
+
+        return self._substeps
+
+    def limit_frame_rate(self) -> None:
+        if self._target_frame_rate <= 0.0 or self._frame_start is None:
+            return
+
+        remaining = self._frame_start + 1.0 / self._target_frame_rate - self._clock()
+
+        if remaining > 0.0:
+            self._sleep(remaining)
\ No newline at end of file
@@ -0,0 +1,81 @@
+import os
+import glfw
+import ctypes
+
+class HeadlessContext:
+
+    BACKEND_EGL = "egl"
+    BACKEND_GLFW = "glfw"
+
+    _EGL_PLATFORM_SURFACELESS_MESA = 0x31DD
+
+    def __init__(self, backend: str, width: int, height: int) -> None:
+        self._backend = backend
+        self._window = None
+        self._egl_display = None
+        self._egl_context = None
+
+        if backend == HeadlessContext.BACKEND_EGL:
+            self._create_egl_context()
+        elif backend == HeadlessContext.BACKEND_GLFW:
+            self._create_glfw_context(width, height)
+        else:
+            raise ValueError(f"Unknown headless backend '{backend}'.")
+
+    def get_backend(self) -> str:
+        return self._backend
+
+    def free(self) -> None:
+        if self._egl_context is not None:
+            from OpenGL import EGL
+
+            EGL.eglMakeCurrent(self._egl_display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT)
+            EGL.eglDestroyContext(self._egl_display, self._egl_context)
+            EGL.eglTerminate(self._egl_display)
+            self._egl_context = None
+
+        if self._window is not None:
+            glfw.destroy_window(self._window)
+            glfw.terminate()
+            self._window = None
+
+    def _create_egl_context(self) -> None:
+        if os.environ.get("PYOPENGL_PLATFORM") != HeadlessContext.BACKEND_EGL:
+            raise RuntimeError("The EGL backend requires PYOPENGL_PLATFORM=egl to be set before OpenGL is imported.")
+
+        from OpenGL import EGL
+        from OpenGL.EGL.EXT.platform_base import eglGetPlatformDisplayEXT
+
+        display = eglGetPlatformDisplayEXT(HeadlessContext._EGL_PLATFORM_SURFACELESS_MESA, EGL.EGL_DEFAULT_DISPLAY, None)
+        major, minor = EGL.EGLint(), EGL.EGLint()
+
+        if not display or not EGL.eglInitialize(display, ctypes.pointer(major), ctypes.pointer(minor)):
+            raise RuntimeError("Unable to initialize a surfaceless EGL display.")
+
+        attributes = (EGL.EGLint * 3)(EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT, EGL.EGL_NONE)
+        config = EGL.EGLConfig()
+        config_count = EGL.EGLint()
+
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+        EGL.eglChooseConfig(display, attributes, ctypes.pointer(config), 1, ctypes.pointer(config_count))
+
+        context = EGL.eglCreateContext(display, config if config_count.value else EGL.EGLConfig(), EGL.EGL_NO_CONTEXT, None)
+
+        if not context or not EGL.eglMakeCurrent(display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, context):
+            raise RuntimeError("Unable to create a surfaceless EGL context.")
+
+        self._egl_display = display
+        self._egl_context = context
+
+    def _create_glfw_context(self, width: int, height: int) -> None:
+        if not glfw.init():
+            raise RuntimeError("Unable to initialize GLFW for a hidden window.")
+
+        glfw.window_hint(glfw.VISIBLE, glfw.FALSE)
+        self._window = glfw.create_window(width, height, "", None, None)
+
+        if not self._window:
+            glfw.terminate()
+            raise RuntimeError("Unable to create a hidden GLFW window.")
+
+        glfw.make_context_current(self._window)
\ No newline at end of file
@@ -0,0 +1,312 @@
+import math
+import numpy as np
+from OpenGL.GL import *
+
+from ..api.light import Light
+from .preferences import Preferences
+
+class LightManager:
+
+    MAX_SLOTS = 8
+    MAX_SHADER_LIGHTS = 16
+    SHADER_LIGHT_VECTORS = 4
+
+    _DENSE_LIMIT = 1 << 20
+
+    _lights = []
+    _parameters = []
+    _rows = {}
+    _assignments = []
+    _assignment_key = None
+    _default_row = ()
+    _bound_row = None
+    _slots = [None] * MAX_SLOTS
+    _slot_indices = [-1] * MAX_SLOTS
+    _slot_parameters = [None] * MAX_SLOTS
+    _slot_mask = [0.0] * MAX_SLOTS
+    _slot_revision = 0
+    _uploads = 0
+    _binds_avoided = 0
+    _shader_lights = np.zeros((MAX_SHADER_LIGHTS * SHADER_LIGHT_VECTORS, 4), dtype=np.float32)
+    _shader_light_count = 0
+    _shader_light_keys = None
+    _shader_revision = 0
+
+    @classmethod
+    def get_lights(cls) -> list[Light]:
+        return cls._lights
+
+    @classmethod
+    def get_lights_for(cls, entity: 'Entity') -> list[Light]:
+        return [cls._lights[index] for index in cls.get_row(entity)]
+
+    @classmethod
+    def get_row(cls, entity: 'Entity') -> tuple[int, ...]:
+        index = cls._rows.get(entity)
+        return cls._default_row if index is None else cls._assignments[index]
+
+    @classmethod
+    def get_slot_mask(cls) -> list[float]:
+        return cls._slot_mask
+
+    @classmethod
+    def get_slot_revision(cls) -> int:
+        return cls._slot_revision
+
+    @classmethod
+    def get_uploads(cls) -> int:
+        return cls._uploads
+
+    @classmethod
+    def get_binds_avoided(cls) -> int:
+        return cls._binds_avoided
+
+    @classmethod
+    def get_shader_lights(cls) -> tuple[np.ndarray, int]:
+        return cls._shader_lights, cls._shader_light_count
+
+    @classmethod
+    def get_shader_revision(cls) -> int:
+        return cls._shader_revision
+
+    @classmethod
+    def update(cls, scene: 'Scene', camera_position: np.ndarray) -> None:
+        cls._uploads = 0
+        cls._binds_avoided = 0
+        cls._bound_row = None
+        cls._lights = [light for light in scene.get_lights() if light._is_active]
+        cls._parameters = [LightManager._get_parameters(light) for light in cls._lights]
+
+        COUNT = len(cls._lights)
+
+        indices = {light: index for index, light in enumerate(cls._lights)}
+
+        for slot, light in enumerate(cls._slots):
+            index = indices.get(light, -1)
+            cls._slot_indices[slot] = index if index >= 0 and cls._parameters[index] == cls._slot_parameters[slot] else -1
+
+        positions = np.array([parameters[0][:3] for parameters in cls._parameters], dtype=np.float64).reshape(-1, 3)
+        attenuations = np.array([parameters[2] for parameters in cls._parameters], dtype=np.float64).reshape(-1, 3)
+        intensities = np.array([max(parameters[1][:3]) for parameters in cls._parameters], dtype=np.float64)
+        ranges = LightManager.compute_ranges(intensities, attenuations, Preferences.get_light_influence_threshold())
+        ranges[[light.get_type() is Light.Type.DIRECTIONAL for light in cls._lights]] = np.inf
+
+        camera_influences = LightManager.compute_influences(intensities, attenuations, np.linalg.norm(positions - camera_position, axis=1), np.full(COUNT, np.inf))
+        by_camera = np.argsort(-camera_influences, kind='stable')
+
+        SLOT_COUNT = min(Preferences.get_max_lights_per_object(), LightManager.MAX_SLOTS)
+        cls._default_row = tuple(sorted(by_camera[:SLOT_COUNT].tolist()))
+
+        assignment_key = (scene, scene.get_bounds_version(), len(scene.get_bounded_entities()), SLOT_COUNT, Preferences.get_light_influence_threshold(), cls._lights, cls._parameters)
+
+        if assignment_key != cls._assignment_key:
+            cls._assign(scene, positions, attenuations, intensities, ranges, SLOT_COUNT)
+            cls._assignment_key = assignment_key
+
+        cls._pack(by_camera[:LightManager.MAX_SHADER_LIGHTS].tolist())
+
+    @classmethod
+    def bind(cls, entity: 'Entity') -> None:
+        cls._bind_row(cls.get_row(entity))
+
+    @classmethod
+    def bind_default(cls) -> None:
+        cls._bind_row(cls._default_row)
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._lights = []
+        cls._parameters = []
+        cls._rows = {}
+        cls._assignments = []
+        cls._assignment_key = None
+        cls._default_row = ()
+        cls._bound_row = None
+        cls._slots = [None] * LightManager.MAX_SLOTS
+        cls._slot_indices = [-1] * LightManager.MAX_SLOTS
+        cls._slot_parameters = [None] * LightManager.MAX_SLOTS
+        cls._slot_mask = [0.0] * LightManager.MAX_SLOTS
+        cls._slot_revision += 1
+        cls._shader_light_count = 0
+        cls._shader_light_keys = None
+        cls._shader_revision += 1
+
+    @staticmethod
+    def compute_ranges(intensities: np.ndarray, attenuations: np.ndarray, threshold: float) -> np.ndarray:
+        constant, linear, quadratic = attenuations[:, 0], attenuations[:, 1], attenuations[:, 2]
+        limit = intensities / threshold - constant
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            quadratic_range = (-linear + np.sqrt(np.maximum(linear * linear + 4.0 * quadratic * limit, 0.0))) / (2.0 * quadratic)
+            linear_range = limit / linear
+
+        ranges = np.where(quadratic > 0.0, quadratic_range, np.where(linear > 0.0, linear_range, np.inf))
+        return np.where(limit > 0.0, ranges, 0.0)
+
+    @staticmethod
+    def compute_influences(intensities: np.ndarray, attenuations: np.ndarray, distances: np.ndarray, ranges: np.ndarray) -> np.ndarray:
+        distances = np.maximum(distances, 0.0)
+        influences = intensities / np.maximum(attenuations[..., 0] + attenuations[..., 1] * distances + attenuations[..., 2] * distances * distances, 1e-6)
+        return np.where((distances <= ranges) & (ranges > 0.0), influences, 0.0)
+
+    @classmethod
+    def _assign(cls, scene: 'Scene', positions: np.ndarray, attenuations: np.ndarray, intensities: np.ndarray, ranges: np.ndarray, slot_count: int) -> None:
+        entities = scene.get_bounded_entities()
+
+        if not entities or not cls._lights:
+            cls._rows = {}
+            cls._assignments = []
+            return
+
+        bounds_min, bounds_max = scene.get_bounds()
+        centers = (bounds_min + bounds_max) * 0.5
+        radii = np.linalg.norm(bounds_max - bounds_min, axis=1) * 0.5
+
+        if len(entities) * len(cls._lights) <= LightManager._DENSE_LIMIT:
+            squared = np.einsum('ij,ij->i', centers, centers)[:, np.newaxis] - 2.0 * (centers @ positions.T) + np.einsum('ij,ij->i', positions, positions)
+            distances = np.sqrt(np.maximum(squared, 0.0, out=squared), out=squared) - radii[:, np.newaxis]
+            cls._assignments = LightManager._select_dense(LightManager.compute_influences(intensities, attenuations, distances, ranges), slot_count)
+        else:
+            is_global = np.isinf(ranges)
+            local = np.flatnonzero(~is_global & (ranges > 0.0))
+            global_lights = np.flatnonzero(is_global)
+
+            light_indices, entity_indices = scene.query_overlaps(positions[local] - ranges[local, np.newaxis], positions[local] + ranges[local, np.newaxis])
+            light_indices = np.concatenate((local[light_indices], np.tile(global_lights, len(entities))))
+            entity_indices = np.concatenate((entity_indices, np.repeat(np.arange(len(entities)), global_lights.size)))
+
+            distances = np.linalg.norm(centers[entity_indices] - positions[light_indices], axis=1) - radii[entity_indices]
+            influences = LightManager.compute_influences(intensities[light_indices], attenuations[light_indices], distances, ranges[light_indices])
+            cls._assignments = LightManager._select_sorted(entity_indices, light_indices, influences, len(entities), slot_count)
+
+        cls._rows = {entity: index for index, entity in enumerate(entities)}
+
+    @staticmethod
+    def _select_dense(influences: np.ndarray, slot_count: int) -> list[tuple[int, ...]]:
+        ENTITY_COUNT, LIGHT_COUNT = influences.shape
+
+        if slot_count < LIGHT_COUNT:
+            selected = np.argpartition(-influences, slot_count - 1, axis=1)[:, :slot_count]
+        else:
+            selected = np.broadcast_to(np.arange(LIGHT_COUNT), (ENTITY_COUNT, LIGHT_COUNT))
+
+        selected = np.where(np.take_along_axis(influences, selected, axis=1) > 0.0, selected, LIGHT_COUNT)
+        selected = np.sort(selected, axis=1)
+        counts = (selected < LIGHT_COUNT).sum(axis=1).tolist()
+
+        return [tuple(row[:count]) for row, count in zip(selected.tolist(), counts)]
+
+    @staticmethod
+    def _select_sorted(entity_indices: np.ndarray, light_indices: np.ndarray, influences: np.ndarray, entity_count: int, slot_count: int) -> list[tuple[int, ...]]:
+        order = np.lexsort((-influences, entity_indices))
+        light_indices, entity_indices, influences = light_indices[order], entity_indices[order], influences[order]
+
+        starts = np.searchsorted(entity_indices, entity_indices, side='left')
+        selected = ((np.arange(entity_indices.size) - starts) < slot_count) & (influences > 0.0)
+        light_indices, entity_indices = light_indices[selected], entity_indices[selected]
+
+        order = np.lexsort((light_indices, entity_indices))
+        light_indices, entity_indices = light_indices[order].tolist(), entity_indices[order]
+
+        offsets = np.searchsorted(entity_indices, np.arange(entity_count + 1)).tolist()
+
+        return [tuple(light_indices[offsets[index]:offsets[index + 1]]) for index in range(entity_count)]
+
+    @classmethod
+    def _bind_row(cls, row: tuple[int, ...]) -> None:
+        if row == cls._bound_row:
+            cls._binds_avoided += 1
+            return
+
+        cls._bound_row = row
+        pending = [index for index in row if index not in cls._slot_indices]
+        free = [slot for slot, index in enumerate(cls._slot_indices) if index not in row]
+
+        if pending:
+            glLoadIdentity()
+
+        for slot, index in zip(free, pending):
+            parameters = cls._parameters[index]
+            LightManager._upload(GL_LIGHT0 + slot, parameters, cls._slot_parameters[slot])
+
+            if cls._lights[index]._render_delegate_light is not None:
+                cls._lights[index]._render_delegate_light()
+
+            if cls._slot_parameters[slot] is None:
+                cls._slot_mask[slot] = 1.0
+                cls._slot_revision += 1
+
+            cls._slots[slot] = cls._lights[index]
+            cls._slot_indices[slot] = index
+            cls._slot_parameters[slot] = parameters
+            cls._uploads += 1
+
+        for slot in free[len(pending):]:
+            if cls._slot_parameters[slot] is not None:
+                glDisable(GL_LIGHT0 + slot)
+                cls._slot_mask[slot] = 0.0
+                cls._slot_revision += 1
+                cls._slots[slot] = None
+                cls._slot_indices[slot] = -1
+                cls._slot_parameters[slot] = None
+
+    @classmethod
+    def _pack(cls, indices: list[int]) -> None:
+        keys = [(cls._lights[index], cls._parameters[index]) for index in indices]
+
+        if keys == cls._shader_light_keys:
+            return
+
+        cls._shader_light_keys = keys
+        cls._shader_light_count = len(indices)
+        cls._shader_revision += 1
+
+        packed = cls._shader_lights.reshape(LightManager.MAX_SHADER_LIGHTS, LightManager.SHADER_LIGHT_VECTORS, 4)
+        packed[:] = 0.0
+
+        for slot, (_, parameters) in enumerate(keys):
+            position, color, attenuation, spot, direction = parameters
+            cutoff, exponent = spot
+
+            packed[slot, 0] = position
+            packed[slot, 1] = color
+            packed[slot, 2] = [*attenuation, exponent]
+            packed[slot, 3] = [*direction, math.cos(math.radians(cutoff)) if cutoff <= 90.0 else -2.0]
+
+    @staticmethod
+    def _get_parameters(light: Light) -> tuple[tuple[float, ...], ...]:
+        return (
+            (*light.get_transform().get_world_position().tolist(), 0.0 if light.get_type() is Light.Type.DIRECTIONAL else 1.0),
+            tuple(light.get_color()),
+            tuple(light.get_attenuation()),
+            tuple(light.get_spot()),
+            tuple(light.get_transform().get_vector_forward().tolist()) if light.get_type() is Light.Type.SPOT else (0.0, 0.0, -1.0),
+        )
+
+    @staticmethod
+    def _upload(source: int, parameters: tuple[tuple[float, ...], ...], previous: tuple[tuple[float, ...], ...] | None) -> None:
+        position, color, attenuation, spot, direction = parameters
+
+        if previous is None:
+            glEnable(source)
+            previous = (None, None, None, None, None)
+
+        if position != previous[0]:
+            glLightfv(source, GL_POSITION, position)
+
+        if color != previous[1]:
+            glLightfv(source, GL_AMBIENT, color)
+            glLightfv(source, GL_DIFFUSE, color)
+            glLightfv(source, GL_SPECULAR, color)
+
+        if attenuation != previous[2]:
+            glLightf(source, GL_CONSTANT_ATTENUATION, attenuation[0])
+            glLightf(source, GL_LINEAR_ATTENUATION, attenuation[1])
+            glLightf(source, GL_QUADRATIC_ATTENUATION, attenuation[2])
+
+        if spot != previous[3]:
+            glLightf(source, GL_SPOT_CUTOFF, spot[0])
+            glLightf(source, GL_SPOT_EXPONENT, spot[1])
+
+        if direction != previous[4]:
+            glLightfv(source, GL_SPOT_DIRECTION, direction)
\ No newline at end of file
@@ -1,58 +1,164 @@
+import os
+import time
+import numpy as np
 from PIL import Image
+from collections import deque
+from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor
 
 from ..graphics.mesh import Mesh
+from .obj_parser import ObjParser
+from .mesh_cache import MeshCache
+from .texture_cooker import TextureCooker
+from .preferences import Preferences
+from .asset_request import AssetRequest
 from ..graphics.texture import Texture
+from ..graphics.geometry import Geometry
+from ..graphics.mesh_simplifier import MeshSimplifier
+from ..graphics.texture_cache import TextureCache
 
 class Loader:
 
+    _executor = None
+    _pending_requests = deque()
+
     @staticmethod
     def load_mesh(relative_path: str) -> Mesh:
-        CHAR_FACE = 'f'
-        CHAR_VERTEX = 'v'
-        CHAR_NORMAL = 'vn'
-        CHAR_COMMENT = '#'
-        CHAR_SEPARATOR = '/'
-        CHAR_TEXCOORDS = 'vt'
-
-        INDEX_VERTEX = 0
-        INDEX_TEXCOORD = 1
-        INDEX_NORMAL = 2
+        return Mesh.from_levels(*Loader.load_mesh_levels(relative_path), Preferences.get_mesh_quantization_enabled(), Preferences.get_mesh_retain_geometry())
 
-        faces = []
-        normals = []
-        vertices = []
-        texcoords = []
+    @staticmethod
+    def load_mesh_buffers(relative_path: str) -> tuple[np.ndarray, np.ndarray, int]:
+        levels, attributes = Loader.load_mesh_levels(relative_path)
+        return *levels[0], attributes
 
-        with open(relative_path, 'r') as file_stream:
-            for line in file_stream:
+    @staticmethod
+    def load_mesh_levels(relative_path: str) -> tuple[list[tuple[np.ndarray, np.ndarray]], int]:
+        LOD_LEVELS = Preferences.get_lod_levels()
+        LOD_REDUCTION = Preferences.get_lod_reduction()
 
-                if not line.startswith(CHAR_COMMENT):
-                    values = line.split()
+        if Preferences.get_mesh_cache_enabled():
+            cached = MeshCache.load(relative_path, LOD_LEVELS, LOD_REDUCTION)
 
-                    if values:
-                        if values[0] == CHAR_VERTEX:
-                            vertices.append(list(map(float, values[1:4])))
-                        elif values[0] == CHAR_NORMAL:
-                            normals.append(list(map(float, values[1:4])))
-                        elif values[0] == CHAR_TEXCOORDS:
-                            texcoords.append(list(map(float, values[1:3])))
-                        elif values[0] == CHAR_FACE:
+            if cached is not None:
+                return cached
 
-                            face = []
-                            norms = []
-                            texcoords_face = []
+        vertex_buffer, index_buffer, attributes = Geometry.build_indexed(*Loader.parse_mesh(relative_path))
+        levels = MeshSimplifier.build_lod_chain(vertex_buffer, index_buffer, LOD_LEVELS, LOD_REDUCTION)
 
-                            for value in values[1:]:
-                                face_components = value.split(CHAR_SEPARATOR)
+        if Preferences.get_mesh_cache_enabled():
+            MeshCache.store(relative_path, levels, attributes, LOD_LEVELS, LOD_REDUCTION)
 
-                                face.append(int(face_components[INDEX_VERTEX]))
-                                norms.append((int(face_components[INDEX_NORMAL]) if len(face_components) >= 3 and face_components[INDEX_NORMAL] else 0))
-                                texcoords_face.append((int(face_components[INDEX_TEXCOORD]) if len(face_components) >= 2 and face_components[INDEX_TEXCOORD] else 0))
+        return levels, attributes
 
-                            faces.append((face, norms, texcoords_face))
+    @staticmethod
+    def parse_mesh(relative_path: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        if os.path.getsize(relative_path) >= Preferences.get_parallel_parse_threshold() and Preferences.get_parser_process_count() != 1:
+            return ObjParser.parse_parallel(relative_path, Preferences.get_parser_process_count())
 
-        return Mesh(faces, normals, vertices, texcoords)
+        return ObjParser.parse(relative_path)
 
     @staticmethod
     def load_texture(relative_path: str) -> Texture:
-        return Texture(Image.open(relative_path))
\ No newline at end of file
+        TEXTURE_FORMAT = Loader._get_texture_format()
+        return TextureCache.get_or_create(Loader._get_texture_key(relative_path, TEXTURE_FORMAT), lambda: Loader._create_texture(relative_path, TEXTURE_FORMAT))
+
+    @staticmethod
+    def load_mesh_async(relative_path: str) -> AssetRequest:
+        return Loader._submit(relative_path, Loader.load_mesh_levels, lambda loaded: Mesh.from_levels(*loaded, Preferences.get_mesh_quantization_enabled(), Preferences.get_mesh_retain_geometry()))
+
+    @staticmethod
+    def load_texture_async(relative_path: str) -> AssetRequest:
+        TEXTURE_FORMAT = Loader._get_texture_format()
+        return Loader._submit(relative_path, lambda path: Loader._decode_texture(path, TEXTURE_FORMAT), lambda decoded: Loader._upload_texture(relative_path, TEXTURE_FORMAT, *decoded))
+
+    @staticmethod
+    def get_pending_count() -> int:
+        return len(Loader._pending_requests)
+
+    @staticmethod
+    def process_uploads(budget: float) -> int:
+        START_TIME = time.perf_counter()
+        uploaded = 0
+
+        while Loader._pending_requests and Loader._pending_requests[0].is_ready_for_upload():
+            Loader._pending_requests.popleft()._complete()
+            uploaded += 1
+
+            if time.perf_counter() - START_TIME >= budget:
+                break
+
+        return uploaded
+
+    @staticmethod
+    def wait_for_uploads() -> int:
+        uploaded = 0
+
+        while Loader._pending_requests:
+            Loader._pending_requests.popleft().wait_for_upload()
+            uploaded += 1
+
+        return uploaded
+
+    @staticmethod
+    def shutdown() -> None:
+        if Loader._executor is not None:
+            Loader._executor.shutdown(wait=True, cancel_futures=True)
+            Loader._executor = None
+
+        Loader._pending_requests.clear()
+
+    @staticmethod
+    def _submit(relative_path: str, load: Callable[[str], Any], upload: Callable[[Any], Any]) -> AssetRequest:
+        if Loader._executor is None:
+            Loader._executor = ThreadPoolExecutor(max_workers=Preferences.get_loader_worker_count(), thread_name_prefix="ngen-loader")
+
+        request = AssetRequest(relative_path, Loader._executor.submit(load, relative_path), upload)
+        Loader._pending_requests.append(request)
+        return request
+
+    @staticmethod
+    def _get_texture_format() -> str | None:
+        if not Preferences.get_texture_cooking_enabled():
+            return None
+
+        TEXTURE_FORMAT = Preferences.get_texture_format()
+        return TEXTURE_FORMAT if Texture.supports_format(TEXTURE_FORMAT) else "rgba8"
+
+    @staticmethod
+    def _get_texture_key(relative_path: str, texture_format: str | None) -> bytes:
+        KEY = TextureCache.get_content_key(relative_path)
+
+        if texture_format is None:
+            return KEY
+
+        return KEY + f":{texture_format}:{Preferences.get_texture_max_resolution()}".encode()
+
+    @staticmethod
+    def _create_texture(relative_path: str, texture_format: str | None) -> Texture:
+        if texture_format is None:
+            return Texture(Image.open(relative_path))
+
+        return Texture.from_levels(TextureCooker.load_or_cook(relative_path, texture_format, Preferences.get_texture_max_resolution()), texture_format)
+
+    @staticmethod
+    def _decode_texture(relative_path: str, texture_format: str | None) -> tuple[bytes, tuple[int, int, bytes] | list[tuple[int, int, np.ndarray]] | None]:
+        KEY = Loader._get_texture_key(relative_path, texture_format)
+
+        if TextureCache.contains(KEY):
+            return KEY, None
+
+        if texture_format is not None:
+            return KEY, TextureCooker.load_or_cook(relative_path, texture_format, Preferences.get_texture_max_resolution())
+
+        with Image.open(relative_path) as image:
+            return KEY, Texture.decode(image)
+
+    @staticmethod
+    def _upload_texture(relative_path: str, texture_format: str | None, key: bytes, decoded: tuple[int, int, bytes] | list[tuple[int, int, np.ndarray]] | None) -> Texture:
+        if decoded is None:
+            return TextureCache.get_or_create(key, lambda: Loader._create_texture(relative_path, texture_format))
+
+        if texture_format is None:
+            return TextureCache.get_or_create(key, lambda: Texture.from_pixels(*decoded))
+
+        return TextureCache.get_or_create(key, lambda: Texture.from_levels(decoded, texture_format))
\ No newline at end of file
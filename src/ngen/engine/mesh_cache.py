@@ -0,0 +1,99 @@
+import os
+import numpy as np
+
+from ..graphics.geometry import Geometry
+from ..graphics.cache_file import CacheFile
+
+class MeshCache:
+
+    EXTENSION = ".ngmesh"
+
+    _MAGIC = b"NGMESH"
+    _VERSION = 2
+    _HEADER_SIZE = 256
+    _MAX_LEVELS = 8
+
+    _HEADER = np.dtype([
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("attributes", "<u4"),
+        ("source_mtime_ns", "<i8"),
+        ("source_size", "<i8"),
+        ("source_hash", "u1", (32,)),
+        ("vertex_components", "<u4"),
+        ("lod_levels", "<u4"),
+        ("lod_reduction", "<f8"),
+        ("level_count", "<u4"),
+        ("vertex_counts", "<u8", (_MAX_LEVELS,)),
+        ("index_counts", "<u8", (_MAX_LEVELS,)),
+    ])
+
+    @staticmethod
+    def get_cache_path(source_path: str) -> str:
+        return source_path + MeshCache.EXTENSION
+
+    @staticmethod
+    def load(source_path: str, lod_levels: int, lod_reduction: float) -> tuple[list[tuple[np.ndarray, np.ndarray]], int] | None:
+        cache_path = MeshCache.get_cache_path(source_path)
+
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            data = np.memmap(cache_path, dtype=np.uint8, mode='r')
+        except (OSError, ValueError):
+            return None
+
+        if data.size < MeshCache._HEADER_SIZE:
+            return None
+
+        header = data[:MeshCache._HEADER.itemsize].view(MeshCache._HEADER)[0]
+
+        if header["magic"] != MeshCache._MAGIC or header["version"] != MeshCache._VERSION or header["vertex_components"] != Geometry.VERTEX_COMPONENTS:
+            return None
+
+        if header["lod_levels"] != lod_levels or header["lod_reduction"] != lod_reduction or not 0 < header["level_count"] <= MeshCache._MAX_LEVELS:
+            return None
+
+        if not CacheFile.is_source_unchanged(source_path, cache_path, header):
+            return None
+
+        levels = []
+        offset = MeshCache._HEADER_SIZE
+
+        for vertex_count, index_count in zip(header["vertex_counts"][:header["level_count"]].tolist(), header["index_counts"][:header["level_count"]].tolist()):
+            index_offset = offset + vertex_count * Geometry.VERTEX_STRIDE
+            end = index_offset + index_count * np.dtype(np.uint32).itemsize
+
+            if end > data.size:
+                return None
+
+            vertex_buffer = data[offset:index_offset].view(np.float32).reshape(vertex_count, Geometry.VERTEX_COMPONENTS)
+            index_buffer = data[index_offset:end].view(np.uint32)
+
+            levels.append((vertex_buffer, index_buffer))
+            offset = end
+
+        if offset != data.size:
+            return None
+
+        return levels, int(header["attributes"])
+
+    @staticmethod
+    def store(source_path: str, levels: list[tuple[np.ndarray, np.ndarray]], attributes: int, lod_levels: int, lod_reduction: float) -> bool:
+        if not 0 < len(levels) <= MeshCache._MAX_LEVELS:
+            return False
+
+        header = np.zeros(1, dtype=MeshCache._HEADER)
+        header["magic"] = MeshCache._MAGIC
+        header["version"] = MeshCache._VERSION
+        header["attributes"] = attributes
+        header["vertex_components"] = Geometry.VERTEX_COMPONENTS
+        header["lod_levels"] = lod_levels
+        header["lod_reduction"] = lod_reduction
+        header["level_count"] = len(levels)
+        header["vertex_counts"][0, :len(levels)] = [vertex_buffer.shape[0] for vertex_buffer, _ in levels]
+        header["index_counts"][0, :len(levels)] = [index_buffer.size for _, index_buffer in levels]
+
+        chunks = (chunk for vertex_buffer, index_buffer in levels for chunk in (np.ascontiguousarray(vertex_buffer, dtype=np.float32), np.ascontiguousarray(index_buffer, dtype=np.uint32)))
+        return CacheFile.write(MeshCache.get_cache_path(source_path), source_path, header, MeshCache._HEADER_SIZE, chunks)
\ No newline at end of file
@@ -0,0 +1,314 @@
+import os
+import numpy as np
+from multiprocessing import resource_tracker, shared_memory
+from concurrent.futures import ProcessPoolExecutor
+
+class ObjParser:
+
+    _ASCII_TAB = 9
+    _ASCII_NEWLINE = 10
+    _ASCII_CARRIAGE_RETURN = 13
+    _ASCII_SPACE = 32
+    _ASCII_HASH = 35
+    _ASCII_MINUS = 45
+    _ASCII_SLASH = 47
+    _ASCII_ZERO = 48
+    _ASCII_NINE = 57
+    _ASCII_FACE = ord('f')
+    _ASCII_VERTEX = ord('v')
+    _ASCII_NORMAL = ord('n')
+    _ASCII_TEXCOORDS = ord('t')
+
+    _CORNER_COMPONENTS = 3
+    _MIN_CHUNK_SIZE = 1 << 20
+
+    @staticmethod
+    def parse(relative_path: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        with open(relative_path, 'rb') as file_stream:
+            return ObjParser.parse_bytes(file_stream.read())
+
+    @staticmethod
+    def parse_parallel(relative_path: str, worker_count: int = None) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        worker_count = worker_count or os.cpu_count() or 1
+        chunks = ObjParser.split_chunks(relative_path, worker_count)
+
+        if len(chunks) == 1:
+            return ObjParser.parse(relative_path)
+
+        resource_tracker.ensure_running()
+
+        with ProcessPoolExecutor(max_workers=min(worker_count, len(chunks))) as executor:
+            descriptors = list(executor.map(ObjParser._parse_chunk, [relative_path] * len(chunks), *zip(*chunks)))
+
+        return ObjParser._merge_chunks([[ObjParser._collect(descriptor) for descriptor in chunk] for chunk in descriptors])
+
+    @staticmethod
+    def split_chunks(relative_path: str, chunk_count: int) -> list[tuple[int, int]]:
+        SIZE = os.path.getsize(relative_path)
+        chunk_count = max(1, min(chunk_count, SIZE // ObjParser._MIN_CHUNK_SIZE))
+        boundaries = [0]
+
+        with open(relative_path, 'rb') as file_stream:
+            for chunk in range(1, chunk_count):
+                file_stream.seek(max(boundaries[-1], SIZE * chunk // chunk_count))
+                file_stream.readline()
+                boundary = file_stream.tell()
+
+                if boundary < SIZE:
+                    boundaries.append(boundary)
+
+        boundaries.append(SIZE)
+        return list(zip(boundaries[:-1], boundaries[1:]))
+
+    @staticmethod
+    def parse_bytes(data: bytes) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        return ObjParser._parse_records(data)[:5]
+
+    @staticmethod
+    def _parse_records(data: bytes) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray | None]:
+        buffer = np.frombuffer(data, dtype=np.uint8)
+
+        if buffer.size == 0 or buffer[-1] != ObjParser._ASCII_NEWLINE:
+            buffer = np.append(buffer, np.uint8(ObjParser._ASCII_NEWLINE))
+
+        buffer = ObjParser._strip_lines(buffer)
+
+        line_ends = np.flatnonzero(buffer == ObjParser._ASCII_NEWLINE)
+        line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+        line_lengths = line_ends - line_starts + 1
+
+        last = buffer.size - 1
+        first = buffer[line_starts]
+        second = buffer[np.minimum(line_starts + 1, last)]
+        third = buffer[np.minimum(line_starts + 2, last)]
+
+        is_vertex_record = first == ObjParser._ASCII_VERTEX
+        is_vertex = is_vertex_record & ObjParser._is_separator(second)
+        is_normal = is_vertex_record & (second == ObjParser._ASCII_NORMAL) & ObjParser._is_separator(third)
+        is_texcoord = is_vertex_record & (second == ObjParser._ASCII_TEXCOORDS) & ObjParser._is_separator(third)
+        is_face = (first == ObjParser._ASCII_FACE) & ObjParser._is_separator(second)
+
+        vertices = ObjParser._parse_floats(buffer, line_lengths, is_vertex, 1, 3)
+        normals = ObjParser._parse_floats(buffer, line_lengths, is_normal, 2, 3)
+        texcoords = ObjParser._parse_floats(buffer, line_lengths, is_texcoord, 2, 2)
+
+        faces, face_offsets, relative = ObjParser._parse_faces(buffer, line_lengths, is_face, (np.cumsum(is_vertex), np.cumsum(is_texcoord), np.cumsum(is_normal)))
+
+        return faces, face_offsets, normals, vertices, texcoords, relative
+
+    @staticmethod
+    def _parse_chunk(relative_path: str, start: int, stop: int) -> list[tuple[str, str, tuple[int, ...]] | None]:
+        with open(relative_path, 'rb') as file_stream:
+            file_stream.seek(start)
+            data = file_stream.read(stop - start)
+
+        return [None if array is None else ObjParser._share(array) for array in ObjParser._parse_records(data)]
+
+    @staticmethod
+    def _share(array: np.ndarray) -> tuple[str, str, tuple[int, ...]]:
+        memory = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)[...] = array
+        memory.close()
+        return memory.name, array.dtype.str, array.shape
+
+    @staticmethod
+    def _collect(descriptor: tuple[str, str, tuple[int, ...]] | None) -> np.ndarray | None:
+        if descriptor is None:
+            return None
+
+        name, dtype, shape = descriptor
+        memory = shared_memory.SharedMemory(name=name)
+
+        try:
+            return np.ndarray(shape, dtype=dtype, buffer=memory.buf).copy()
+        finally:
+            memory.close()
+            memory.unlink()
+
+    @staticmethod
+    def _merge_chunks(chunks: list[list[np.ndarray | None]]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        faces = []
+        face_offsets = [np.zeros(1, dtype=np.int32)]
+        record_bases = np.zeros(ObjParser._CORNER_COMPONENTS, dtype=np.int32)
+        corner_base = 0
+
+        for chunk_faces, chunk_face_offsets, chunk_normals, chunk_vertices, chunk_texcoords, relative in chunks:
+            if relative is not None:
+                chunk_faces = np.where(relative, chunk_faces + record_bases, chunk_faces).astype(np.int32)
+
+            faces.append(chunk_faces)
+            face_offsets.append(chunk_face_offsets[1:] + np.int32(corner_base))
+            corner_base += chunk_faces.shape[0]
+            record_bases += (chunk_vertices.shape[0], chunk_texcoords.shape[0], chunk_normals.shape[0])
+
+        return (
+            np.concatenate(faces),
+            np.concatenate(face_offsets),
+            np.concatenate([chunk[2] for chunk in chunks]),
+            np.concatenate([chunk[3] for chunk in chunks]),
+            np.concatenate([chunk[4] for chunk in chunks]),
+        )
+
+    @staticmethod
+    def _strip_lines(buffer: np.ndarray) -> np.ndarray:
+        comments = np.flatnonzero(buffer == ObjParser._ASCII_HASH)
+        comments = comments[(comments > 0) & (buffer[comments - 1] != ObjParser._ASCII_NEWLINE)]
+        is_indented = ObjParser._is_separator(buffer[0]) or ObjParser._is_separator(buffer[1:][buffer[:-1] == ObjParser._ASCII_NEWLINE]).any()
+
+        if comments.size == 0 and not is_indented:
+            return buffer
+
+        line_ends = np.flatnonzero(buffer == ObjParser._ASCII_NEWLINE)
+
+        if comments.size:
+            comment_ends = line_ends[np.searchsorted(line_ends, comments)]
+            is_first = np.concatenate(([True], comment_ends[1:] != comment_ends[:-1]))
+
+            buffer = buffer.copy()
+            buffer[ObjParser._expand_ranges(comments[is_first], comment_ends[is_first])] = ObjParser._ASCII_SPACE
+
+        indent_starts = np.concatenate(([0], line_ends[:-1] + 1))
+        indent_starts = indent_starts[ObjParser._is_separator(buffer[indent_starts])]
+        indent_ends = indent_starts.copy()
+        pending = np.arange(indent_ends.size)
+
+        while pending.size:
+            indent_ends[pending] += 1
+            pending = pending[ObjParser._is_separator(buffer[indent_ends[pending]])]
+
+        return np.delete(buffer, ObjParser._expand_ranges(indent_starts, indent_ends))
+
+    @staticmethod
+    def _expand_ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+        lengths = stops - starts
+        return np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(int(lengths.sum()))
+
+    @staticmethod
+    def _is_separator(values: np.ndarray) -> np.ndarray:
+        return (values == ObjParser._ASCII_SPACE) | (values == ObjParser._ASCII_TAB)
+
+    @staticmethod
+    def _is_whitespace(values: np.ndarray) -> np.ndarray:
+        return ObjParser._is_separator(values) | (values == ObjParser._ASCII_NEWLINE) | (values == ObjParser._ASCII_CARRIAGE_RETURN)
+
+    @staticmethod
+    def _select_lines(buffer: np.ndarray, line_lengths: np.ndarray, mask: np.ndarray, keyword_length: int) -> tuple[np.ndarray, np.ndarray]:
+        selected = buffer[np.repeat(mask, line_lengths)]
+        selected_lengths = line_lengths[mask]
+        selected_starts = np.cumsum(selected_lengths) - selected_lengths
+
+        for i in range(keyword_length):
+            selected[selected_starts + i] = ObjParser._ASCII_SPACE
+
+        return selected, selected_starts
+
+    @staticmethod
+    def _count_tokens(selected: np.ndarray, selected_starts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        is_token = ~ObjParser._is_whitespace(selected)
+        token_starts = is_token & ~np.concatenate(([False], is_token[:-1]))
+        return token_starts, np.add.reduceat(token_starts.astype(np.int64), selected_starts)
+
+    @staticmethod
+    def _parse_floats(buffer: np.ndarray, line_lengths: np.ndarray, mask: np.ndarray, keyword_length: int, components: int) -> np.ndarray:
+        if not mask.any():
+            return np.zeros((0, components), dtype=np.float32)
+
+        selected, selected_starts = ObjParser._select_lines(buffer, line_lengths, mask, keyword_length)
+        _, counts = ObjParser._count_tokens(selected, selected_starts)
+
+        if not counts.any():
+            return np.zeros((selected_starts.size, components), dtype=np.float32)
+
+        values = np.fromstring(selected.tobytes(), dtype=np.float32, sep=' ')
+
+        if (counts == components).all():
+            return values.reshape(-1, components)
+
+        offsets = np.cumsum(counts) - counts
+        result = np.zeros((counts.size, components), dtype=np.float32)
+
+        for component in range(components):
+            has_component = counts > component
+            result[has_component, component] = values[offsets[has_component] + component]
+
+        return result
+
+    @staticmethod
+    def _parse_faces(buffer: np.ndarray, line_lengths: np.ndarray, mask: np.ndarray, record_counts: tuple[np.ndarray, np.ndarray, np.ndarray]) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+        if not mask.any():
+            return np.zeros((0, ObjParser._CORNER_COMPONENTS), dtype=np.int32), np.zeros(1, dtype=np.int32), None
+
+        selected, selected_starts = ObjParser._select_lines(buffer, line_lengths, mask, 1)
+        corner_starts, corner_counts = ObjParser._count_tokens(selected, selected_starts)
+        corner_start_positions = np.flatnonzero(corner_starts)
+
+        raw = ObjParser._parse_uniform_corners(selected, corner_start_positions)
+
+        if raw is None:
+            raw = ObjParser._parse_mixed_corners(selected, corner_start_positions)
+
+        face_lines = np.flatnonzero(mask)
+        face_of_corner = np.repeat(np.arange(face_lines.size), corner_counts)
+
+        faces = np.full((raw.shape[0], ObjParser._CORNER_COMPONENTS), -1, dtype=np.int32)
+        relative = raw < 0
+
+        for component, counts in enumerate(record_counts[:raw.shape[1]]):
+            indices = raw[:, component]
+            faces[:, component] = np.where(indices > 0, indices - 1, np.where(indices < 0, counts[face_lines][face_of_corner] + indices, -1))
+
+        face_offsets = np.zeros(face_lines.size + 1, dtype=np.int32)
+        np.cumsum(corner_counts, out=face_offsets[1:])
+
+        if not relative.any():
+            return faces, face_offsets, None
+
+        padded = np.zeros(faces.shape, dtype=bool)
+        padded[:, :relative.shape[1]] = relative
+
+        return faces, face_offsets, padded
+
+    @staticmethod
+    def _parse_uniform_corners(selected: np.ndarray, corner_start_positions: np.ndarray) -> np.ndarray:
+        if corner_start_positions.size == 0:
+            return np.zeros((0, ObjParser._CORNER_COMPONENTS), dtype=np.int64)
+
+        slashes = np.add.reduceat(selected == ObjParser._ASCII_SLASH, corner_start_positions, dtype=np.int32)
+        components = int(slashes[0]) + 1
+
+        if components > ObjParser._CORNER_COMPONENTS or (slashes != slashes[0]).any():
+            return None
+
+        text = selected.tobytes().replace(b'//', b'/0/').replace(b'/', b' ')
+        values = np.fromstring(text, dtype=np.int64, sep=' ')
+
+        if values.size != corner_start_positions.size * components:
+            return None
+
+        return values.reshape(-1, components)
+
+    @staticmethod
+    def _parse_mixed_corners(selected: np.ndarray, corner_start_positions: np.ndarray) -> np.ndarray:
+        is_digit = (selected >= ObjParser._ASCII_ZERO) & (selected <= ObjParser._ASCII_NINE)
+        digit_positions = np.flatnonzero(is_digit)
+        run_starts = is_digit & ~np.concatenate(([False], is_digit[:-1]))
+        run_start_positions = np.flatnonzero(run_starts)
+
+        digits = selected[digit_positions].astype(np.int64) - ObjParser._ASCII_ZERO
+        runs_in_digits = np.flatnonzero(run_starts[digit_positions])
+        run_lengths = np.diff(np.append(runs_in_digits, digits.size))
+        run_of_digit = np.repeat(np.arange(runs_in_digits.size), run_lengths)
+        exponents = (runs_in_digits + run_lengths - 1)[run_of_digit] - np.arange(digits.size)
+
+        values = np.add.reduceat(digits * np.power(10, exponents, dtype=np.int64), runs_in_digits) if runs_in_digits.size else np.zeros(0, dtype=np.int64)
+        values[selected[run_start_positions - 1] == ObjParser._ASCII_MINUS] *= -1
+
+        slash_positions = np.flatnonzero(selected == ObjParser._ASCII_SLASH)
+        corner_of_run = np.searchsorted(corner_start_positions, run_start_positions, 'right') - 1
+        slots = np.searchsorted(slash_positions, run_start_positions) - np.searchsorted(slash_positions, corner_start_positions[corner_of_run])
+        in_range = slots < ObjParser._CORNER_COMPONENTS
+
+        raw = np.zeros((corner_start_positions.size, ObjParser._CORNER_COMPONENTS), dtype=np.int64)
+        raw[corner_of_run[in_range], slots[in_range]] = values[in_range]
+
+        return raw
\ No newline at end of file
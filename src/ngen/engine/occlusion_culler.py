@@ -0,0 +1,260 @@
+import numpy as np
+
+from ..api.scene import Scene
+from ..api.camera import Camera
+from ..api.entity import Entity
+from .preferences import Preferences
+
+class OcclusionCuller:
+
+    _FAR_DEPTH = 1.0
+    _SAMPLE_COUNT = 3
+    _FRAGMENT_BATCH_SIZE = 1 << 20
+    _DENSE_TRIANGLE_AREA = 1 << 12
+    _CORNERS = ((np.arange(8)[:, np.newaxis] >> np.arange(3)) & 1).astype(bool)
+
+    def __init__(self) -> None:
+        self._depth = np.full((0, 0), OcclusionCuller._FAR_DEPTH, dtype=np.float32)
+        self._pyramid = np.zeros(0, dtype=np.float32)
+        self._level_offsets = np.zeros(0, dtype=np.int64)
+        self._level_widths = np.zeros(0, dtype=np.int64)
+        self._geometry = {}
+        self._objects_tested = 0
+        self._objects_occluded = 0
+        self._occluder_triangles = 0
+
+    def get_depth(self) -> np.ndarray:
+        return self._depth
+
+    def get_level_count(self) -> int:
+        return self._level_offsets.size
+
+    def get_objects_tested(self) -> int:
+        return self._objects_tested
+
+    def get_objects_occluded(self) -> int:
+        return self._objects_occluded
+
+    def get_occluder_triangles(self) -> int:
+        return self._occluder_triangles
+
+    def cull(self, scene: Scene, camera: Camera, visible_entities: set[Entity] | None) -> set[Entity] | None:
+        self._objects_tested = 0
+        self._objects_occluded = 0
+        self._occluder_triangles = 0
+
+        occluders = scene.get_occluders()
+
+        if not occluders:
+            return visible_entities
+
+        if visible_entities is None:
+            scene.update_bounds()
+
+        entities = scene.get_bounded_entities()
+        bounds_min, bounds_max = scene.get_bounds()
+
+        WIDTH = Preferences.get_occlusion_buffer_width()
+        HEIGHT = max(1, round(WIDTH / Preferences.get_aspect_ratio()))
+        view_projection = camera.get_view_projection_matrix()
+
+        self.rasterize(self._transform_occluders(occluders, view_projection), WIDTH, HEIGHT)
+        self.build_pyramid()
+
+        tested = np.flatnonzero(np.fromiter(((visible_entities is None or entity in visible_entities) and not entity.get_is_occluder() for entity in entities), dtype=bool, count=len(entities)))
+        occluded = tested[self.test_bounds(bounds_min[tested], bounds_max[tested], view_projection)]
+
+        self._objects_tested = tested.size
+        self._objects_occluded = occluded.size
+
+        if occluded.size == 0:
+            return visible_entities
+
+        return (visible_entities if visible_entities is not None else set(entities)) - {entities[index] for index in occluded.tolist()}
+
+    def rasterize(self, triangles: np.ndarray, width: int, height: int) -> None:
+        if self._depth.shape != (height, width):
+            self._depth = np.empty((height, width), dtype=np.float32)
+
+        self._depth.fill(OcclusionCuller._FAR_DEPTH)
+
+        triangles = OcclusionCuller._clip_near(triangles)
+        screen = triangles[:, :, :3] / triangles[:, :, 3:]
+        screen = (screen * 0.5 + 0.5) * [width, height, 1.0]
+
+        x, y, z = screen[:, :, 0], screen[:, :, 1], screen[:, :, 2]
+        area = (x[:, 1] - x[:, 0]) * (y[:, 2] - y[:, 0]) - (x[:, 2] - x[:, 0]) * (y[:, 1] - y[:, 0])
+
+        x_min = np.clip(np.ceil(x.min(axis=1) - 0.5), 0, width - 1).astype(np.int64)
+        x_max = np.clip(np.floor(x.max(axis=1) - 0.5), -1, width - 1).astype(np.int64)
+        y_min = np.clip(np.ceil(y.min(axis=1) - 0.5), 0, height - 1).astype(np.int64)
+        y_max = np.clip(np.floor(y.max(axis=1) - 0.5), -1, height - 1).astype(np.int64)
+
+        visible = np.flatnonzero((x_min <= x_max) & (y_min <= y_max) & (np.abs(area) > np.finfo(np.float32).tiny))
+        self._occluder_triangles = visible.size
+
+        if visible.size == 0:
+            return
+
+        x, y, z, area = x[visible], y[visible], z[visible], area[visible]
+        x_min, x_max, y_min, y_max = x_min[visible], x_max[visible], y_min[visible], y_max[visible]
+
+        orientation = np.sign(area)[:, np.newaxis]
+        origin_x = x_min + 0.5
+        origin_y = y_min + 0.5
+
+        planes = np.empty((visible.size, 4, 3), dtype=np.float64)
+
+        for index, (first, second) in enumerate(((0, 1), (1, 2), (2, 0))):
+            planes[:, index, 1] = y[:, first] - y[:, second]
+            planes[:, index, 2] = x[:, second] - x[:, first]
+            planes[:, index, 0] = planes[:, index, 1] * (origin_x - x[:, first]) + planes[:, index, 2] * (origin_y - y[:, first])
+
+        planes[:, :3] *= orientation[:, :, np.newaxis]
+
+        planes[:, 3, 1] = ((z[:, 1] - z[:, 0]) * (y[:, 2] - y[:, 0]) - (z[:, 2] - z[:, 0]) * (y[:, 1] - y[:, 0])) / area
+        planes[:, 3, 2] = ((x[:, 1] - x[:, 0]) * (z[:, 2] - z[:, 0]) - (x[:, 2] - x[:, 0]) * (z[:, 1] - z[:, 0])) / area
+        planes[:, 3, 0] = z[:, 0] + planes[:, 3, 1] * (origin_x - x[:, 0]) + planes[:, 3, 2] * (origin_y - y[:, 0]) + (np.abs(planes[:, 3, 1]) + np.abs(planes[:, 3, 2])) * 0.5
+
+        farthest = z.max(axis=1)
+        spans = x_max - x_min + 1
+        counts = spans * (y_max - y_min + 1)
+        is_large = counts > OcclusionCuller._DENSE_TRIANGLE_AREA
+
+        for index in np.flatnonzero(is_large).tolist():
+            self._rasterize_dense(planes[index], farthest[index], x_min[index], x_max[index], y_min[index], y_max[index])
+
+        small = np.flatnonzero(~is_large)
+
+        if small.size:
+            self._rasterize_fragments(planes[small], farthest[small], x_min[small], y_min[small], spans[small], counts[small])
+
+    def _rasterize_dense(self, planes: np.ndarray, farthest: float, x_min: int, x_max: int, y_min: int, y_max: int) -> None:
+        offset_x = np.arange(x_max - x_min + 1, dtype=np.float64)
+        offset_y = np.arange(y_max - y_min + 1, dtype=np.float64)[:, np.newaxis]
+
+        inside = planes[0, 0] + planes[0, 1] * offset_x + planes[0, 2] * offset_y >= 0.0
+        inside &= planes[1, 0] + planes[1, 1] * offset_x + planes[1, 2] * offset_y >= 0.0
+        inside &= planes[2, 0] + planes[2, 1] * offset_x + planes[2, 2] * offset_y >= 0.0
+
+        depth = np.minimum(planes[3, 0] + planes[3, 1] * offset_x + planes[3, 2] * offset_y, farthest)
+        target = self._depth[y_min:y_max + 1, x_min:x_max + 1]
+
+        np.minimum(target, depth, out=target, where=inside)
+
+    def _rasterize_fragments(self, planes: np.ndarray, farthest: np.ndarray, x_min: np.ndarray, y_min: np.ndarray, spans: np.ndarray, counts: np.ndarray) -> None:
+        WIDTH = self._depth.shape[1]
+        ends = np.cumsum(counts)
+        splits = np.searchsorted(ends, np.arange(OcclusionCuller._FRAGMENT_BATCH_SIZE, int(ends[-1]), OcclusionCuller._FRAGMENT_BATCH_SIZE), side='right')
+
+        for start, stop in zip([0, *splits.tolist()], [*splits.tolist(), counts.size]):
+            if start == stop:
+                continue
+
+            batch = np.repeat(np.arange(start, stop), counts[start:stop])
+            local = np.arange(batch.size) - np.repeat(ends[start:stop] - counts[start:stop] - (ends[start - 1] if start else 0), counts[start:stop])
+
+            offset_y, offset_x = np.divmod(local, np.repeat(spans[start:stop], counts[start:stop]))
+            coefficients = planes[batch]
+            values = coefficients[:, :, 0] + coefficients[:, :, 1] * offset_x[:, np.newaxis] + coefficients[:, :, 2] * offset_y[:, np.newaxis]
+
+            inside = (values[:, :3] >= 0.0).all(axis=1)
+            batch = batch[inside]
+
+            pixels = (y_min[batch] + offset_y[inside]) * WIDTH + x_min[batch] + offset_x[inside]
+            np.minimum.at(self._depth.reshape(-1), pixels, np.minimum(values[inside, 3], farthest[batch]).astype(np.float32))
+
+    def build_pyramid(self) -> None:
+        levels = [self._depth]
+
+        while levels[-1].shape[0] > 1 or levels[-1].shape[1] > 1:
+            height, width = levels[-1].shape
+            padded = np.pad(levels[-1], ((0, height % 2), (0, width % 2)), mode="edge")
+            levels.append(padded.reshape(padded.shape[0] // 2, 2, padded.shape[1] // 2, 2).max(axis=(1, 3)))
+
+        self._pyramid = np.concatenate([level.reshape(-1) for level in levels])
+        self._level_widths = np.array([level.shape[1] for level in levels], dtype=np.int64)
+        self._level_offsets = np.concatenate(([0], np.cumsum([level.size for level in levels])[:-1])).astype(np.int64)
+
+    def test_bounds(self, bounds_min: np.ndarray, bounds_max: np.ndarray, view_projection: np.ndarray) -> np.ndarray:
+        if bounds_min.shape[0] == 0 or self._level_offsets.size == 0:
+            return np.zeros(bounds_min.shape[0], dtype=bool)
+
+        HEIGHT, WIDTH = self._depth.shape
+
+        corners = np.where(OcclusionCuller._CORNERS, np.asarray(bounds_max, dtype=np.float64)[:, np.newaxis], np.asarray(bounds_min, dtype=np.float64)[:, np.newaxis])
+        clip = corners @ view_projection[:, :3].T + view_projection[:, 3]
+        is_crossing = (clip[:, :, 2] < -clip[:, :, 3]).any(axis=1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            screen = (clip[:, :, :3] / clip[:, :, 3:] * 0.5 + 0.5) * [WIDTH, HEIGHT, 1.0]
+
+        x_min = np.clip(np.nan_to_num(np.floor(screen[:, :, 0].min(axis=1))) - 1, 0, WIDTH - 1).astype(np.int64)
+        x_max = np.clip(np.nan_to_num(np.floor(screen[:, :, 0].max(axis=1))) + 1, 0, WIDTH - 1).astype(np.int64)
+        y_min = np.clip(np.nan_to_num(np.floor(screen[:, :, 1].min(axis=1))) - 1, 0, HEIGHT - 1).astype(np.int64)
+        y_max = np.clip(np.nan_to_num(np.floor(screen[:, :, 1].max(axis=1))) + 1, 0, HEIGHT - 1).astype(np.int64)
+
+        extents = np.maximum(x_max - x_min, y_max - y_min) + 1
+        levels = np.clip(np.ceil(np.log2(extents)).astype(np.int64) - 1, 0, self._level_offsets.size - 1)
+
+        samples = np.arange(OcclusionCuller._SAMPLE_COUNT)
+        texels_x = np.minimum((x_min >> levels)[:, np.newaxis] + samples, (x_max >> levels)[:, np.newaxis])
+        texels_y = np.minimum((y_min >> levels)[:, np.newaxis] + samples, (y_max >> levels)[:, np.newaxis])
+
+        indices = self._level_offsets[levels][:, np.newaxis, np.newaxis] + texels_y[:, :, np.newaxis] * self._level_widths[levels][:, np.newaxis, np.newaxis] + texels_x[:, np.newaxis, :]
+        occluder_depths = self._pyramid[indices].max(axis=(1, 2))
+
+        return ~is_crossing & (screen[:, :, 2].min(axis=1) > occluder_depths)
+
+    def reset(self) -> None:
+        self._geometry.clear()
+
+    def _transform_occluders(self, occluders: list[Entity], view_projection: np.ndarray) -> np.ndarray:
+        meshes = dict.fromkeys(occluder.get_mesh() for occluder in occluders)
+        self._geometry = {mesh: self._geometry[mesh] if mesh in self._geometry else OcclusionCuller._read_geometry(mesh) for mesh in meshes}
+
+        triangles = []
+
+        for occluder in occluders:
+            positions, indices = self._geometry[occluder.get_mesh()]
+            matrix = view_projection @ occluder.get_transform().get_world_matrix().astype(np.float64)
+            triangles.append((positions @ matrix[:, :3].T + matrix[:, 3])[indices])
+
+        return np.concatenate(triangles)
+
+    @staticmethod
+    def _read_geometry(mesh: 'Mesh') -> tuple[np.ndarray, np.ndarray]:
+        positions, indices = mesh.read_triangles()
+        return np.asarray(positions, dtype=np.float64), np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+
+    @staticmethod
+    def _clip_near(triangles: np.ndarray) -> np.ndarray:
+        distances = triangles[:, :, 2] + triangles[:, :, 3]
+        inside = distances >= 0.0
+        counts = inside.sum(axis=1)
+
+        clipped = [triangles[counts == 3]]
+
+        single = counts == 1
+        order = (np.argmax(inside[single], axis=1)[:, np.newaxis] + np.arange(3)) % 3
+        a, b, c = OcclusionCuller._rotate(triangles[single], distances[single], order)
+        clipped.append(np.stack((a[0], OcclusionCuller._intersect(a, b), OcclusionCuller._intersect(a, c)), axis=1))
+
+        double = counts == 2
+        order = (np.argmin(inside[double], axis=1)[:, np.newaxis] + np.arange(1, 4)) % 3
+        a, b, c = OcclusionCuller._rotate(triangles[double], distances[double], order)
+        b_c = OcclusionCuller._intersect(b, c)
+        clipped.append(np.stack((a[0], b[0], b_c), axis=1))
+        clipped.append(np.stack((a[0], b_c, OcclusionCuller._intersect(a, c)), axis=1))
+
+        return np.concatenate(clipped)
+
+    @staticmethod
+    def _rotate(triangles: np.ndarray, distances: np.ndarray, order: np.ndarray) -> list[tuple[np.ndarray, np.ndarray]]:
+        vertices = np.take_along_axis(triangles, order[:, :, np.newaxis], axis=1)
+        distances = np.take_along_axis(distances, order, axis=1)
+        return [(vertices[:, index], distances[:, index]) for index in range(3)]
+
+    @staticmethod
+    def _intersect(inside: tuple[np.ndarray, np.ndarray], outside: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        return inside[0] + (outside[0] - inside[0]) * (inside[1] / (inside[1] - outside[1]))[:, np.newaxis]
\ No newline at end of file
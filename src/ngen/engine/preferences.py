@@ -4,6 +4,39 @@ class Preferences:
     _window_width = 1280
     _window_height = 720
     _anti_aliasing_samples = 1
+    _mesh_cache_enabled = True
+    _frustum_culling_enabled = True
+    _loader_worker_count = 2
+    _upload_budget = 0.004
+    _parser_process_count = None
+    _parallel_parse_threshold = 64 << 20
+    _fixed_delta_time = 1.0 / 60.0
+    _max_substeps = 5
+    _target_frame_rate = 0.0
+    _headless = False
+    _headless_backend = "egl"
+    _readback_buffer_count = 2
+    _title_update_interval = 0.5
+    _lod_levels = 4
+    _lod_reduction = 0.5
+    _lod_screen_sizes = [0.25, 0.1, 0.04]
+    _lod_hysteresis = 0.1
+    _mesh_quantization_enabled = False
+    _mesh_retain_geometry = False
+    _max_lights_per_object = 8
+    _light_influence_threshold = 1.0 / 256.0
+    _shader_rendering_enabled = True
+    _static_batching_enabled = True
+    _static_batch_chunk_size = 32.0
+    _texture_atlas_enabled = True
+    _texture_atlas_size = 2048
+    _texture_atlas_padding = 4
+    _texture_atlas_max_texture_size = 512
+    _texture_cooking_enabled = True
+    _texture_format = "rgba8"
+    _texture_max_resolution = None
+    _occlusion_culling_enabled = True
+    _occlusion_buffer_width = 256
 
     @classmethod
     def get_window_title(cls) -> str:
@@ -38,4 +71,268 @@ class Preferences:
         return self._anti_aliasing_samples
 
     def set_anti_aliasing_samples(self, value: int) -> None:
-        self._anti_aliasing_samples = value
\ No newline at end of file
+        self._anti_aliasing_samples = value
+
+    @classmethod
+    def get_mesh_cache_enabled(cls) -> bool:
+        return cls._mesh_cache_enabled
+
+    @classmethod
+    def set_mesh_cache_enabled(cls, value: bool) -> None:
+        cls._mesh_cache_enabled = value
+
+    @classmethod
+    def get_frustum_culling_enabled(cls) -> bool:
+        return cls._frustum_culling_enabled
+
+    @classmethod
+    def set_frustum_culling_enabled(cls, value: bool) -> None:
+        cls._frustum_culling_enabled = value
+
+    @classmethod
+    def get_loader_worker_count(cls) -> int:
+        return cls._loader_worker_count
+
+    @classmethod
+    def set_loader_worker_count(cls, value: int) -> None:
+        cls._loader_worker_count = value
+
+    @classmethod
+    def get_upload_budget(cls) -> float:
+        return cls._upload_budget
+
+    @classmethod
+    def set_upload_budget(cls, value: float) -> None:
+        cls._upload_budget = value
+
+    @classmethod
+    def get_parser_process_count(cls) -> int | None:
+        return cls._parser_process_count
+
+    @classmethod
+    def set_parser_process_count(cls, value: int | None) -> None:
+        cls._parser_process_count = value
+
+    @classmethod
+    def get_parallel_parse_threshold(cls) -> int:
+        return cls._parallel_parse_threshold
+
+    @classmethod
+    def set_parallel_parse_threshold(cls, value: int) -> None:
+        cls._parallel_parse_threshold = value
+
+    @classmethod
+    def get_fixed_delta_time(cls) -> float:
+        return cls._fixed_delta_time
+
+    @classmethod
+    def set_fixed_delta_time(cls, value: float) -> None:
+        cls._fixed_delta_time = value
+
+    @classmethod
+    def get_max_substeps(cls) -> int:
+        return cls._max_substeps
+
+    @classmethod
+    def set_max_substeps(cls, value: int) -> None:
+        cls._max_substeps = value
+
+    @classmethod
+    def get_target_frame_rate(cls) -> float:
+        return cls._target_frame_rate
+
+    @classmethod
+    def set_target_frame_rate(cls, value: float) -> None:
+        cls._target_frame_rate = value
+
+    @classmethod
+    def get_headless(cls) -> bool:
+        return cls._headless
+
+    @classmethod
+    def set_headless(cls, value: bool) -> None:
+        cls._headless = value
+
+    @classmethod
+    def get_headless_backend(cls) -> str:
+        return cls._headless_backend
+
+    @classmethod
+    def set_headless_backend(cls, value: str) -> None:
+        cls._headless_backend = value
+
+    @classmethod
+    def get_readback_buffer_count(cls) -> int:
+        return cls._readback_buffer_count
+
+    @classmethod
+    def set_readback_buffer_count(cls, value: int) -> None:
+        cls._readback_buffer_count = value
+
+    @classmethod
+    def get_title_update_interval(cls) -> float:
+        return cls._title_update_interval
+
+    @classmethod
+    def set_title_update_interval(cls, value: float) -> None:
+        cls._title_update_interval = value
+
+    @classmethod
+    def get_lod_levels(cls) -> int:
+        return cls._lod_levels
+
+    @classmethod
+    def set_lod_levels(cls, value: int) -> None:
+        cls._lod_levels = value
+
+    @classmethod
+    def get_lod_reduction(cls) -> float:
+        return cls._lod_reduction
+
+    @classmethod
+    def set_lod_reduction(cls, value: float) -> None:
+        cls._lod_reduction = value
+
+    @classmethod
+    def get_lod_screen_sizes(cls) -> list[float]:
+        return cls._lod_screen_sizes
+
+    @classmethod
+    def set_lod_screen_sizes(cls, value: list[float]) -> None:
+        cls._lod_screen_sizes = value
+
+    @classmethod
+    def get_lod_hysteresis(cls) -> float:
+        return cls._lod_hysteresis
+
+    @classmethod
+    def set_lod_hysteresis(cls, value: float) -> None:
+        cls._lod_hysteresis = value
+
+    @classmethod
+    def get_mesh_quantization_enabled(cls) -> bool:
+        return cls._mesh_quantization_enabled
+
+    @classmethod
+    def set_mesh_quantization_enabled(cls, value: bool) -> None:
+        cls._mesh_quantization_enabled = value
+
+    @classmethod
+    def get_mesh_retain_geometry(cls) -> bool:
+        return cls._mesh_retain_geometry
+
+    @classmethod
+    def set_mesh_retain_geometry(cls, value: bool) -> None:
+        cls._mesh_retain_geometry = value
+
+    @classmethod
+    def get_max_lights_per_object(cls) -> int:
+        return cls._max_lights_per_object
+
+    @classmethod
+    def set_max_lights_per_object(cls, value: int) -> None:
+        cls._max_lights_per_object = value
+
+    @classmethod
+    def get_light_influence_threshold(cls) -> float:
+        return cls._light_influence_threshold
+
+    @classmethod
+    def set_light_influence_threshold(cls, value: float) -> None:
+        cls._light_influence_threshold = value
+
+    @classmethod
+    def get_shader_rendering_enabled(cls) -> bool:
+        return cls._shader_rendering_enabled
+
+    @classmethod
+    def set_shader_rendering_enabled(cls, value: bool) -> None:
+        cls._shader_rendering_enabled = value
+
+    @classmethod
+    def get_static_batching_enabled(cls) -> bool:
+        return cls._static_batching_enabled
+
+    @classmethod
+    def set_static_batching_enabled(cls, value: bool) -> None:
+        cls._static_batching_enabled = value
+
+    @classmethod
+    def get_static_batch_chunk_size(cls) -> float:
+        return cls._static_batch_chunk_size
+
+    @classmethod
+    def set_static_batch_chunk_size(cls, value: float) -> None:
+        cls._static_batch_chunk_size = value
+
+    @classmethod
+    def get_texture_atlas_enabled(cls) -> bool:
+        return cls._texture_atlas_enabled
+
+    @classmethod
+    def set_texture_atlas_enabled(cls, value: bool) -> None:
+        cls._texture_atlas_enabled = value
+
+    @classmethod
+    def get_texture_atlas_size(cls) -> int:
+        return cls._texture_atlas_size
+
+    @classmethod
+    def set_texture_atlas_size(cls, value: int) -> None:
+        cls._texture_atlas_size = value
+
+    @classmethod
+    def get_texture_atlas_padding(cls) -> int:
+        return cls._texture_atlas_padding
+
+    @classmethod
+    def set_texture_atlas_padding(cls, value: int) -> None:
+        cls._texture_atlas_padding = value
+
+    @classmethod
+    def get_texture_atlas_max_texture_size(cls) -> int:
+        return cls._texture_atlas_max_texture_size
+
+    @classmethod
+    def set_texture_atlas_max_texture_size(cls, value: int) -> None:
+        cls._texture_atlas_max_texture_size = value
+
+    @classmethod
+    def get_texture_cooking_enabled(cls) -> bool:
+        return cls._texture_cooking_enabled
+
+    @classmethod
+    def set_texture_cooking_enabled(cls, value: bool) -> None:
+        cls._texture_cooking_enabled = value
+
+    @classmethod
+    def get_texture_format(cls) -> str:
+        return cls._texture_format
+
+    @classmethod
+    def set_texture_format(cls, value: str) -> None:
+        cls._texture_format = value
+
+    @classmethod
+    def get_texture_max_resolution(cls) -> int | None:
+        return cls._texture_max_resolution
+
+    @classmethod
+    def set_texture_max_resolution(cls, value: int | None) -> None:
+        cls._texture_max_resolution = value
+
+    @classmethod
+    def get_occlusion_culling_enabled(cls) -> bool:
+        return cls._occlusion_culling_enabled
+
+    @classmethod
+    def set_occlusion_culling_enabled(cls, value: bool) -> None:
+        cls._occlusion_culling_enabled = value
+
+    @classmethod
+    def get_occlusion_buffer_width(cls) -> int:
+        return cls._occlusion_buffer_width
+
+    @classmethod
+    def set_occlusion_buffer_width(cls, value: int) -> None:
+        cls._occlusion_buffer_width = value
\ No newline at end of file
@@ -0,0 +1,178 @@
+import json
+import time
+import numpy as np
+from collections import deque
+
+class _Scope:
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __enter__(self) -> None:
+        Profiler.begin(self._name)
+
+    def __exit__(self, *_) -> None:
+        Profiler.end()
+
+class _NullScope:
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *_) -> None:
+        pass
+
+class Profiler:
+
+    DEFAULT_CAPACITY = 600
+    PERCENTILES = (50.0, 95.0, 99.0)
+
+    _NULL_SCOPE = _NullScope()
+    _NANOSECONDS_PER_MILLISECOND = 1_000_000
+    _NANOSECONDS_PER_MICROSECOND = 1_000
+
+    _enabled = False
+    _frame_index = 0
+    _frame_start = None
+    _open_scopes = []
+    _frame_events = []
+    _frame_counters = {}
+    _frames = deque(maxlen=DEFAULT_CAPACITY)
+    _events = deque(maxlen=DEFAULT_CAPACITY)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def set_enabled(cls, value: bool) -> None:
+        cls._enabled = value
+        cls._frame_start = None
+        cls._open_scopes.clear()
+        cls._frame_events.clear()
+        cls._frame_counters.clear()
+
+    @classmethod
+    def get_capacity(cls) -> int:
+        return cls._frames.maxlen
+
+    @classmethod
+    def set_capacity(cls, value: int) -> None:
+        cls._frames = deque(cls._frames, maxlen=value)
+        cls._events = deque(cls._events, maxlen=value)
+
+    @classmethod
+    def get_frames(cls) -> list[dict]:
+        return list(cls._frames)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._frames.clear()
+        cls._events.clear()
+
+    @classmethod
+    def scope(cls, name: str) -> _Scope | _NullScope:
+        return _Scope(name) if cls._enabled else cls._NULL_SCOPE
+
+    @classmethod
+    def begin(cls, name: str) -> None:
+        if cls._enabled:
+            cls._open_scopes.append((name, time.perf_counter_ns()))
+
+    @classmethod
+    def end(cls) -> None:
+        if cls._enabled and cls._open_scopes:
+            END = time.perf_counter_ns()
+            name, start = cls._open_scopes.pop()
+            cls._frame_events.append((name, start, END - start, len(cls._open_scopes)))
+
+    @classmethod
+    def count(cls, name: str, value: float) -> None:
+        if cls._enabled:
+            cls._frame_counters[name] = cls._frame_counters.get(name, 0) + value
+
+    @classmethod
+    def begin_frame(cls) -> None:
+        if cls._enabled:
+            cls._frame_start = time.perf_counter_ns()
+
+    @classmethod
+    def end_frame(cls) -> None:
+        if not cls._enabled or cls._frame_start is None:
+            return
+
+        END = time.perf_counter_ns()
+
+        while cls._open_scopes:
+            cls.end()
+
+        scopes = {}
+
+        for name, _, duration, _ in cls._frame_events:
+            scopes[name] = scopes.get(name, 0.0) + duration / Profiler._NANOSECONDS_PER_MILLISECOND
+
+        cls._frames.append({
+            "frame": cls._frame_index,
+            "cpu_ms": (END - cls._frame_start) / Profiler._NANOSECONDS_PER_MILLISECOND,
+            **cls._frame_counters,
+            "scopes": scopes,
+        })
+        cls._events.append((cls._frame_index, cls._frame_start, END - cls._frame_start, list(cls._frame_events)))
+
+        cls._frame_index += 1
+        cls._frame_start = None
+        cls._frame_events.clear()
+        cls._frame_counters.clear()
+
+    @classmethod
+    def get_percentiles(cls, key: str = "cpu_ms", percentiles: tuple[float, ...] = PERCENTILES) -> dict[str, float]:
+        return Profiler._compute_percentiles([frame[key] for frame in cls._frames if key in frame], percentiles)
+
+    @classmethod
+    def get_scope_percentiles(cls, name: str, percentiles: tuple[float, ...] = PERCENTILES) -> dict[str, float]:
+        return Profiler._compute_percentiles([frame["scopes"].get(name, 0.0) for frame in cls._frames], percentiles)
+
+    @classmethod
+    def get_summary(cls) -> dict:
+        counters = dict.fromkeys(key for frame in cls._frames for key in frame if key not in ("frame", "scopes"))
+        scopes = dict.fromkeys(name for frame in cls._frames for name in frame["scopes"])
+
+        return {
+            "frame_count": len(cls._frames),
+            **{key: cls.get_percentiles(key) for key in counters},
+            "scopes": {name: cls.get_scope_percentiles(name) for name in scopes},
+        }
+
+    @classmethod
+    def export_json(cls, path: str) -> None:
+        with open(path, 'w') as file_stream:
+            json.dump({"summary": cls.get_summary(), "frames": list(cls._frames)}, file_stream, indent=2)
+
+    @classmethod
+    def export_chrome_trace(cls, path: str) -> None:
+        trace_events = []
+
+        for frame_index, frame_start, frame_duration, events in cls._events:
+            trace_events.append(Profiler._to_trace_event(f"frame {frame_index}", frame_start, frame_duration))
+            trace_events.extend(Profiler._to_trace_event(name, start, duration) for name, start, duration, _ in events)
+
+        with open(path, 'w') as file_stream:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file_stream)
+
+    @staticmethod
+    def _compute_percentiles(values: list[float], percentiles: tuple[float, ...]) -> dict[str, float]:
+        if not values:
+            return {f"p{percentile:g}": 0.0 for percentile in percentiles}
+
+        return {f"p{percentile:g}": float(value) for percentile, value in zip(percentiles, np.percentile(np.array(values, dtype=np.float64), percentiles))}
+
+    @staticmethod
+    def _to_trace_event(name: str, start: int, duration: int) -> dict:
+        return {
+            "name": name,
+            "ph": "X",
+            "pid": 0,
+            "tid": 0,
+            "ts": start / Profiler._NANOSECONDS_PER_MICROSECOND,
+            "dur": duration / Profiler._NANOSECONDS_PER_MICROSECOND,
+        }
\ No newline at end of file
@@ -0,0 +1,206 @@
+import math
+from OpenGL.GL import *
+
+from ..api.entity import Entity
+from .profiler import Profiler
+from .preferences import Preferences
+from .light_manager import LightManager
+from ..graphics.shader import Shader
+from ..graphics.texture import Texture
+from ..graphics.material import Material
+from ..graphics.shader_cache import ShaderCache
+
+class RenderQueue:
+
+    def __init__(self) -> None:
+        self._commands = []
+        self._draw_calls = 0
+        self._triangles = 0
+        self._binds_avoided = 0
+        self._state_changes = 0
+        self._texture_binds = 0
+        self._program_switches = 0
+        self._bound_mesh = None
+        self._bound_texture = None
+        self._bound_program = None
+        self._bound_material = None
+        self._polygon_mode = None
+        self._camera_position = [0.0, 0.0, 0.0]
+        self._light_revisions = {}
+        self._shader_generation = -1
+
+    def get_command_count(self) -> int:
+        return len(self._commands)
+
+    def get_draw_calls(self) -> int:
+        return self._draw_calls
+
+    def get_triangles(self) -> int:
+        return self._triangles
+
+    def get_binds_avoided(self) -> int:
+        return self._binds_avoided
+
+    def get_state_changes(self) -> int:
+        return self._state_changes
+
+    def get_texture_binds(self) -> int:
+        return self._texture_binds
+
+    def get_program_switches(self) -> int:
+        return self._program_switches
+
+    def submit(self, entity: Entity) -> None:
+        self._commands.append(entity)
+
+    def flush(self, camera_position: list[float]) -> None:
+        self._draw_calls = 0
+        self._triangles = 0
+        self._binds_avoided = 0
+        self._state_changes = 0
+        self._texture_binds = 0
+        self._program_switches = 0
+        self._bound_mesh = None
+        self._bound_texture = None
+        self._bound_program = None
+        self._bound_material = None
+        self._polygon_mode = None
+        self._camera_position = camera_position
+
+        if self._shader_generation != ShaderCache.get_generation():
+            self._light_revisions.clear()
+            self._shader_generation = ShaderCache.get_generation()
+
+        draw = self._draw_profiled if Profiler.is_enabled() else self._draw
+
+        commands = self._resolve_commands()
+        opaque = [command for command in commands if not command[0].get_is_transparent()]
+        transparent = [command for command in commands if command[0].get_is_transparent()]
+
+        opaque.sort(key=RenderQueue._get_state_key)
+        transparent.sort(key=lambda command: math.dist(command[0].get_transform().get_world_position(), camera_position), reverse=True)
+
+        glMatrixMode(GL_MODELVIEW)
+        glFrontFace(GL_CCW)
+        glEnable(GL_TEXTURE_2D)
+
+        for command in opaque:
+            draw(*command)
+
+        if transparent:
+            glEnable(GL_BLEND)
+            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            glDepthMask(GL_FALSE)
+
+            for command in transparent:
+                draw(*command)
+
+            glDepthMask(GL_TRUE)
+            glDisable(GL_BLEND)
+
+        if self._bound_mesh is not None:
+            self._bound_mesh.unbind()
+
+        if self._bound_program is not None:
+            glUseProgram(0)
+
+        glBindTexture(GL_TEXTURE_2D, 0)
+        glDisable(GL_TEXTURE_2D)
+
+        with Profiler.scope("gl_flush"):
+            glFlush()
+
+        self._commands.clear()
+
+    def _resolve_commands(self) -> list[tuple[Entity, Material, Shader | None, Texture]]:
+        IS_SHADER_RENDERING_ENABLED = Preferences.get_shader_rendering_enabled()
+        DEFAULT_MATERIAL = Material.get_default()
+
+        states = {}
+        commands = []
+
+        for entity in self._commands:
+            material = entity.get_material()
+
+            if material is None:
+                material = DEFAULT_MATERIAL
+
+            state = states.get(material)
+
+            if state is None:
+                state = states[material] = (material.get_program() if IS_SHADER_RENDERING_ENABLED else None, material.get_texture(Material.TextureSlot.ALBEDO))
+
+            program, texture = state
+            commands.append((entity, material, program, entity.get_texture_albedo() if texture is None else texture))
+
+        return commands
+
+    def _draw_profiled(self, entity: Entity, material: Material, program: Shader | None, texture: Texture) -> None:
+        Profiler.begin("draw")
+        self._draw(entity, material, program, texture)
+        Profiler.end()
+
+    def _draw(self, entity: Entity, material: Material, program: Shader | None, texture: Texture) -> None:
+        mesh = entity.get_lod_mesh()
+        polygon_mode = entity.get_polygon_mode()
+        texture_id = texture.get_id()
+
+        if program is not self._bound_program:
+            if program is None:
+                glUseProgram(0)
+            else:
+                program.use()
+                glUniform3fv(program.get_uniform_location("camera_position"), 1, self._camera_position)
+
+            self._bound_program = program
+            self._bound_material = None
+            self._program_switches += 1
+            self._state_changes += 1
+
+        if program is not None and material is not self._bound_material:
+            material.bind(program)
+            self._bound_material = material
+            self._state_changes += 1
+
+        if polygon_mode != self._polygon_mode:
+            glPolygonMode(GL_FRONT, polygon_mode)
+            self._polygon_mode = polygon_mode
+            self._state_changes += 1
+        else:
+            self._binds_avoided += 1
+
+        if texture_id != self._bound_texture:
+            glBindTexture(GL_TEXTURE_2D, texture_id)
+            self._bound_texture = texture_id
+            self._texture_binds += 1
+            self._state_changes += 1
+        else:
+            self._binds_avoided += 1
+
+        if mesh is not self._bound_mesh:
+            if self._bound_mesh is not None:
+                self._bound_mesh.unbind()
+
+            mesh.bind()
+            self._bound_mesh = mesh
+            self._state_changes += 1
+        else:
+            self._binds_avoided += 1
+
+        LightManager.bind(entity)
+
+        if program is not None and self._light_revisions.get(program) != LightManager.get_slot_revision():
+            glUniform1fv(program.get_uniform_location("light_enabled"), LightManager.MAX_SLOTS, LightManager.get_slot_mask())
+            self._light_revisions[program] = LightManager.get_slot_revision()
+
+        entity.get_transform().load_transformations()
+
+        mesh.draw(entity.get_texture_variant())
+        self._draw_calls += 1
+        self._triangles += mesh.get_index_count() // 3
+
+    @staticmethod
+    def _get_state_key(command: tuple[Entity, Material, Shader | None, Texture]) -> tuple[int, int, int, tuple[int, ...], int, int, int]:
+        entity, material, program, texture = command
+        program_key = (0, 0) if program is None else (program.get_id(), material.get_id())
+        return *program_key, entity.get_polygon_mode(), LightManager.get_row(entity), texture.get_id(), id(entity.get_lod_mesh()), entity.get_texture_variant()
\ No newline at end of file
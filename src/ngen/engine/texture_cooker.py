@@ -0,0 +1,232 @@
+import os
+import numpy as np
+from PIL import Image
+
+from ..graphics.cache_file import CacheFile
+
+class TextureCooker:
+
+    EXTENSION = ".ngtex"
+    FORMATS = ("rgba8", "bc1", "bc3")
+
+    _MAGIC = b"NGTEX"
+    _VERSION = 1
+    _HEADER_SIZE = 512
+    _MAX_LEVELS = 16
+    _BLOCK_SIZE = 4
+    _POWER_ITERATIONS = 4
+
+    _HEADER = np.dtype([
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("format", "<u4"),
+        ("source_mtime_ns", "<i8"),
+        ("source_size", "<i8"),
+        ("source_hash", "u1", (32,)),
+        ("level_count", "<u4"),
+        ("level_widths", "<u4", (_MAX_LEVELS,)),
+        ("level_heights", "<u4", (_MAX_LEVELS,)),
+        ("level_sizes", "<u8", (_MAX_LEVELS,)),
+    ])
+
+    _BC1_BLOCK = np.dtype([("color0", "<u2"), ("color1", "<u2"), ("indices", "<u4")])
+    _BC3_BLOCK = np.dtype([("alpha0", "u1"), ("alpha1", "u1"), ("alpha_indices", "u1", (6,)), ("color", _BC1_BLOCK)])
+
+    @staticmethod
+    def get_cache_path(source_path: str) -> str:
+        return source_path + TextureCooker.EXTENSION
+
+    @staticmethod
+    def load_or_cook(source_path: str, texture_format: str, max_resolution: int | None) -> list[tuple[int, int, np.ndarray]]:
+        levels = TextureCooker.load(source_path, texture_format)
+
+        if levels is None:
+            levels = TextureCooker.cook(source_path, texture_format)
+            TextureCooker.store(source_path, levels, texture_format)
+
+        return TextureCooker.limit_resolution(levels, max_resolution)
+
+    @staticmethod
+    def cook(source_path: str, texture_format: str) -> list[tuple[int, int, np.ndarray]]:
+        with Image.open(source_path) as image:
+            pixels = np.asarray(image.convert("RGBA"))[::-1]
+
+        return [(level.shape[1], level.shape[0], TextureCooker.encode(level, texture_format)) for level in TextureCooker.build_mip_chain(pixels)]
+
+    @staticmethod
+    def build_mip_chain(pixels: np.ndarray) -> list[np.ndarray]:
+        levels = [np.ascontiguousarray(pixels, dtype=np.uint8)]
+
+        while levels[-1].shape[0] > 1 or levels[-1].shape[1] > 1:
+            height, width = levels[-1].shape[:2]
+            image = Image.fromarray(levels[-1], "RGBA").resize((max(1, width // 2), max(1, height // 2)), Image.Resampling.BOX)
+            levels.append(np.asarray(image))
+
+        return levels
+
+    @staticmethod
+    def limit_resolution(levels: list[tuple[int, int, np.ndarray]], max_resolution: int | None) -> list[tuple[int, int, np.ndarray]]:
+        if max_resolution is None:
+            return levels
+
+        first = 0
+
+        while first < len(levels) - 1 and max(levels[first][:2]) > max_resolution:
+            first += 1
+
+        return levels[first:]
+
+    @staticmethod
+    def encode(pixels: np.ndarray, texture_format: str) -> np.ndarray:
+        if texture_format == "rgba8":
+            return np.ascontiguousarray(pixels, dtype=np.uint8).reshape(-1)
+
+        blocks = TextureCooker._to_blocks(pixels)
+
+        if texture_format == "bc1":
+            return TextureCooker._encode_colors(blocks).view(np.uint8)
+
+        encoded = np.zeros(blocks.shape[0], dtype=TextureCooker._BC3_BLOCK)
+        encoded["alpha0"], encoded["alpha1"], encoded["alpha_indices"] = TextureCooker._encode_alpha(blocks[:, :, 3])
+        encoded["color"] = TextureCooker._encode_colors(blocks)
+
+        return encoded.view(np.uint8)
+
+    @staticmethod
+    def load(source_path: str, texture_format: str) -> list[tuple[int, int, np.ndarray]] | None:
+        cache_path = TextureCooker.get_cache_path(source_path)
+
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            data = np.memmap(cache_path, dtype=np.uint8, mode='r')
+        except (OSError, ValueError):
+            return None
+
+        if data.size < TextureCooker._HEADER_SIZE:
+            return None
+
+        header = data[:TextureCooker._HEADER.itemsize].view(TextureCooker._HEADER)[0]
+
+        if header["magic"] != TextureCooker._MAGIC or header["version"] != TextureCooker._VERSION or header["format"] != TextureCooker.FORMATS.index(texture_format):
+            return None
+
+        if not 0 < header["level_count"] <= TextureCooker._MAX_LEVELS or not CacheFile.is_source_unchanged(source_path, cache_path, header):
+            return None
+
+        levels = []
+        offset = TextureCooker._HEADER_SIZE
+        LEVEL_COUNT = header["level_count"]
+
+        for width, height, size in zip(header["level_widths"][:LEVEL_COUNT].tolist(), header["level_heights"][:LEVEL_COUNT].tolist(), header["level_sizes"][:LEVEL_COUNT].tolist()):
+            if offset + size > data.size or size != TextureCooker.get_level_size(width, height, texture_format):
+                return None
+
+            levels.append((width, height, data[offset:offset + size]))
+            offset += size
+
+        if offset != data.size:
+            return None
+
+        return levels
+
+    @staticmethod
+    def store(source_path: str, levels: list[tuple[int, int, np.ndarray]], texture_format: str) -> bool:
+        if not 0 < len(levels) <= TextureCooker._MAX_LEVELS:
+            return False
+
+        header = np.zeros(1, dtype=TextureCooker._HEADER)
+        header["magic"] = TextureCooker._MAGIC
+        header["version"] = TextureCooker._VERSION
+        header["format"] = TextureCooker.FORMATS.index(texture_format)
+        header["level_count"] = len(levels)
+        header["level_widths"][0, :len(levels)] = [width for width, _, _ in levels]
+        header["level_heights"][0, :len(levels)] = [height for _, height, _ in levels]
+        header["level_sizes"][0, :len(levels)] = [data.nbytes for _, _, data in levels]
+
+        chunks = (np.ascontiguousarray(data, dtype=np.uint8) for _, _, data in levels)
+        return CacheFile.write(TextureCooker.get_cache_path(source_path), source_path, header, TextureCooker._HEADER_SIZE, chunks)
+
+    @staticmethod
+    def get_level_size(width: int, height: int, texture_format: str) -> int:
+        if texture_format == "rgba8":
+            return width * height * 4
+
+        BLOCKS = -(-width // TextureCooker._BLOCK_SIZE) * -(-height // TextureCooker._BLOCK_SIZE)
+        return BLOCKS * (TextureCooker._BC1_BLOCK if texture_format == "bc1" else TextureCooker._BC3_BLOCK).itemsize
+
+    @staticmethod
+    def _to_blocks(pixels: np.ndarray) -> np.ndarray:
+        SIZE = TextureCooker._BLOCK_SIZE
+        height, width = pixels.shape[:2]
+
+        padded = np.pad(pixels, ((0, -height % SIZE), (0, -width % SIZE), (0, 0)), mode="edge")
+        rows, columns = padded.shape[0] // SIZE, padded.shape[1] // SIZE
+
+        return padded.reshape(rows, SIZE, columns, SIZE, 4).transpose(0, 2, 1, 3, 4).reshape(-1, SIZE * SIZE, 4)
+
+    @staticmethod
+    def _encode_colors(blocks: np.ndarray) -> np.ndarray:
+        colors = blocks[:, :, :3].astype(np.float32)
+        mean = colors.mean(axis=1, keepdims=True)
+        centered = colors - mean
+        covariance = np.einsum('npi,npj->nij', centered, centered)
+
+        axis = np.ones((blocks.shape[0], 3), dtype=np.float32)
+
+        for _ in range(TextureCooker._POWER_ITERATIONS):
+            axis = np.einsum('nij,nj->ni', covariance, axis)
+            axis /= np.maximum(np.abs(axis).max(axis=1, keepdims=True), np.finfo(np.float32).tiny)
+
+        projections = np.einsum('npi,ni->np', centered, axis)
+        first = mean[:, 0] + axis * projections.max(axis=1, keepdims=True)
+        second = mean[:, 0] + axis * projections.min(axis=1, keepdims=True)
+
+        color0 = TextureCooker._pack_565(first)
+        color1 = TextureCooker._pack_565(second)
+
+        swapped = color0 < color1
+        color0[swapped], color1[swapped] = color1[swapped], color0[swapped]
+
+        endpoint0 = TextureCooker._unpack_565(color0)
+        endpoint1 = TextureCooker._unpack_565(color1)
+        palette = np.stack((endpoint0, endpoint1, (endpoint0 * 2.0 + endpoint1) / 3.0, (endpoint0 + endpoint1 * 2.0) / 3.0), axis=1)
+
+        indices = ((colors[:, :, np.newaxis, :] - palette[:, np.newaxis, :, :]) ** 2).sum(axis=3).argmin(axis=2).astype(np.uint32)
+        indices[color0 == color1] = 0
+
+        encoded = np.zeros(blocks.shape[0], dtype=TextureCooker._BC1_BLOCK)
+        encoded["color0"] = color0
+        encoded["color1"] = color1
+        encoded["indices"] = (indices << (np.arange(16, dtype=np.uint32) * 2)).sum(axis=1, dtype=np.uint32)
+
+        return encoded
+
+    @staticmethod
+    def _encode_alpha(alpha: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        alpha0 = alpha.max(axis=1)
+        alpha1 = alpha.min(axis=1)
+
+        weights = np.array([7, 0, 6, 5, 4, 3, 2, 1], dtype=np.float32) / 7.0
+        palette = alpha0[:, np.newaxis] * weights + alpha1[:, np.newaxis] * (1.0 - weights)
+
+        indices = np.abs(alpha[:, :, np.newaxis].astype(np.float32) - palette[:, np.newaxis, :]).argmin(axis=2).astype(np.uint64)
+        indices[alpha0 == alpha1] = 0
+
+        bits = (indices << (np.arange(16, dtype=np.uint64) * 3)).sum(axis=1, dtype=np.uint64)
+        packed = bits[:, np.newaxis].view(np.uint8).reshape(-1, 8)[:, :6]
+
+        return alpha0, alpha1, packed
+
+    @staticmethod
+    def _pack_565(colors: np.ndarray) -> np.ndarray:
+        channels = np.clip(np.rint(colors / 255.0 * [31.0, 63.0, 31.0]), 0, [31, 63, 31]).astype(np.uint16)
+        return (channels[:, 0] << 11) | (channels[:, 1] << 5) | channels[:, 2]
+
+    @staticmethod
+    def _unpack_565(colors: np.ndarray) -> np.ndarray:
+        red = (colors >> 11) & 31
+        green = (colors >> 5) & 63
+        blue = colors & 31
+        return np.stack(((red << 3) | (red >> 2), (green << 2) | (green >> 4), (blue << 3) | (blue >> 2)), axis=1).astype(np.float32)
\ No newline at end of file
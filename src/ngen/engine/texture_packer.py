@@ -0,0 +1,200 @@
+import math
+import numpy as np
+from OpenGL.GL import *
+
+from ..api.entity import Entity
+from ..api.instanced_entity import InstancedEntity
+from .preferences import Preferences
+from ..graphics.mesh import Mesh
+from ..graphics.texture import Texture
+from ..graphics.geometry import Geometry
+from ..graphics.texture_cache import TextureCache
+from ..graphics.texture_atlas import TextureAtlas
+
+class TexturePacker:
+
+    _TEXCOORD_TOLERANCE = 1e-4
+
+    _atlases = []
+    _sources = []
+    _remapped_meshes = 0
+    _packed_meshes = {}
+    _mesh_users = {}
+
+    @classmethod
+    def get_atlases(cls) -> list[TextureAtlas]:
+        return cls._atlases
+
+    @classmethod
+    def get_atlas_count(cls) -> int:
+        return len(cls._atlases)
+
+    @classmethod
+    def get_packed_texture_count(cls) -> int:
+        return sum(atlas.get_region_count() for atlas in cls._atlases)
+
+    @classmethod
+    def get_remapped_mesh_count(cls) -> int:
+        return cls._remapped_meshes
+
+    @classmethod
+    def uses_mesh(cls, mesh: Mesh) -> bool:
+        return mesh in cls._mesh_users
+
+    @classmethod
+    def remove(cls, entity: Entity) -> None:
+        mesh = cls._packed_meshes.pop(entity, None)
+
+        if mesh is None:
+            return
+
+        cls._mesh_users[mesh] -= 1
+
+        if cls._mesh_users[mesh] == 0:
+            del cls._mesh_users[mesh]
+
+    @classmethod
+    def get_efficiency(cls) -> float:
+        area = sum(atlas.get_width() * atlas.get_height() for atlas in cls._atlases)
+        return sum(atlas.get_efficiency() * atlas.get_width() * atlas.get_height() for atlas in cls._atlases) / area if area else 0.0
+
+    @classmethod
+    def pack(cls, scene: 'Scene') -> None:
+        if not bool(glDrawElementsBaseVertex):
+            return
+
+        SIZE = Preferences.get_texture_atlas_size()
+        PADDING = Preferences.get_texture_atlas_padding()
+        MAX_TEXTURE_SIZE = min(Preferences.get_texture_atlas_max_texture_size(), SIZE - PADDING * 2)
+        ATLAS_TEXTURES = {atlas.get_texture() for atlas in cls._atlases}
+
+        candidates = [scene_object for scene_object in scene.get_scene_objects() if isinstance(scene_object, Entity) and TexturePacker._is_packable(scene_object, MAX_TEXTURE_SIZE, ATLAS_TEXTURES)]
+
+        if len({entity.get_texture_albedo() for entity in candidates}) < 2:
+            return
+
+        unit_texcoords = {mesh: TexturePacker._has_unit_texcoords(mesh) for mesh in dict.fromkeys(entity.get_mesh() for entity in candidates)}
+        candidates = [entity for entity in candidates if unit_texcoords[entity.get_mesh()]]
+        textures = list(dict.fromkeys(entity.get_texture_albedo() for entity in candidates))
+
+        if len(textures) < 2:
+            return
+
+        pixels = {texture: texture.read_pixels() for texture in textures}
+        textures.sort(key=lambda texture: (texture.get_height(), texture.get_width()), reverse=True)
+
+        atlases = TexturePacker._build_atlases([(texture, pixels[texture]) for texture in textures], SIZE, PADDING)
+
+        placements = {}
+
+        for atlas in atlases:
+            if atlas.get_region_count() < 2:
+                continue
+
+            atlas.crop()
+            atlas.upload()
+            cls._atlases.append(atlas)
+
+            for texture in atlas.get_keys():
+                placements[texture] = atlas
+                cls._sources.append(TextureCache.retain(texture))
+
+        variants = {}
+
+        for entity in candidates:
+            atlas = placements.get(entity.get_texture_albedo())
+
+            if atlas is not None:
+                variants.setdefault((entity.get_mesh(), atlas), {})[entity.get_texture_albedo()] = None
+
+        meshes = {}
+
+        for (mesh, atlas), used in variants.items():
+            meshes[mesh, atlas] = (mesh.remap_texcoords(np.array([atlas.get_region(texture) for texture in used])), {texture: index for index, texture in enumerate(used)})
+            cls._remapped_meshes += 1
+
+        for entity in candidates:
+            texture = entity.get_texture_albedo()
+            atlas = placements.get(texture)
+
+            if atlas is None:
+                continue
+
+            mesh, indices = meshes[entity.get_mesh(), atlas]
+
+            entity.set_mesh(mesh)
+            cls._packed_meshes[entity] = mesh
+            cls._mesh_users[mesh] = cls._mesh_users.get(mesh, 0) + 1
+            entity.set_texture_variant(indices[texture])
+            entity.set_texture_albedo(atlas.get_texture())
+
+        in_use = {scene_object.get_mesh() for scene_object in scene.get_scene_objects() if isinstance(scene_object, (Entity, InstancedEntity))}
+        static_batcher = scene.get_static_batcher()
+
+        for mesh in dict.fromkeys(mesh for mesh, _ in meshes):
+            if mesh not in in_use and (static_batcher is None or not static_batcher.uses_mesh(mesh)):
+                mesh.free()
+
+    @classmethod
+    def reset(cls) -> None:
+        for texture in cls._sources:
+            TextureCache.release(texture)
+
+        for atlas in cls._atlases:
+            if atlas.get_texture() is not None:
+                atlas.get_texture().free()
+
+        cls._atlases.clear()
+        cls._sources.clear()
+        cls._packed_meshes.clear()
+        cls._mesh_users.clear()
+        cls._remapped_meshes = 0
+
+    @staticmethod
+    def _build_atlases(images: list[tuple[Texture, np.ndarray]], max_size: int, padding: int) -> list[TextureAtlas]:
+        atlases = []
+
+        while images:
+            area = sum((image.shape[0] + padding * 2) * (image.shape[1] + padding * 2) for _, image in images)
+            size = 1 << max(int(math.ceil(math.sqrt(area))) - 1, 0).bit_length()
+
+            while True:
+                atlas = TextureAtlas(min(size, max_size), min(size, max_size), padding)
+                remaining = [(texture, image) for texture, image in images if not atlas.add(texture, image)]
+
+                if not remaining or size >= max_size:
+                    break
+
+                size *= 2
+
+            if atlas.get_region_count() == 0:
+                break
+
+            atlases.append(atlas)
+            images = remaining
+
+        return atlases
+
+    @staticmethod
+    def _is_packable(entity: Entity, max_texture_size: int, atlas_textures: set[Texture]) -> bool:
+        mesh = entity.get_mesh()
+        texture = entity.get_texture_albedo()
+        material = entity.get_material()
+
+        if mesh is None or not mesh.get_attributes() & Geometry.ATTRIBUTE_TEXCOORDS or mesh.get_variant_count() > 1:
+            return False
+
+        if material is not None and material.get_textures():
+            return False
+
+        return isinstance(texture, Texture) and texture not in atlas_textures and max(texture.get_width(), texture.get_height()) <= max_texture_size
+
+    @staticmethod
+    def _has_unit_texcoords(mesh: Mesh) -> bool:
+        for level in [mesh, *mesh.get_lods()]:
+            texcoords = level.read_geometry()[0][:, Geometry.OFFSET_TEXCOORD:Geometry.VERTEX_COMPONENTS]
+
+            if texcoords.size and (texcoords.min() < -TexturePacker._TEXCOORD_TOLERANCE or texcoords.max() > 1.0 + TexturePacker._TEXCOORD_TOLERANCE):
+                return False
+
+        return True
\ No newline at end of file
@@ -1,3 +1,8 @@
 from .mesh import Mesh
 from .texture import Texture
-from .material import Material
\ No newline at end of file
+from .texture_cache import TextureCache
+from .texture_atlas import TextureAtlas
+from .material import Material
+from .shader_cache import ShaderCache
+from .framebuffer import Framebuffer
+from .frame_reader import FrameReader
\ No newline at end of file
@@ -0,0 +1,60 @@
+import os
+import threading
+import numpy as np
+from typing import Iterable
+
+from .file_hasher import FileHasher
+
+class CacheFile:
+
+    @staticmethod
+    def write(cache_path: str, source_path: str, header: np.ndarray, header_size: int, chunks: Iterable[np.ndarray]) -> bool:
+        temporary_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            source_stat = os.stat(source_path)
+
+            header["source_mtime_ns"] = source_stat.st_mtime_ns
+            header["source_size"] = source_stat.st_size
+            header["source_hash"] = np.frombuffer(FileHasher.hash_file(source_path), dtype=np.uint8)
+
+            with open(temporary_path, 'wb') as file_stream:
+                file_stream.write(header.tobytes().ljust(header_size, b"\0"))
+
+                for chunk in chunks:
+                    file_stream.write(chunk.tobytes())
+
+            os.replace(temporary_path, cache_path)
+            return True
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            return False
+
+    @staticmethod
+    def is_source_unchanged(source_path: str, cache_path: str, header: np.void) -> bool:
+        try:
+            source_stat = os.stat(source_path)
+        except OSError:
+            return False
+
+        if source_stat.st_size != header["source_size"]:
+            return False
+
+        if source_stat.st_mtime_ns == header["source_mtime_ns"]:
+            return True
+
+        if FileHasher.hash_file(source_path) != header["source_hash"].tobytes():
+            return False
+
+        CacheFile._refresh_mtime(cache_path, header.dtype, source_stat.st_mtime_ns)
+        return True
+
+    @staticmethod
+    def _refresh_mtime(cache_path: str, header_type: np.dtype, mtime_ns: int) -> None:
+        try:
+            header = np.memmap(cache_path, dtype=header_type, mode='r+', shape=(1,))
+            header["source_mtime_ns"] = mtime_ns
+            header.flush()
+        except OSError:
+            pass
\ No newline at end of file
@@ -0,0 +1,16 @@
+import hashlib
+
+class FileHasher:
+
+    _CHUNK_SIZE = 1 << 20
+    _DIGEST_SIZE = 32
+
+    @staticmethod
+    def hash_file(path: str) -> bytes:
+        digest = hashlib.blake2b(digest_size=FileHasher._DIGEST_SIZE)
+
+        with open(path, 'rb') as file_stream:
+            for chunk in iter(lambda: file_stream.read(FileHasher._CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+        return digest.digest()
\ No newline at end of file
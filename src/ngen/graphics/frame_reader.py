@@ -0,0 +1,75 @@
+import ctypes
+import numpy as np
+from OpenGL.GL import *
+from collections import deque
+
+class FrameReader:
+
+    _CHANNELS = 4
+    _DEFAULT_BUFFER_COUNT = 2
+
+    def __init__(self, width: int, height: int, buffer_count: int = _DEFAULT_BUFFER_COUNT) -> None:
+        self._width = width
+        self._height = height
+        self._size = width * height * FrameReader._CHANNELS
+        self._pending = deque()
+        self._next_buffer = 0
+        self._buffers = []
+
+        if bool(glMapBuffer):
+            self._buffers = list(np.atleast_1d(glGenBuffers(buffer_count)))
+
+            for buffer in self._buffers:
+                glBindBuffer(GL_PIXEL_PACK_BUFFER, buffer)
+                glBufferData(GL_PIXEL_PACK_BUFFER, self._size, None, GL_STREAM_READ)
+
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+
+    def get_latency(self) -> int:
+        return max(0, len(self._buffers) - 1)
+
+    def read(self) -> np.ndarray | None:
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+
+        if not self._buffers:
+            pixels = glReadPixels(0, 0, self._width, self._height, GL_RGBA, GL_UNSIGNED_BYTE)
+            return self._to_image(np.frombuffer(pixels, dtype=np.uint8))
+
+        buffer = self._buffers[self._next_buffer]
+        self._next_buffer = (self._next_buffer + 1) % len(self._buffers)
+
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, buffer)
+        glReadPixels(0, 0, self._width, self._height, GL_RGBA, GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+
+        self._pending.append(buffer)
+
+        if len(self._pending) < len(self._buffers):
+            return None
+
+        return self._map(self._pending.popleft())
+
+    def flush(self) -> list[np.ndarray]:
+        frames = []
+
+        while self._pending:
+            frames.append(self._map(self._pending.popleft()))
+
+        return frames
+
+    def free(self) -> None:
+        if self._buffers:
+            glDeleteBuffers(len(self._buffers), self._buffers)
+            self._buffers = []
+            self._pending.clear()
+
+    def _map(self, buffer: int) -> np.ndarray:
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, buffer)
+        address = glMapBuffer(GL_PIXEL_PACK_BUFFER, GL_READ_ONLY)
+        image = self._to_image(np.ctypeslib.as_array((ctypes.c_ubyte * self._size).from_address(address)))
+        glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        return image
+
+    def _to_image(self, pixels: np.ndarray) -> np.ndarray:
+        return pixels.reshape(self._height, self._width, FrameReader._CHANNELS)[::-1].copy()
\ No newline at end of file
@@ -0,0 +1,50 @@
+from OpenGL.GL import *
+
+class Framebuffer:
+
+    def __init__(self, width: int, height: int) -> None:
+        self._width = width
+        self._height = height
+        self._framebuffer = glGenFramebuffers(1)
+        self._color_buffer, self._depth_buffer = glGenRenderbuffers(2)
+
+        glBindFramebuffer(GL_FRAMEBUFFER, self._framebuffer)
+
+        glBindRenderbuffer(GL_RENDERBUFFER, self._color_buffer)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, width, height)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, self._color_buffer)
+
+        glBindRenderbuffer(GL_RENDERBUFFER, self._depth_buffer)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, width, height)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_RENDERBUFFER, self._depth_buffer)
+
+        STATUS = glCheckFramebufferStatus(GL_FRAMEBUFFER)
+
+        glBindRenderbuffer(GL_RENDERBUFFER, 0)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+
+        if STATUS != GL_FRAMEBUFFER_COMPLETE:
+            self.free()
+            raise RuntimeError(f"Framebuffer is incomplete (status 0x{STATUS:X}).")
+
+    def get_id(self) -> int:
+        return self._framebuffer
+
+    def get_width(self) -> int:
+        return self._width
+
+    def get_height(self) -> int:
+        return self._height
+
+    def bind(self) -> None:
+        glBindFramebuffer(GL_FRAMEBUFFER, self._framebuffer)
+        glViewport(0, 0, self._width, self._height)
+
+    def unbind(self) -> None:
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+
+    def free(self) -> None:
+        if self._framebuffer is not None:
+            glDeleteRenderbuffers(2, [self._color_buffer, self._depth_buffer])
+            glDeleteFramebuffers(1, [self._framebuffer])
+            self._framebuffer = None
\ No newline at end of file
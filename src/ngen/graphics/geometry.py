@@ -0,0 +1,181 @@
+import numpy as np
+
+class Geometry:
+
+    INDEX_VERTEX = 0
+    INDEX_TEXCOORD = 1
+    INDEX_NORMAL = 2
+
+    OFFSET_POSITION = 0
+    OFFSET_NORMAL = 3
+    OFFSET_TEXCOORD = 6
+    VERTEX_COMPONENTS = 8
+    VERTEX_STRIDE = VERTEX_COMPONENTS * np.dtype(np.float32).itemsize
+
+    ATTRIBUTE_NORMALS = 1
+    ATTRIBUTE_TEXCOORDS = 2
+
+    POSITION_RANGE = 32767
+    NORMAL_RANGE = 127
+    SHORT_INDEX_LIMIT = 1 << 16
+
+    QUANTIZED_VERTEX = np.dtype([
+        ("position", "<i2", (4,)),
+        ("normal", "i1", (4,)),
+        ("texcoord", "<f2", (2,)),
+    ])
+
+    @staticmethod
+    def triangulate(face_offsets: np.ndarray) -> np.ndarray:
+        corner_counts = np.diff(face_offsets).astype(np.int64)
+        triangle_counts = np.maximum(corner_counts - 2, 0)
+
+        face_of_triangle = np.repeat(np.arange(corner_counts.size), triangle_counts)
+        first_triangle = np.cumsum(triangle_counts) - triangle_counts
+        fan_step = np.arange(face_of_triangle.size) - first_triangle[face_of_triangle] + 1
+
+        anchors = face_offsets[:-1].astype(np.int64)[face_of_triangle]
+        return np.stack((anchors, anchors + fan_step, anchors + fan_step + 1), axis = 1)
+
+    @staticmethod
+    def deduplicate(faces: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if faces.shape[0] == 0:
+            return np.zeros((0, faces.shape[1]), dtype=faces.dtype), np.zeros(0, dtype=np.int64)
+
+        corners = np.ascontiguousarray(faces)
+        keys = corners.view(np.dtype((np.void, corners.dtype.itemsize * corners.shape[1]))).ravel()
+        _, first_index, inverse = np.unique(keys, return_index=True, return_inverse=True)
+
+        order = np.argsort(first_index, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+
+        return corners[first_index[order]], rank[inverse.ravel()]
+
+    @staticmethod
+    def interleave(unique_corners: np.ndarray, normals: np.ndarray, vertices: np.ndarray, texcoords: np.ndarray) -> tuple[np.ndarray, int]:
+        vertex_buffer = np.zeros((unique_corners.shape[0], Geometry.VERTEX_COMPONENTS), dtype=np.float32)
+        vertex_buffer[:, Geometry.OFFSET_POSITION:Geometry.OFFSET_NORMAL] = vertices[unique_corners[:, Geometry.INDEX_VERTEX]]
+
+        attributes = 0
+        layout = ((Geometry.INDEX_NORMAL, normals, Geometry.OFFSET_NORMAL, Geometry.ATTRIBUTE_NORMALS), (Geometry.INDEX_TEXCOORD, texcoords, Geometry.OFFSET_TEXCOORD, Geometry.ATTRIBUTE_TEXCOORDS))
+
+        for index, source, offset, attribute in layout:
+            references = unique_corners[:, index]
+            is_present = references >= 0
+
+            if is_present.any():
+                attributes |= attribute
+                vertex_buffer[is_present, offset:offset + source.shape[1]] = source[references[is_present]]
+
+        return vertex_buffer, attributes
+
+    @staticmethod
+    def compute_bounds(positions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        if positions.shape[0] == 0:
+            ORIGIN = np.zeros(3, dtype=np.float32)
+            return ORIGIN, ORIGIN.copy(), ORIGIN.copy(), 0.0
+
+        bounds_min = positions.min(axis=0).astype(np.float32)
+        bounds_max = positions.max(axis=0).astype(np.float32)
+        center = (bounds_min + bounds_max) * 0.5
+        radius = float(np.sqrt(((positions - center) ** 2).sum(axis=1).max()))
+
+        return bounds_min, bounds_max, center, radius
+
+    @staticmethod
+    def transform_bounds(bounds_min: np.ndarray, bounds_max: np.ndarray, matrices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        centers = (bounds_min + bounds_max) * 0.5
+        extents = (bounds_max - bounds_min) * 0.5
+
+        world_centers = np.einsum('nij,nj->ni', matrices[:, :3, :3], centers) + matrices[:, :3, 3]
+        world_extents = np.einsum('nij,nj->ni', np.abs(matrices[:, :3, :3]), extents)
+
+        return world_centers - world_extents, world_centers + world_extents
+
+    @staticmethod
+    def build_indexed(faces: np.ndarray, face_offsets: np.ndarray, normals: np.ndarray, vertices: np.ndarray, texcoords: np.ndarray) -> tuple[np.ndarray, np.ndarray, int]:
+        triangles = Geometry.triangulate(face_offsets)
+        unique_corners, corner_remap = Geometry.deduplicate(faces)
+        vertex_buffer, attributes = Geometry.interleave(unique_corners, normals, vertices, texcoords)
+        index_buffer = corner_remap[triangles].astype(np.uint32).ravel()
+        return vertex_buffer, index_buffer, attributes
+
+    @staticmethod
+    def quantize(vertex_buffer: np.ndarray, bounds_min: np.ndarray, bounds_max: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        center = (bounds_min.astype(np.float64) + bounds_max.astype(np.float64)) * 0.5
+        scale = max(float((bounds_max - bounds_min).max()) * 0.5, np.finfo(np.float32).tiny) / Geometry.POSITION_RANGE
+
+        quantized = np.zeros(vertex_buffer.shape[0], dtype=Geometry.QUANTIZED_VERTEX)
+        quantized["position"][:, :3] = np.clip(np.rint((vertex_buffer[:, Geometry.OFFSET_POSITION:Geometry.OFFSET_NORMAL] - center) / scale), -Geometry.POSITION_RANGE, Geometry.POSITION_RANGE)
+        quantized["normal"][:, :3] = np.clip(np.rint(vertex_buffer[:, Geometry.OFFSET_NORMAL:Geometry.OFFSET_TEXCOORD] * Geometry.NORMAL_RANGE), -Geometry.NORMAL_RANGE, Geometry.NORMAL_RANGE)
+        quantized["texcoord"] = vertex_buffer[:, Geometry.OFFSET_TEXCOORD:Geometry.VERTEX_COMPONENTS]
+
+        return quantized, np.array([*center, scale], dtype=np.float32)
+
+    @staticmethod
+    def dequantize(quantized: np.ndarray, dequantization: np.ndarray) -> np.ndarray:
+        vertex_buffer = np.empty((quantized.shape[0], Geometry.VERTEX_COMPONENTS), dtype=np.float32)
+        vertex_buffer[:, Geometry.OFFSET_POSITION:Geometry.OFFSET_NORMAL] = dequantization[:3] + quantized["position"][:, :3] * dequantization[3]
+        vertex_buffer[:, Geometry.OFFSET_NORMAL:Geometry.OFFSET_TEXCOORD] = quantized["normal"][:, :3] / Geometry.NORMAL_RANGE
+        vertex_buffer[:, Geometry.OFFSET_TEXCOORD:Geometry.VERTEX_COMPONENTS] = quantized["texcoord"]
+        return vertex_buffer
+
+    @staticmethod
+    def bake(vertex_buffer: np.ndarray, index_buffer: np.ndarray, matrices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        COUNT = matrices.shape[0]
+        VERTEX_COUNT = vertex_buffer.shape[0]
+
+        linear = matrices[:, :3, :3].astype(np.float64)
+        baked = np.repeat(vertex_buffer[np.newaxis], COUNT, axis=0)
+
+        baked[:, :, Geometry.OFFSET_POSITION:Geometry.OFFSET_NORMAL] = np.einsum('kij,vj->kvi', linear, vertex_buffer[:, Geometry.OFFSET_POSITION:Geometry.OFFSET_NORMAL]) + matrices[:, np.newaxis, :3, 3]
+
+        normals = np.einsum('kij,vj->kvi', np.linalg.inv(linear).transpose(0, 2, 1), vertex_buffer[:, Geometry.OFFSET_NORMAL:Geometry.OFFSET_TEXCOORD])
+        baked[:, :, Geometry.OFFSET_NORMAL:Geometry.OFFSET_TEXCOORD] = normals / np.maximum(np.linalg.norm(normals, axis=2, keepdims=True), np.finfo(np.float32).tiny)
+
+        triangles = index_buffer.astype(np.int64).reshape(1, -1, 3) + (np.arange(COUNT) * VERTEX_COUNT)[:, np.newaxis, np.newaxis]
+        mirrored = np.linalg.det(linear) < 0.0
+        triangles[mirrored] = triangles[mirrored][:, :, ::-1]
+
+        return baked.reshape(-1, Geometry.VERTEX_COMPONENTS), triangles.ravel()
+
+    @staticmethod
+    def remap_texcoords(vertex_buffer: np.ndarray, regions: np.ndarray) -> np.ndarray:
+        remapped = np.repeat(vertex_buffer[np.newaxis], regions.shape[0], axis=0)
+        remapped[:, :, Geometry.OFFSET_TEXCOORD:Geometry.VERTEX_COMPONENTS] = regions[:, np.newaxis, :2] + vertex_buffer[:, Geometry.OFFSET_TEXCOORD:Geometry.VERTEX_COMPONENTS] * regions[:, np.newaxis, 2:]
+        return remapped.reshape(-1, Geometry.VERTEX_COMPONENTS)
+
+    @staticmethod
+    def intersect_rays_aabbs(origins: np.ndarray, inverse_directions: np.ndarray, bounds_min: np.ndarray, bounds_max: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        first = (bounds_min - origins) * inverse_directions
+        second = (bounds_max - origins) * inverse_directions
+
+        near = np.fmin(first, second)
+        far = np.fmax(first, second)
+
+        return np.fmax(np.fmax(near[:, 0], near[:, 1]), near[:, 2]), np.fmin(np.fmin(far[:, 0], far[:, 1]), far[:, 2])
+
+    @staticmethod
+    def intersect_rays_triangles(origins: np.ndarray, directions: np.ndarray, corners0: np.ndarray, corners1: np.ndarray, corners2: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        edge1 = corners1 - corners0
+        edge2 = corners2 - corners0
+
+        normal = np.cross(directions, edge2)
+        determinant = (edge1 * normal).sum(axis=1)
+        is_valid = np.abs(determinant) > np.finfo(np.float32).tiny
+        inverse = 1.0 / np.where(is_valid, determinant, 1.0)
+
+        offset = origins - corners0
+        u = (offset * normal).sum(axis=1) * inverse
+
+        cross = np.cross(offset, edge1)
+        v = (directions * cross).sum(axis=1) * inverse
+        distances = (edge2 * cross).sum(axis=1) * inverse
+
+        is_hit = is_valid & (u >= 0.0) & (v >= 0.0) & (u + v <= 1.0) & (distances >= 0.0)
+        return np.where(is_hit, distances, np.inf), u, v
+
+    @staticmethod
+    def compact_indices(index_buffer: np.ndarray, vertex_count: int) -> np.ndarray:
+        return index_buffer.astype(np.uint16 if vertex_count <= Geometry.SHORT_INDEX_LIMIT else np.uint32, copy=False)
\ No newline at end of file
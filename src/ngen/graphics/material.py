@@ -1,3 +1,244 @@
+from enum import Enum
+from OpenGL.GL import *
+
+from .shader import Shader
+from .texture import Texture
+from .shader_cache import ShaderCache
+from .texture_cache import TextureCache
 
 class Material:
-    pass
\ No newline at end of file
+
+    class Feature(Enum):
+        LIGHTING = "LIGHTING"
+        SPECULAR = "SPECULAR"
+        ALPHA_TEST = "ALPHA_TEST"
+
+    class TextureSlot(Enum):
+        ALBEDO = 0
+        EMISSIVE = 1
+        SPECULAR = 2
+
+    _VERTEX_SHADER = """
+        varying vec3 position;
+        varying vec3 normal;
+        varying vec2 texcoord;
+
+        void main() {
+            vec4 world_position = gl_ModelViewMatrix * gl_Vertex;
+
+            position = world_position.xyz;
+            normal = gl_NormalMatrix * gl_Normal;
+            texcoord = gl_MultiTexCoord0.xy;
+            gl_Position = gl_ProjectionMatrix * world_position;
+        }
+    """
+
+    _FRAGMENT_SHADER = """
+        uniform sampler2D albedo;
+        uniform vec4 base_color;
+        uniform vec4 specular_color;
+        uniform float shininess;
+        uniform float alpha_cutoff;
+        uniform float light_enabled[8];
+        uniform vec3 camera_position;
+
+        #ifdef EMISSIVE_TEXTURE
+        uniform sampler2D emissive;
+        #endif
+
+        #ifdef SPECULAR_TEXTURE
+        uniform sampler2D specular;
+        #endif
+
+        varying vec3 position;
+        varying vec3 normal;
+        varying vec2 texcoord;
+
+        void main() {
+            vec4 color = base_color * texture2D(albedo, texcoord);
+
+            #ifdef ALPHA_TEST
+            if (color.a < alpha_cutoff) {
+                discard;
+            }
+            #endif
+
+            #ifdef LIGHTING
+            vec3 surface_normal = normalize(normal);
+            vec3 view = normalize(camera_position - position);
+            vec4 lighting = gl_LightModel.ambient;
+            vec4 highlight = vec4(0.0);
+
+            for (int i = 0; i < 8; i++) {
+                if (light_enabled[i] > 0.0) {
+                    vec3 direction = gl_LightSource[i].position.xyz - position * gl_LightSource[i].position.w;
+                    float distance = length(direction);
+                    float attenuation = 1.0;
+                    direction /= max(distance, 0.000001);
+
+                    if (gl_LightSource[i].position.w != 0.0) {
+                        attenuation /= gl_LightSource[i].constantAttenuation + gl_LightSource[i].linearAttenuation * distance + gl_LightSource[i].quadraticAttenuation * distance * distance;
+
+                        if (gl_LightSource[i].spotCutoff <= 90.0) {
+                            float cosine = dot(-direction, normalize(gl_LightSource[i].spotDirection));
+                            attenuation *= cosine >= gl_LightSource[i].spotCosCutoff ? pow(max(cosine, 0.0), gl_LightSource[i].spotExponent) : 0.0;
+                        }
+                    }
+
+                    float diffuse = max(dot(surface_normal, direction), 0.0);
+                    lighting += attenuation * (gl_LightSource[i].ambient + gl_LightSource[i].diffuse * diffuse);
+
+                    #ifdef SPECULAR
+                    if (diffuse > 0.0) {
+                        highlight += attenuation * gl_LightSource[i].specular * pow(max(dot(surface_normal, normalize(direction + view)), 0.0), shininess);
+                    }
+                    #endif
+                }
+            }
+
+            color.rgb *= clamp(lighting.rgb, 0.0, 1.0);
+
+            #ifdef SPECULAR
+            #ifdef SPECULAR_TEXTURE
+            highlight *= texture2D(specular, texcoord);
+            #endif
+            color.rgb += specular_color.rgb * highlight.rgb;
+            #endif
+            #endif
+
+            #ifdef EMISSIVE_TEXTURE
+            color.rgb += texture2D(emissive, texcoord).rgb;
+            #endif
+
+            gl_FragColor = color;
+        }
+    """
+
+    _UNIFORM_SETTERS = {
+        1: glUniform1fv,
+        2: glUniform2fv,
+        3: glUniform3fv,
+        4: glUniform4fv,
+    }
+
+    _next_id = 1
+    _default = None
+    _loaded = {}
+
+    def __init__(self, features: list[Feature] = None, uniforms: dict[str, float | int | list[float]] = None, textures: dict[TextureSlot, Texture] = None, vertex_source: str = None, fragment_source: str = None) -> None:
+        self._id = Material._next_id
+        Material._next_id += 1
+
+        self._features = frozenset([Material.Feature.LIGHTING] if features is None else features)
+        self._uniforms = {"base_color": [1.0, 1.0, 1.0, 1.0], "specular_color": [1.0, 1.0, 1.0, 1.0], "shininess": 32.0, "alpha_cutoff": 0.5, **(uniforms or {})}
+        self._textures = {slot: TextureCache.retain(texture) for slot, texture in (textures or {}).items()}
+        self._vertex_source = vertex_source if vertex_source is not None else Material._VERTEX_SHADER
+        self._fragment_source = fragment_source if fragment_source is not None else Material._FRAGMENT_SHADER
+        self._revision = 0
+        self._program = None
+        self._program_generation = -1
+
+    def get_id(self) -> int:
+        return self._id
+
+    def get_features(self) -> frozenset[Feature]:
+        return self._features
+
+    def set_features(self, value: list[Feature]) -> None:
+        self._features = frozenset(value)
+        self._program_generation = -1
+
+    def get_uniforms(self) -> dict[str, float | int | list[float]]:
+        return self._uniforms
+
+    def get_uniform(self, name: str) -> float | int | list[float]:
+        return self._uniforms[name]
+
+    def set_uniform(self, name: str, value: float | int | list[float]) -> None:
+        self._uniforms[name] = value
+        self._revision += 1
+
+    def get_textures(self) -> dict[TextureSlot, Texture]:
+        return self._textures
+
+    def get_texture(self, slot: TextureSlot) -> Texture | None:
+        return self._textures.get(slot)
+
+    def set_texture(self, slot: TextureSlot, texture: Texture | None) -> None:
+        previous = self._textures.pop(slot, None)
+
+        if texture is not None:
+            self._textures[slot] = TextureCache.retain(texture)
+
+        if previous is not None:
+            TextureCache.release(previous)
+
+        self._revision += 1
+        self._program_generation = -1
+
+    def get_revision(self) -> int:
+        return self._revision
+
+    def get_program(self) -> Shader | None:
+        if self._program_generation != ShaderCache.get_generation():
+            defines = frozenset([feature.value for feature in self._features] + [f"{slot.name}_TEXTURE" for slot in self._textures])
+            self._program = ShaderCache.get_or_create(self._vertex_source, self._fragment_source, defines)
+            self._program_generation = ShaderCache.get_generation()
+
+        return self._program
+
+    def get_sort_key(self) -> tuple[int, int]:
+        program = self.get_program()
+        return 0 if program is None else program.get_id(), self._id
+
+    def bind(self, program: Shader) -> None:
+        if Material._loaded.get(program) != (self, self._revision):
+            for name, value in self._uniforms.items():
+                Material._set_uniform(program.get_uniform_location(name), value)
+
+            for slot in Material.TextureSlot:
+                Material._set_uniform(program.get_uniform_location(slot.name.lower()), slot.value)
+
+            Material._loaded[program] = (self, self._revision)
+
+        extra_textures = [(slot, texture) for slot, texture in self._textures.items() if slot is not Material.TextureSlot.ALBEDO]
+
+        for slot, texture in extra_textures:
+            glActiveTexture(GL_TEXTURE0 + slot.value)
+            glBindTexture(GL_TEXTURE_2D, texture.get_id())
+
+        if extra_textures:
+            glActiveTexture(GL_TEXTURE0)
+
+    def free(self) -> None:
+        for texture in self._textures.values():
+            TextureCache.release(texture)
+
+        self._textures.clear()
+
+    @staticmethod
+    def get_default() -> 'Material':
+        if Material._default is None:
+            Material._default = Material()
+
+        return Material._default
+
+    @staticmethod
+    def reset() -> None:
+        Material._loaded.clear()
+
+        if Material._default is not None:
+            Material._default.free()
+            Material._default = None
+
+    @staticmethod
+    def _set_uniform(location: int, value: float | int | list[float]) -> None:
+        if location < 0:
+            return
+
+        if isinstance(value, int):
+            glUniform1i(location, value)
+        elif isinstance(value, float):
+            glUniform1f(location, value)
+        else:
+            Material._UNIFORM_SETTERS[len(value)](location, 1, value)
\ No newline at end of file
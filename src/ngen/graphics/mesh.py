@@ -1,43 +1,273 @@
+import ctypes
+import numpy as np
 from OpenGL.GL import *
+from OpenGL.GL.VERSION.GL_3_0 import glInitGl30VERSION
+from OpenGL.GL.ARB.half_float_vertex import glInitHalfFloatVertexARB
+
+from .geometry import Geometry
+from .triangle_hierarchy import TriangleHierarchy
 
 class Mesh:
 
-    def __init__(self, faces: list[tuple], normals: list[float], vertices: list[float], texcoords: list[float]) -> None:
-        self._faces = faces
-        self._normals = normals
-        self._vertices = vertices
-        self._texcoords = texcoords
-        self._display_list = glGenLists(1)
+    _IDENTITY_DEQUANTIZATION = np.array([0.0, 0.0, 0.0, 1.0], dtype=np.float32)
+
+    def __init__(self, vertex_buffer: np.ndarray, index_buffer: np.ndarray, attributes: int, quantized: bool = False, retain_geometry: bool = False, variant_count: int = 1) -> None:
+        self._attributes = attributes
+        self._is_quantized = quantized and Mesh.supports_quantization()
+        self._index_count = index_buffer.size
+        self._vertex_count = vertex_buffer.shape[0] // variant_count
+        self._variant_count = variant_count
+        self._lods = []
+        self._triangle_hierarchy = None
+        self._bounds_min, self._bounds_max, self._bounding_sphere_center, self._bounding_sphere_radius = Geometry.compute_bounds(vertex_buffer[:self._vertex_count, Geometry.OFFSET_POSITION:Geometry.OFFSET_NORMAL])
+
+        self._positions = np.array(vertex_buffer[:self._vertex_count, Geometry.OFFSET_POSITION:Geometry.OFFSET_NORMAL], dtype=np.float32) if retain_geometry else None
+        self._indices = np.array(index_buffer, dtype=np.uint32) if retain_geometry else None
+
+        if self._is_quantized:
+            gpu_vertices, self._dequantization = Geometry.quantize(vertex_buffer, self._bounds_min, self._bounds_max)
+            self._dequantization_matrix = np.diag([self._dequantization[3]] * 3 + [1.0]).astype(np.float32)
+            self._dequantization_matrix[3, :3] = self._dequantization[:3]
+        else:
+            gpu_vertices, self._dequantization = np.ascontiguousarray(vertex_buffer, dtype=np.float32), Mesh._IDENTITY_DEQUANTIZATION
+            self._dequantization_matrix = None
+
+        gpu_indices = Geometry.compact_indices(index_buffer, self._vertex_count)
+        self._index_type = GL_UNSIGNED_SHORT if gpu_indices.dtype == np.uint16 else GL_UNSIGNED_INT
+        self._vertex_bytes = gpu_vertices.nbytes
+        self._index_bytes = gpu_indices.nbytes
+
+        self._vertex_array = None
+        self._index_buffer_id = glGenBuffers(1)
+        self._vertex_buffer_id = glGenBuffers(1)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._vertex_buffer_id)
+        glBufferData(GL_ARRAY_BUFFER, gpu_vertices.nbytes, gpu_vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._index_buffer_id)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, gpu_indices.nbytes, gpu_indices, GL_STATIC_DRAW)
+
+        if bool(glGenVertexArrays):
+            self._vertex_array = glGenVertexArrays(1)
+            glBindVertexArray(self._vertex_array)
+            self._bind_buffers()
+            glBindVertexArray(0)
+
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    @staticmethod
+    def supports_quantization() -> bool:
+        return bool(glInitHalfFloatVertexARB()) or bool(glInitGl30VERSION())
+
+    @staticmethod
+    def from_faces(faces: np.ndarray, face_offsets: np.ndarray, normals: np.ndarray, vertices: np.ndarray, texcoords: np.ndarray) -> 'Mesh':
+        return Mesh(*Geometry.build_indexed(faces, face_offsets, normals, vertices, texcoords))
+
+    @staticmethod
+    def from_levels(levels: list[tuple[np.ndarray, np.ndarray]], attributes: int, quantized: bool = False, retain_geometry: bool = False) -> 'Mesh':
+        mesh = Mesh(*levels[0], attributes, quantized, retain_geometry)
+        mesh.set_lods([Mesh(vertex_buffer, index_buffer, attributes, quantized, retain_geometry) for vertex_buffer, index_buffer in levels[1:]])
+        return mesh
+
+    def get_attributes(self) -> int:
+        return self._attributes
+
+    def get_index_count(self) -> int:
+        return self._index_count
+
+    def get_vertex_count(self) -> int:
+        return self._vertex_count
+
+    def get_variant_count(self) -> int:
+        return self._variant_count
+
+    def get_bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        return self._bounds_min, self._bounds_max
+
+    def get_bounding_sphere(self) -> tuple[np.ndarray, float]:
+        return self._bounding_sphere_center, self._bounding_sphere_radius
+
+    def get_is_quantized(self) -> bool:
+        return self._is_quantized
+
+    def get_dequantization(self) -> np.ndarray:
+        return self._dequantization
+
+    def get_positions(self) -> np.ndarray | None:
+        return self._positions
+
+    def get_indices(self) -> np.ndarray | None:
+        return self._indices
+
+    def get_triangle_hierarchy(self) -> TriangleHierarchy:
+        if self._triangle_hierarchy is None:
+            self._triangle_hierarchy = TriangleHierarchy(*self.read_triangles())
+
+        return self._triangle_hierarchy
+
+    def read_triangles(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._positions is not None:
+            return self._positions, self._indices
+
+        vertex_buffer, index_buffer = self.read_geometry()
+        return vertex_buffer[:, Geometry.OFFSET_POSITION:Geometry.OFFSET_NORMAL], index_buffer
+
+    def read_geometry(self, variant: int = 0) -> tuple[np.ndarray, np.ndarray]:
+        VARIANT_BYTES = self._vertex_bytes // self._variant_count
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._vertex_buffer_id)
+        vertices = np.frombuffer(glGetBufferSubData(GL_ARRAY_BUFFER, variant * VARIANT_BYTES, VARIANT_BYTES), dtype=Geometry.QUANTIZED_VERTEX if self._is_quantized else np.float32)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._index_buffer_id)
+        indices = np.frombuffer(glGetBufferSubData(GL_ELEMENT_ARRAY_BUFFER, 0, self._index_bytes), dtype=np.uint16 if self._index_type == GL_UNSIGNED_SHORT else np.uint32)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+        if self._is_quantized:
+            return Geometry.dequantize(vertices, self._dequantization), indices.astype(np.uint32)
 
-        glNewList(self._display_list, GL_COMPILE)
+        return vertices.reshape(-1, Geometry.VERTEX_COMPONENTS).copy(), indices.astype(np.uint32)
 
+    def remap_texcoords(self, regions: np.ndarray) -> 'Mesh':
+        vertex_buffer, index_buffer = self.read_geometry()
+
+        mesh = Mesh(Geometry.remap_texcoords(vertex_buffer, regions), index_buffer, self._attributes, self._is_quantized, self._positions is not None, regions.shape[0])
+        mesh.set_lods([lod.remap_texcoords(regions) for lod in self._lods])
+
+        return mesh
+
+    def get_memory_report(self) -> dict[str, int]:
+        report = {
+            "vertex_count": self._vertex_count * self._variant_count,
+            "index_count": self._index_count,
+            "full_cpu_bytes": self._vertex_count * self._variant_count * Geometry.VERTEX_STRIDE + self._index_count * np.dtype(np.uint32).itemsize,
+            "full_gpu_bytes": self._vertex_count * self._variant_count * Geometry.VERTEX_STRIDE + self._index_count * np.dtype(np.uint32).itemsize,
+            "cpu_bytes": (self._positions.nbytes + self._indices.nbytes) if self._positions is not None else 0,
+            "gpu_bytes": self._vertex_bytes + self._index_bytes,
+        }
+
+        for lod in self._lods:
+            for key, value in lod.get_memory_report().items():
+                report[key] += value
+
+        return report
+
+    def get_lods(self) -> list['Mesh']:
+        return self._lods
+
+    def set_lods(self, value: list['Mesh']) -> None:
+        self._lods = value
+
+    def get_lod(self, level: int) -> 'Mesh':
+        return self if level <= 0 else self._lods[min(level, len(self._lods)) - 1]
+
+    def get_lod_count(self) -> int:
+        return len(self._lods) + 1
+
+    def bind(self) -> None:
+        if self._vertex_array is not None:
+            glBindVertexArray(self._vertex_array)
+        else:
+            self._bind_buffers()
+
+        if self._is_quantized:
+            glEnable(GL_NORMALIZE)
+
+    def draw(self, variant: int = 0) -> None:
+        if self._dequantization_matrix is None:
+            self._draw_elements(variant)
+            return
+
+        glPushMatrix()
+        glMultMatrixf(self._dequantization_matrix)
+        self._draw_elements(variant)
+        glPopMatrix()
+
+    def draw_instanced(self, instance_count: int) -> None:
+        glDrawElementsInstanced(GL_TRIANGLES, self._index_count, self._index_type, None, instance_count)
+
+    def unbind(self) -> None:
+        if self._is_quantized:
+            glDisable(GL_NORMALIZE)
+
+        if self._vertex_array is not None:
+            glBindVertexArray(0)
+        else:
+            self._unbind_buffers()
+
+    def build(self, variant: int = 0) -> None:
         glFrontFace(GL_CCW)
         glEnable(GL_TEXTURE_2D)
 
-        for face in self._faces:
-            vertices, normals, texture_coords = face
+        self.bind()
+        self.draw(variant)
+        self.unbind()
 
-            glBegin(GL_POLYGON)
+        glDisable(GL_TEXTURE_2D)
 
-            for i in range(len(vertices)):
+    def free(self) -> None:
+        for lod in self._lods:
+            lod.free()
 
-                if normals[i] > 0:
-                    glNormal3fv(self._normals[normals[i] - 1])
+        self._lods = []
+        self._triangle_hierarchy = None
 
-                if texture_coords[i] > 0:
-                    glTexCoord2fv(self._texcoords[texture_coords[i] - 1])
+        if self._vertex_array is not None:
+            glDeleteVertexArrays(1, [self._vertex_array])
+            self._vertex_array = None
 
-                glVertex3fv(self._vertices[vertices[i] - 1])
+        if self._vertex_buffer_id is not None:
+            glDeleteBuffers(2, [self._vertex_buffer_id, self._index_buffer_id])
+            self._index_buffer_id = None
+            self._vertex_buffer_id = None
 
-            glEnd()
+    def _draw_elements(self, variant: int) -> None:
+        if variant == 0:
+            glDrawElements(GL_TRIANGLES, self._index_count, self._index_type, None)
+        else:
+            glDrawElementsBaseVertex(GL_TRIANGLES, self._index_count, self._index_type, None, variant * self._vertex_count)
 
-        glDisable(GL_TEXTURE_2D)
+    def _bind_buffers(self) -> None:
+        glBindBuffer(GL_ARRAY_BUFFER, self._vertex_buffer_id)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._index_buffer_id)
 
-        glEndList()
+        if self._is_quantized:
+            self._bind_quantized_pointers()
+        else:
+            self._bind_float_pointers()
 
-    def build(self) -> None:
-        glCallList(self._display_list)
+    def _bind_float_pointers(self) -> None:
+        FLOAT_SIZE = np.dtype(np.float32).itemsize
 
-    def free(self) -> None:
-        if self._display_list is not None:
-            glDeleteLists([self._display_list])
\ No newline at end of file
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, Geometry.VERTEX_STRIDE, ctypes.c_void_p(Geometry.OFFSET_POSITION * FLOAT_SIZE))
+
+        if self._attributes & Geometry.ATTRIBUTE_NORMALS:
+            glEnableClientState(GL_NORMAL_ARRAY)
+            glNormalPointer(GL_FLOAT, Geometry.VERTEX_STRIDE, ctypes.c_void_p(Geometry.OFFSET_NORMAL * FLOAT_SIZE))
+
+        if self._attributes & Geometry.ATTRIBUTE_TEXCOORDS:
+            glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+            glTexCoordPointer(2, GL_FLOAT, Geometry.VERTEX_STRIDE, ctypes.c_void_p(Geometry.OFFSET_TEXCOORD * FLOAT_SIZE))
+
+    def _bind_quantized_pointers(self) -> None:
+        STRIDE = Geometry.QUANTIZED_VERTEX.itemsize
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_SHORT, STRIDE, ctypes.c_void_p(Geometry.QUANTIZED_VERTEX.fields["position"][1]))
+
+        if self._attributes & Geometry.ATTRIBUTE_NORMALS:
+            glEnableClientState(GL_NORMAL_ARRAY)
+            glNormalPointer(GL_BYTE, STRIDE, ctypes.c_void_p(Geometry.QUANTIZED_VERTEX.fields["normal"][1]))
+
+        if self._attributes & Geometry.ATTRIBUTE_TEXCOORDS:
+            glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+            glTexCoordPointer(2, GL_HALF_FLOAT, STRIDE, ctypes.c_void_p(Geometry.QUANTIZED_VERTEX.fields["texcoord"][1]))
+
+    def _unbind_buffers(self) -> None:
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
\ No newline at end of file
@@ -0,0 +1,214 @@
+import numpy as np
+
+from .geometry import Geometry
+
+class MeshSimplifier:
+
+    _BOUNDARY_WEIGHT = 100.0
+    _FLIP_THRESHOLD = 0.2
+    _SINGULAR_EPSILON = 1e-10
+    _MIN_TRIANGLES = 32
+    _QUADRIC_SIZE = 4
+
+    @staticmethod
+    def build_lod_chain(vertex_buffer: np.ndarray, index_buffer: np.ndarray, level_count: int, reduction: float) -> list[tuple[np.ndarray, np.ndarray]]:
+        levels = [(vertex_buffer, index_buffer)]
+
+        while len(levels) < level_count:
+            previous_vertices, previous_indices = levels[-1]
+            triangle_count = previous_indices.size // 3
+            target = int(triangle_count * reduction)
+
+            if target < MeshSimplifier._MIN_TRIANGLES:
+                break
+
+            simplified = MeshSimplifier.simplify(previous_vertices, previous_indices, target)
+
+            if simplified[1].size >= previous_indices.size:
+                break
+
+            levels.append(simplified)
+
+        return levels
+
+    @staticmethod
+    def simplify(vertex_buffer: np.ndarray, index_buffer: np.ndarray, target_triangles: int) -> tuple[np.ndarray, np.ndarray]:
+        positions, weld = np.unique(vertex_buffer[:, Geometry.OFFSET_POSITION:Geometry.OFFSET_NORMAL].astype(np.float64), axis=0, return_inverse=True)
+        weld = weld.ravel()
+
+        representatives = np.empty(positions.shape[0], dtype=np.int64)
+        representatives[weld[::-1]] = np.arange(weld.size)[::-1]
+
+        corners = index_buffer.reshape(-1, 3).astype(np.int64)
+        triangles = weld[corners]
+
+        corners, triangles = MeshSimplifier._remove_degenerate(corners, triangles)
+
+        while triangles.shape[0] > target_triangles:
+            collapses = MeshSimplifier._select_collapses(positions, triangles, max(1, (triangles.shape[0] - target_triangles) // 2))
+
+            if collapses is None:
+                break
+
+            sources, destinations, targets = collapses
+
+            remap = np.arange(positions.shape[0])
+            remap[sources] = destinations
+            positions[destinations] = targets
+
+            collapsed = remap[triangles]
+            corners = np.where(collapsed != triangles, representatives[collapsed], corners)
+            corners, triangles = MeshSimplifier._remove_degenerate(corners, collapsed)
+
+        used, indices = np.unique(corners, return_inverse=True)
+
+        simplified = vertex_buffer[used].copy()
+        simplified[:, Geometry.OFFSET_POSITION:Geometry.OFFSET_NORMAL] = positions[weld[used]]
+
+        return simplified, indices.astype(np.uint32).ravel()
+
+    @staticmethod
+    def _remove_degenerate(corners: np.ndarray, triangles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        valid = (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) & (triangles[:, 0] != triangles[:, 2])
+        return corners[valid], triangles[valid]
+
+    @staticmethod
+    def _select_collapses(positions: np.ndarray, triangles: np.ndarray, budget: int) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        VERTEX_COUNT = positions.shape[0]
+
+        half_edges = np.concatenate((triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]))
+        keys = half_edges.min(axis=1) * VERTEX_COUNT + half_edges.max(axis=1)
+        keys, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+
+        edges = np.stack((keys // VERTEX_COUNT, keys % VERTEX_COUNT), axis=1)
+        quadrics = MeshSimplifier._compute_quadrics(positions, triangles, half_edges, counts[inverse] == 1)
+
+        costs, targets = MeshSimplifier._compute_costs(positions, quadrics, edges)
+
+        order = np.argsort(costs, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+
+        best = np.full(positions.shape[0], order.size, dtype=np.int64)
+        np.minimum.at(best, edges[:, 0], rank)
+        np.minimum.at(best, edges[:, 1], rank)
+
+        selected = np.flatnonzero((best[edges[:, 0]] == rank) & (best[edges[:, 1]] == rank) & np.isfinite(costs))
+        selected = selected[np.argsort(costs[selected], kind='stable')][:budget]
+
+        if selected.size == 0:
+            return None
+
+        sources = edges[selected, 1]
+        destinations = edges[selected, 0]
+        targets = targets[selected]
+
+        rejected = MeshSimplifier._find_flipped_vertices(positions, triangles, sources, destinations, targets)
+        accepted = ~(rejected[sources] | rejected[destinations])
+
+        if not accepted.any():
+            return None
+
+        return sources[accepted], destinations[accepted], targets[accepted]
+
+    @staticmethod
+    def _compute_quadrics(positions: np.ndarray, triangles: np.ndarray, half_edges: np.ndarray, is_boundary: np.ndarray) -> np.ndarray:
+        a, b, c = positions[triangles[:, 0]], positions[triangles[:, 1]], positions[triangles[:, 2]]
+
+        normals = np.cross(b - a, c - a)
+        areas = np.linalg.norm(normals, axis=1)
+        normals /= np.maximum(areas, MeshSimplifier._SINGULAR_EPSILON)[:, np.newaxis]
+
+        planes = np.concatenate((normals, -np.einsum('ij,ij->i', normals, a)[:, np.newaxis]), axis=1)
+        face_quadrics = planes[:, :, np.newaxis] * planes[:, np.newaxis, :] * (areas * 0.5)[:, np.newaxis, np.newaxis]
+
+        owners = [triangles[:, 0], triangles[:, 1], triangles[:, 2]]
+        contributions = [face_quadrics] * 3
+
+        face_of_edge = np.tile(np.arange(triangles.shape[0]), 3)
+
+        if is_boundary.any():
+            boundary = half_edges[is_boundary]
+            start, end = positions[boundary[:, 0]], positions[boundary[:, 1]]
+            direction = end - start
+
+            boundary_normals = np.cross(direction, normals[face_of_edge[is_boundary]])
+            lengths = np.linalg.norm(boundary_normals, axis=1)
+            boundary_normals /= np.maximum(lengths, MeshSimplifier._SINGULAR_EPSILON)[:, np.newaxis]
+
+            boundary_planes = np.concatenate((boundary_normals, -np.einsum('ij,ij->i', boundary_normals, start)[:, np.newaxis]), axis=1)
+            weights = MeshSimplifier._BOUNDARY_WEIGHT * np.einsum('ij,ij->i', direction, direction)
+            boundary_quadrics = boundary_planes[:, :, np.newaxis] * boundary_planes[:, np.newaxis, :] * weights[:, np.newaxis, np.newaxis]
+
+            owners.extend((boundary[:, 0], boundary[:, 1]))
+            contributions.extend((boundary_quadrics, boundary_quadrics))
+
+        owners = np.concatenate(owners)
+        contributions = np.concatenate(contributions).reshape(-1, MeshSimplifier._QUADRIC_SIZE * MeshSimplifier._QUADRIC_SIZE)
+
+        quadrics = np.empty((positions.shape[0], MeshSimplifier._QUADRIC_SIZE * MeshSimplifier._QUADRIC_SIZE))
+
+        for element in range(quadrics.shape[1]):
+            quadrics[:, element] = np.bincount(owners, contributions[:, element], minlength=positions.shape[0])
+
+        return quadrics.reshape(-1, MeshSimplifier._QUADRIC_SIZE, MeshSimplifier._QUADRIC_SIZE)
+
+    @staticmethod
+    def _compute_costs(positions: np.ndarray, quadrics: np.ndarray, edges: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        edge_quadrics = quadrics[edges[:, 0]] + quadrics[edges[:, 1]]
+        start, end = positions[edges[:, 0]], positions[edges[:, 1]]
+        middle = (start + end) * 0.5
+
+        candidates = [start, end, middle]
+
+        system = edge_quadrics[:, :3, :3]
+        solvable = np.abs(np.linalg.det(system)) > MeshSimplifier._SINGULAR_EPSILON
+        optimal = middle.copy()
+
+        if solvable.any():
+            optimal[solvable] = np.linalg.solve(system[solvable], -edge_quadrics[solvable, :3, 3:]).reshape(-1, 3)
+
+        lengths = np.linalg.norm(end - start, axis=1)
+        optimal = np.where((np.linalg.norm(optimal - middle, axis=1) <= lengths)[:, np.newaxis], optimal, middle)
+        candidates.append(optimal)
+
+        costs = np.stack([MeshSimplifier._evaluate(edge_quadrics, candidate) for candidate in candidates], axis=1)
+        choice = np.argmin(costs, axis=1)
+
+        rows = np.arange(edges.shape[0])
+        return costs[rows, choice], np.stack(candidates, axis=1)[rows, choice]
+
+    @staticmethod
+    def _evaluate(quadrics: np.ndarray, points: np.ndarray) -> np.ndarray:
+        homogeneous = np.concatenate((points, np.ones((points.shape[0], 1))), axis=1)
+        return np.maximum(np.einsum('ei,eij,ej->e', homogeneous, quadrics, homogeneous), 0.0)
+
+    @staticmethod
+    def _find_flipped_vertices(positions: np.ndarray, triangles: np.ndarray, sources: np.ndarray, destinations: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        remap = np.arange(positions.shape[0])
+        remap[sources] = destinations
+
+        moved_positions = positions.copy()
+        moved_positions[destinations] = targets
+
+        moved = np.zeros(positions.shape[0], dtype=bool)
+        moved[sources] = True
+        moved[destinations] = True
+
+        affected = triangles[moved[triangles].any(axis=1)]
+        collapsed = remap[affected]
+        survives = (collapsed[:, 0] != collapsed[:, 1]) & (collapsed[:, 1] != collapsed[:, 2]) & (collapsed[:, 0] != collapsed[:, 2])
+
+        affected, collapsed = affected[survives], collapsed[survives]
+
+        before = np.cross(positions[affected[:, 1]] - positions[affected[:, 0]], positions[affected[:, 2]] - positions[affected[:, 0]])
+        after = np.cross(moved_positions[collapsed[:, 1]] - moved_positions[collapsed[:, 0]], moved_positions[collapsed[:, 2]] - moved_positions[collapsed[:, 0]])
+
+        alignment = np.einsum('ij,ij->i', before, after)
+        scale = np.linalg.norm(before, axis=1) * np.linalg.norm(after, axis=1)
+        flipped = alignment < MeshSimplifier._FLIP_THRESHOLD * scale
+
+        rejected = np.zeros(positions.shape[0], dtype=bool)
+        rejected[affected[flipped].ravel()] = True
+
+        return rejected
\ No newline at end of file
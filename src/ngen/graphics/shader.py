@@ -0,0 +1,35 @@
+from OpenGL.GL import *
+from OpenGL.GL.shaders import compileProgram, compileShader
+
+class Shader:
+
+    def __init__(self, vertex_source: str, fragment_source: str) -> None:
+        self._locations = {}
+        self._program = compileProgram(compileShader(vertex_source, GL_VERTEX_SHADER), compileShader(fragment_source, GL_FRAGMENT_SHADER))
+
+    def get_id(self) -> int:
+        return self._program
+
+    def get_attribute_location(self, name: str) -> int:
+        key = ("attribute", name)
+
+        if key not in self._locations:
+            self._locations[key] = glGetAttribLocation(self._program, name)
+
+        return self._locations[key]
+
+    def get_uniform_location(self, name: str) -> int:
+        key = ("uniform", name)
+
+        if key not in self._locations:
+            self._locations[key] = glGetUniformLocation(self._program, name)
+
+        return self._locations[key]
+
+    def use(self) -> None:
+        glUseProgram(self._program)
+
+    def free(self) -> None:
+        if self._program is not None:
+            glDeleteProgram(self._program)
+            self._program = None
\ No newline at end of file
@@ -0,0 +1,57 @@
+from .shader import Shader
+
+class ShaderCache:
+
+    _VERSION = "#version 120\n"
+
+    _hits = 0
+    _misses = 0
+    _programs = {}
+    _generation = 0
+
+    @classmethod
+    def get_hits(cls) -> int:
+        return cls._hits
+
+    @classmethod
+    def get_misses(cls) -> int:
+        return cls._misses
+
+    @classmethod
+    def get_program_count(cls) -> int:
+        return sum(program is not None for program in cls._programs.values())
+
+    @classmethod
+    def get_generation(cls) -> int:
+        return cls._generation
+
+    @classmethod
+    def get_or_create(cls, vertex_source: str, fragment_source: str, features: frozenset[str]) -> Shader | None:
+        key = (vertex_source, fragment_source, features)
+
+        if key in cls._programs:
+            cls._hits += 1
+            return cls._programs[key]
+
+        cls._misses += 1
+
+        try:
+            program = Shader(ShaderCache.compose(vertex_source, features), ShaderCache.compose(fragment_source, features))
+        except RuntimeError:
+            program = None
+
+        cls._programs[key] = program
+        return program
+
+    @classmethod
+    def clear(cls) -> None:
+        for program in cls._programs.values():
+            if program is not None:
+                program.free()
+
+        cls._programs.clear()
+        cls._generation += 1
+
+    @staticmethod
+    def compose(source: str, features: frozenset[str]) -> str:
+        return ShaderCache._VERSION + "".join(f"#define {feature}\n" for feature in sorted(features)) + source
\ No newline at end of file
@@ -1,20 +1,114 @@
+import numpy as np
 from enum import Enum
 from OpenGL.GL import *
 from PIL import Image, ImageDraw
+from OpenGL.GL.EXT.texture_compression_s3tc import *
 
 class Texture:
 
+    _BYTES_PER_PIXEL = 4
+
+    _COMPRESSED_FORMATS = {
+        "bc1": GL_COMPRESSED_RGB_S3TC_DXT1_EXT,
+        "bc3": GL_COMPRESSED_RGBA_S3TC_DXT5_EXT,
+    }
+
     def __init__(self, texture: Image) -> None:
-        self._texture = texture
+        self._upload(*Texture.decode(texture))
+
+    def get_id(self) -> int:
+        return self._texture_id
+
+    def get_width(self) -> int:
+        return self._width
+
+    def get_height(self) -> int:
+        return self._height
+
+    def get_size_bytes(self) -> int:
+        return self._size_bytes
+
+    def read_pixels(self) -> np.ndarray:
+        glBindTexture(GL_TEXTURE_2D, self._texture_id)
+        pixels = np.frombuffer(glGetTexImage(GL_TEXTURE_2D, 0, GL_RGBA, GL_UNSIGNED_BYTE), dtype=np.uint8)
+        glBindTexture(GL_TEXTURE_2D, 0)
+
+        return pixels.reshape(self._height, self._width, Texture._BYTES_PER_PIXEL)
+
+    def free(self) -> None:
+        if self._texture_id is not None:
+            glDeleteTextures(1, [self._texture_id])
+            self._texture_id = None
+
+    @staticmethod
+    def from_pixels(width: int, height: int, pixels: bytes, max_level: int = None) -> 'Texture':
+        texture = Texture.__new__(Texture)
+        texture._upload(width, height, pixels, max_level)
+        return texture
+
+    @staticmethod
+    def from_levels(levels: list[tuple[int, int, np.ndarray]], texture_format: str) -> 'Texture':
+        texture = Texture.__new__(Texture)
+        texture._upload_levels(levels, texture_format)
+        return texture
+
+    @staticmethod
+    def supports_format(texture_format: str) -> bool:
+        return texture_format not in Texture._COMPRESSED_FORMATS or bool(glInitTextureCompressionS3TcEXT())
+
+    @staticmethod
+    def decode(texture: Image) -> tuple[int, int, bytes]:
+        if texture.mode != "RGBA":
+            texture = texture.convert("RGBA")
+
+        return texture.width, texture.height, texture.tobytes("raw", "RGBA", 0, -1)
+
+    @staticmethod
+    def get_min_filter(level_count: int) -> int:
+        return GL_LINEAR_MIPMAP_LINEAR if level_count > 1 else GL_LINEAR
+
+    @staticmethod
+    def compute_size_bytes(width: int, height: int) -> int:
+        size_bytes = 0
+
+        while True:
+            size_bytes += width * height * Texture._BYTES_PER_PIXEL
+
+            if width == 1 and height == 1:
+                return size_bytes
+
+            width = max(1, width // 2)
+            height = max(1, height // 2)
+
+    def _upload(self, width: int, height: int, pixels: bytes, max_level: int = None) -> None:
+        self._width = width
+        self._height = height
+        self._size_bytes = Texture.compute_size_bytes(width, height)
         self._texture_id = glGenTextures(1)
         glBindTexture(GL_TEXTURE_2D, self._texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, Texture.get_min_filter(max(width, height).bit_length() if max_level is None else max_level + 1))
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, texture.width, texture.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture.tobytes("raw", "RGBA", 0, -1))
+
+        if max_level is not None:
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, max_level)
+
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, pixels)
         glGenerateMipmap(GL_TEXTURE_2D)
 
-    def get_id(self) -> int:
-        return self._texture_id
+    def _upload_levels(self, levels: list[tuple[int, int, np.ndarray]], texture_format: str) -> None:
+        self._width, self._height = levels[0][:2]
+        self._size_bytes = sum(data.nbytes for _, _, data in levels)
+        self._texture_id = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self._texture_id)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, Texture.get_min_filter(len(levels)))
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, len(levels) - 1)
+
+        for level, (width, height, data) in enumerate(levels):
+            if texture_format in Texture._COMPRESSED_FORMATS:
+                glCompressedTexImage2D(GL_TEXTURE_2D, level, Texture._COMPRESSED_FORMATS[texture_format], width, height, 0, data)
+            else:
+                glTexImage2D(GL_TEXTURE_2D, level, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, data)
 
     @staticmethod
     def generate_missing_albedo(size: int = 256, colors: tuple = ("purple", "black")) -> Image:
@@ -0,0 +1,143 @@
+import numpy as np
+from typing import Hashable
+
+from .texture import Texture
+
+class TextureAtlas:
+
+    _CHANNELS = 4
+
+    def __init__(self, width: int, height: int, padding: int) -> None:
+        self._width = width
+        self._height = height
+        self._padding = padding
+        self._alignment = 1 << TextureAtlas.get_max_level(padding)
+        self._skyline = [(0, 0, width)]
+        self._pixels = np.zeros((height, width, TextureAtlas._CHANNELS), dtype=np.uint8)
+        self._rectangles = {}
+        self._used_area = 0
+        self._texture = None
+
+    def get_width(self) -> int:
+        return self._width
+
+    def get_height(self) -> int:
+        return self._height
+
+    def get_padding(self) -> int:
+        return self._padding
+
+    def get_pixels(self) -> np.ndarray:
+        return self._pixels
+
+    def get_texture(self) -> Texture | None:
+        return self._texture
+
+    def get_region_count(self) -> int:
+        return len(self._rectangles)
+
+    def get_keys(self) -> list[Hashable]:
+        return list(self._rectangles)
+
+    def get_used_height(self) -> int:
+        return max(y for _, y, _ in self._skyline)
+
+    def get_efficiency(self) -> float:
+        return self._used_area / (self._width * self._height)
+
+    def get_region(self, key: Hashable) -> np.ndarray:
+        x, y, width, height = self._rectangles[key]
+        return np.array([x / self._width, y / self._height, width / self._width, height / self._height], dtype=np.float32)
+
+    def add(self, key: Hashable, pixels: np.ndarray) -> bool:
+        HEIGHT, WIDTH = pixels.shape[:2]
+        PADDING = self._padding
+
+        placement = self._allocate(self._align(WIDTH + PADDING * 2), self._align(HEIGHT + PADDING * 2))
+
+        if placement is None:
+            return False
+
+        x, y = placement
+
+        self._pixels[y:y + HEIGHT + PADDING * 2, x:x + WIDTH + PADDING * 2] = np.pad(pixels, ((PADDING, PADDING), (PADDING, PADDING), (0, 0)), mode="wrap")
+        self._rectangles[key] = (x + PADDING, y + PADDING, WIDTH, HEIGHT)
+        self._used_area += WIDTH * HEIGHT
+
+        return True
+
+    def crop(self) -> None:
+        height = self._alignment
+
+        while height < self.get_used_height():
+            height *= 2
+
+        height = min(height, self._height)
+
+        self._pixels = self._pixels[:height]
+        self._height = height
+
+    def upload(self) -> Texture:
+        self._texture = Texture.from_pixels(self._width, self._height, np.ascontiguousarray(self._pixels).tobytes(), TextureAtlas.get_max_level(self._padding))
+        return self._texture
+
+    @staticmethod
+    def get_max_level(padding: int) -> int:
+        return max(padding, 1).bit_length() - 1
+
+    def _align(self, value: int) -> int:
+        return -(-value // self._alignment) * self._alignment
+
+    def _allocate(self, width: int, height: int) -> tuple[int, int] | None:
+        best = None
+
+        for index, (x, _, _) in enumerate(self._skyline):
+            if x + width > self._width:
+                break
+
+            y = self._fit(index, width)
+
+            if y + height <= self._height and (best is None or (y, x) < best[1:]):
+                best = (index, y, x)
+
+        if best is None:
+            return None
+
+        index, y, x = best
+        self._insert(index, x, y + height, width)
+
+        return x, y
+
+    def _fit(self, index: int, width: int) -> int:
+        end = self._skyline[index][0] + width
+        y = 0
+
+        for x, segment_y, _ in self._skyline[index:]:
+            if x >= end:
+                break
+
+            y = max(y, segment_y)
+
+        return y
+
+    def _insert(self, index: int, x: int, y: int, width: int) -> None:
+        end = x + width
+        skyline = self._skyline[:index] + [(x, y, width)]
+
+        for segment_x, segment_y, segment_width in self._skyline[index:]:
+            segment_end = segment_x + segment_width
+
+            if segment_end <= end:
+                continue
+
+            skyline.append((max(segment_x, end), segment_y, segment_end - max(segment_x, end)))
+
+        merged = []
+
+        for segment in skyline:
+            if merged and merged[-1][1] == segment[1]:
+                merged[-1] = (merged[-1][0], segment[1], merged[-1][2] + segment[2])
+            else:
+                merged.append(segment)
+
+        self._skyline = merged
\ No newline at end of file
@@ -0,0 +1,118 @@
+import os
+import threading
+from PIL import Image
+from typing import Callable
+
+from .texture import Texture, StandardTextures
+from .file_hasher import FileHasher
+
+class TextureCache:
+
+    MISSING_ALBEDO_KEY = "<missing_albedo>"
+
+    _hits = 0
+    _misses = 0
+    _textures = {}
+    _references = {}
+    _file_signatures = {}
+    _file_signatures_lock = threading.Lock()
+
+    @classmethod
+    def get_hits(cls) -> int:
+        return cls._hits
+
+    @classmethod
+    def get_misses(cls) -> int:
+        return cls._misses
+
+    @classmethod
+    def get_texture_count(cls) -> int:
+        return len(cls._get_resident_textures())
+
+    @classmethod
+    def get_resident_bytes(cls) -> int:
+        return sum(texture.get_size_bytes() for texture in cls._get_resident_textures())
+
+    @classmethod
+    def get_reference_count(cls, texture: Texture) -> int:
+        return cls._references.get(texture, 0)
+
+    @classmethod
+    def contains(cls, key: str | bytes) -> bool:
+        return key in cls._textures
+
+    @classmethod
+    def get_content_key(cls, path: str) -> bytes:
+        ABSOLUTE_PATH = os.path.abspath(path)
+        STAT = os.stat(ABSOLUTE_PATH)
+
+        with cls._file_signatures_lock:
+            signature = cls._file_signatures.get(ABSOLUTE_PATH)
+
+        if signature is None or signature[:2] != (STAT.st_mtime_ns, STAT.st_size):
+            signature = (STAT.st_mtime_ns, STAT.st_size, FileHasher.hash_file(ABSOLUTE_PATH))
+
+            with cls._file_signatures_lock:
+                cls._file_signatures[ABSOLUTE_PATH] = signature
+
+        return signature[2]
+
+    @classmethod
+    def load(cls, path: str) -> Texture:
+        return cls.get_or_create(cls.get_content_key(path), lambda: Texture(Image.open(path)))
+
+    @classmethod
+    def get_missing_albedo(cls) -> Texture:
+        return cls.get_or_create(TextureCache.MISSING_ALBEDO_KEY, lambda: Texture(StandardTextures.MISSING_ALBEDO.value))
+
+    @classmethod
+    def get_or_create(cls, key: str | bytes, create: Callable[[], Texture]) -> Texture:
+        texture = cls._textures.get(key)
+
+        if texture is not None:
+            cls._hits += 1
+            return cls.retain(texture)
+
+        cls._misses += 1
+        texture = create()
+        cls._textures[key] = texture
+        return cls.retain(texture)
+
+    @classmethod
+    def retain(cls, texture: Texture) -> Texture:
+        cls._references[texture] = cls._references.get(texture, 0) + 1
+        return texture
+
+    @classmethod
+    def release(cls, texture: Texture) -> None:
+        count = cls._references.get(texture, 0) - 1
+
+        if count > 0:
+            cls._references[texture] = count
+            return
+
+        cls._references.pop(texture, None)
+        keys = [key for key, value in cls._textures.items() if value is texture]
+
+        if not keys:
+            return
+
+        for key in keys:
+            del cls._textures[key]
+
+        texture.free()
+
+    @classmethod
+    def clear(cls) -> None:
+        for texture in cls._get_resident_textures():
+            texture.free()
+
+        cls._textures.clear()
+        cls._references.clear()
+
+        with cls._file_signatures_lock:
+            cls._file_signatures.clear()
+
+    @classmethod
+    def _get_resident_textures(cls) -> list[Texture]:
+        return list(dict.fromkeys([*cls._textures.values(), *cls._references]))
\ No newline at end of file
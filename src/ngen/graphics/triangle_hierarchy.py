@@ -0,0 +1,169 @@
+import numpy as np
+
+from .geometry import Geometry
+
+class TriangleHierarchy:
+
+    _LEAF_SIZE = 8
+    _MORTON_BITS = 10
+
+    def __init__(self, positions: np.ndarray, indices: np.ndarray) -> None:
+        corners = np.asarray(positions, dtype=np.float32)[np.asarray(indices, dtype=np.int64).reshape(-1, 3)]
+        triangle_min = corners.min(axis=1)
+        triangle_max = corners.max(axis=1)
+
+        self._order = np.argsort(TriangleHierarchy._get_morton_codes((triangle_min + triangle_max) * 0.5), kind='stable')
+        self._corners0 = np.ascontiguousarray(corners[self._order, 0])
+        self._corners1 = np.ascontiguousarray(corners[self._order, 1])
+        self._corners2 = np.ascontiguousarray(corners[self._order, 2])
+
+        self._node_start, self._node_count, self._node_left, self._node_right, levels = TriangleHierarchy._build_nodes(corners.shape[0])
+        self._node_min = np.zeros((self._node_start.size, 3), dtype=np.float32)
+        self._node_max = np.zeros((self._node_start.size, 3), dtype=np.float32)
+
+        if self._node_start.size:
+            self._fit_nodes(triangle_min[self._order], triangle_max[self._order], levels)
+
+    def get_triangle_count(self) -> int:
+        return self._order.size
+
+    def get_node_count(self) -> int:
+        return self._node_start.size
+
+    def get_bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._node_start.size == 0:
+            return np.zeros(3, dtype=np.float32), np.zeros(3, dtype=np.float32)
+
+        return self._node_min[0], self._node_max[0]
+
+    def intersect(self, origins: np.ndarray, directions: np.ndarray, max_distances: float | np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+        COUNT = origins.shape[0]
+
+        distances = np.array(np.broadcast_to(max_distances, COUNT), dtype=np.float64)
+        barycentrics = np.zeros((COUNT, 3), dtype=np.float64)
+        faces = np.full(COUNT, -1, dtype=np.int64)
+
+        if self._node_start.size == 0 or COUNT == 0:
+            distances[:] = np.inf
+            return distances, barycentrics, faces
+
+        with np.errstate(divide='ignore'):
+            inverse_directions = 1.0 / directions
+
+        rays = np.arange(COUNT)
+        nodes = np.zeros(COUNT, dtype=np.int64)
+
+        while rays.size:
+            entry, exit = Geometry.intersect_rays_aabbs(origins[rays], inverse_directions[rays], self._node_min[nodes], self._node_max[nodes])
+            is_hit = (entry <= exit) & (exit >= 0.0) & (entry <= distances[rays])
+            rays, nodes = rays[is_hit], nodes[is_hit]
+
+            is_leaf = self._node_left[nodes] < 0
+            leaves = nodes[is_leaf]
+
+            triangles = self._gather_ranges(leaves)
+            pair_rays = np.repeat(rays[is_leaf], self._node_count[leaves])
+            pair_distances, u, v = Geometry.intersect_rays_triangles(origins[pair_rays], directions[pair_rays], self._corners0[triangles], self._corners1[triangles], self._corners2[triangles])
+
+            closer = np.flatnonzero(pair_distances < distances[pair_rays])
+            nearest = closer[TriangleHierarchy.select_nearest(pair_rays[closer], pair_distances[closer])]
+            hit_rays = pair_rays[nearest]
+
+            distances[hit_rays] = pair_distances[nearest]
+            barycentrics[hit_rays] = np.stack((1.0 - u[nearest] - v[nearest], u[nearest], v[nearest]), axis=1)
+            faces[hit_rays] = self._order[triangles[nearest]]
+
+            internal = nodes[~is_leaf]
+            rays = np.tile(rays[~is_leaf], 2)
+            nodes = np.concatenate((self._node_left[internal], self._node_right[internal]))
+
+        distances[faces < 0] = np.inf
+        return distances, barycentrics, faces
+
+    @staticmethod
+    def select_nearest(rays: np.ndarray, distances: np.ndarray) -> np.ndarray:
+        if rays.size == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        order = np.lexsort((distances, rays))
+        sorted_rays = rays[order]
+
+        return order[np.concatenate(([True], sorted_rays[1:] != sorted_rays[:-1]))]
+
+    def _gather_ranges(self, nodes: np.ndarray) -> np.ndarray:
+        counts = self._node_count[nodes]
+        total = int(counts.sum())
+
+        if total == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        shifts = self._node_start[nodes] - (np.cumsum(counts) - counts)
+        return np.repeat(shifts, counts) + np.arange(total)
+
+    def _fit_nodes(self, triangle_min: np.ndarray, triangle_max: np.ndarray, levels: list[np.ndarray]) -> None:
+        leaves = np.flatnonzero(self._node_left < 0)
+        leaves = leaves[np.argsort(self._node_start[leaves])]
+
+        self._node_min[leaves] = np.minimum.reduceat(triangle_min, self._node_start[leaves])
+        self._node_max[leaves] = np.maximum.reduceat(triangle_max, self._node_start[leaves])
+
+        for level in reversed(levels):
+            internal = level[self._node_left[level] >= 0]
+            self._node_min[internal] = np.minimum(self._node_min[self._node_left[internal]], self._node_min[self._node_right[internal]])
+            self._node_max[internal] = np.maximum(self._node_max[self._node_left[internal]], self._node_max[self._node_right[internal]])
+
+    @staticmethod
+    def _build_nodes(triangle_count: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[np.ndarray]]:
+        starts, counts, lefts, rights, levels = [], [], [], [], []
+
+        if triangle_count == 0:
+            EMPTY = np.zeros(0, dtype=np.int64)
+            return EMPTY, EMPTY.copy(), EMPTY.copy(), EMPTY.copy(), levels
+
+        level_start = np.zeros(1, dtype=np.int64)
+        level_count = np.full(1, triangle_count, dtype=np.int64)
+        first_node = 0
+
+        while level_start.size:
+            is_split = level_count > TriangleHierarchy._LEAF_SIZE
+            children = first_node + level_start.size + np.arange(int(is_split.sum())) * 2
+
+            left = np.full(level_start.size, -1, dtype=np.int64)
+            right = np.full(level_start.size, -1, dtype=np.int64)
+            left[is_split] = children
+            right[is_split] = children + 1
+
+            starts.append(level_start)
+            counts.append(level_count)
+            lefts.append(left)
+            rights.append(right)
+            levels.append(np.arange(first_node, first_node + level_start.size))
+
+            first_node += level_start.size
+            half = level_count[is_split] // 2
+
+            level_start = np.stack((level_start[is_split], level_start[is_split] + half), axis=1).ravel()
+            level_count = np.stack((half, level_count[is_split] - half), axis=1).ravel()
+
+        return np.concatenate(starts), np.concatenate(counts), np.concatenate(lefts), np.concatenate(rights), levels
+
+    @staticmethod
+    def _get_morton_codes(centers: np.ndarray) -> np.ndarray:
+        if centers.shape[0] == 0:
+            return np.zeros(0, dtype=np.uint32)
+
+        LIMIT = (1 << TriangleHierarchy._MORTON_BITS) - 1
+        bounds_min = centers.min(axis=0)
+        extent = np.maximum(centers.max(axis=0) - bounds_min, np.finfo(np.float32).tiny)
+
+        cells = np.clip((centers - bounds_min) / extent * LIMIT, 0, LIMIT).astype(np.uint32)
+        return (TriangleHierarchy._spread_bits(cells[:, 0]) << 2) | (TriangleHierarchy._spread_bits(cells[:, 1]) << 1) | TriangleHierarchy._spread_bits(cells[:, 2])
+
+    @staticmethod
+    def _spread_bits(values: np.ndarray) -> np.ndarray:
+        values = (values | (values << 16)) & 0x030000FF
+        values = (values | (values << 8)) & 0x0300F00F
+        values = (values | (values << 4)) & 0x030C30C3
+        return (values | (values << 2)) & 0x09249249
\ No newline at end of file
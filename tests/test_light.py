@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from ngen.api.scene import Scene
+from ngen.api.entity import Entity
+from ngen.api.transform import Transform
+from ngen.api.camera import CameraPerspective
+from ngen.api.light import Light, LightPoint, LightSource
+from ngen.engine.light_manager import LightManager
+from benchmarks.gl_stub import RecordingGL
+
+def create_transform(position: list[float] = None) -> Transform:
+    return Transform(position or [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0])
+
+@pytest.fixture
+def gl() -> RecordingGL:
+    with RecordingGL(True) as recording:
+        yield recording
+        LightManager.reset()
+
+def test_subclasses_keep_their_delegate_positions() -> None:
+    started = []
+    light = LightPoint(create_transform(), LightSource.LIGHT0, [1.0, 1.0, 1.0, 1.0], 0.0, 1.0, 0.0, started.append)
+
+    light.start()
+
+    assert started == [light]
+
+def test_render_delegate_is_deprecated_but_still_runs_after_upload(gl: RecordingGL) -> None:
+    rendered = []
+
+    with pytest.deprecated_call():
+        light = Light(create_transform(), Light.Type.DIRECTIONAL, LightSource.LIGHT0, [1.0, 1.0, 1.0, 1.0], lambda: rendered.append(gl.get_log()[-1][0]))
+
+    entity = Entity(create_transform(), None)
+    scene = Scene([0.0, 0.0, 0.0, 1.0], CameraPerspective(create_transform(), 70.0, 0.1, 100.0), entity, light)
+
+    LightManager.update(scene, np.zeros(3))
+    LightManager.bind(entity)
+
+    assert rendered == ["glLightfv"]
\ No newline at end of file
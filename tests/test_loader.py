@@ -0,0 +1,153 @@
+import pytest
+from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+
+from ngen.api.scene import Scene
+from ngen.api.entity import Entity
+from ngen.api.transform import Transform
+from ngen.api.camera import CameraPerspective
+from ngen.engine.loader import Loader
+from ngen.graphics.mesh import Mesh
+from ngen.graphics.texture_cache import TextureCache
+from benchmarks.gl_stub import RecordingGL
+
+TRIANGLE = b"v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n"
+
+@pytest.fixture
+def gl() -> RecordingGL:
+    with RecordingGL() as recording:
+        yield recording
+        Loader.shutdown()
+        TextureCache.clear()
+
+@pytest.fixture
+def freed(monkeypatch: pytest.MonkeyPatch) -> list[Mesh]:
+    meshes = []
+    FREE = Mesh.free
+
+    def free(mesh: Mesh) -> None:
+        meshes.append(mesh)
+        FREE(mesh)
+
+    monkeypatch.setattr(Mesh, "free", free)
+    return meshes
+
+def create_transform() -> Transform:
+    return Transform([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0])
+
+def write_texture(path, color: tuple[int, int, int, int]) -> str:
+    Image.new("RGBA", (4, 4), color).save(path)
+    return str(path)
+
+def write_mesh(path) -> str:
+    path.write_bytes(TRIANGLE)
+    return str(path)
+
+def test_texture_request_replaces_the_placeholder_on_upload(gl: RecordingGL, tmp_path) -> None:
+    entity = Entity(create_transform(), None)
+    placeholder = entity.get_texture_albedo()
+    request = Loader.load_texture_async(write_texture(tmp_path / "albedo.png", (255, 0, 0, 255)))
+
+    entity.set_texture_albedo_request(request)
+
+    assert entity.get_texture_albedo() is placeholder
+
+    Loader.wait_for_uploads()
+
+    assert entity.get_texture_albedo() is request.get_asset()
+    assert entity.get_texture_albedo_request() is None
+
+def test_mesh_request_is_applied_by_process_uploads(gl: RecordingGL, tmp_path) -> None:
+    entity = Entity(create_transform(), None)
+    request = Loader.load_mesh_async(write_mesh(tmp_path / "mesh.obj"))
+
+    entity.set_mesh_request(request)
+
+    while not request.is_ready_for_upload():
+        pass
+
+    assert entity.get_mesh() is None
+    assert Loader.process_uploads(1.0) == 1
+    assert entity.get_mesh() is request.get_asset()
+
+def test_request_attached_after_completion_applies_immediately(gl: RecordingGL, tmp_path) -> None:
+    request = Loader.load_mesh_async(write_mesh(tmp_path / "mesh.obj"))
+    Loader.wait_for_uploads()
+
+    entity = Entity(create_transform(), None)
+    entity.set_mesh_request(request)
+
+    assert entity.get_mesh() is request.get_asset()
+
+def test_latest_request_wins(gl: RecordingGL, tmp_path) -> None:
+    entity = Entity(create_transform(), None)
+    first = Loader.load_texture_async(write_texture(tmp_path / "first.png", (255, 0, 0, 255)))
+    second = Loader.load_texture_async(write_texture(tmp_path / "second.png", (0, 255, 0, 255)))
+
+    entity.set_texture_albedo_request(first)
+    entity.set_texture_albedo_request(second)
+    Loader.wait_for_uploads()
+
+    assert entity.get_texture_albedo() is second.get_asset()
+    assert TextureCache.get_reference_count(first.get_asset()) == 0
+    assert TextureCache.get_reference_count(second.get_asset()) == 1
+
+def test_superseded_mesh_request_frees_its_mesh(gl: RecordingGL, freed: list[Mesh], tmp_path) -> None:
+    entity = Entity(create_transform(), None)
+    first = Loader.load_mesh_async(write_mesh(tmp_path / "first.obj"))
+    second = Loader.load_mesh_async(write_mesh(tmp_path / "second.obj"))
+
+    entity.set_mesh_request(first)
+    entity.set_mesh_request(second)
+    Loader.wait_for_uploads()
+
+    assert entity.get_mesh() is second.get_asset()
+    assert freed == [first.get_asset()]
+
+def test_destroy_cancels_pending_requests(gl: RecordingGL, tmp_path) -> None:
+    entity = Entity(create_transform(), None)
+    request = Loader.load_mesh_async(write_mesh(tmp_path / "mesh.obj"))
+
+    entity.set_mesh_request(request)
+    Scene([0.0, 0.0, 0.0, 1.0], CameraPerspective(create_transform(), 70.0, 0.1, 100.0), entity).destroy(entity)
+    Loader.wait_for_uploads()
+
+    assert entity.get_mesh() is None
+    assert entity.get_mesh_request() is None
+
+def test_destroy_releases_cancelled_requests(gl: RecordingGL, freed: list[Mesh], tmp_path) -> None:
+    entity = Entity(create_transform(), None)
+    mesh_request = Loader.load_mesh_async(write_mesh(tmp_path / "mesh.obj"))
+    texture_request = Loader.load_texture_async(write_texture(tmp_path / "albedo.png", (255, 0, 0, 255)))
+
+    entity.set_mesh_request(mesh_request)
+    entity.set_texture_albedo_request(texture_request)
+    Scene([0.0, 0.0, 0.0, 1.0], CameraPerspective(create_transform(), 70.0, 0.1, 100.0), entity).destroy(entity)
+    Loader.wait_for_uploads()
+
+    assert freed == [mesh_request.get_asset()]
+    assert TextureCache.get_reference_count(texture_request.get_asset()) == 0
+
+def test_adopted_texture_request_holds_one_reference(gl: RecordingGL, tmp_path) -> None:
+    entity = Entity(create_transform(), None)
+    request = Loader.load_texture_async(write_texture(tmp_path / "albedo.png", (255, 0, 0, 255)))
+
+    entity.set_texture_albedo_request(request)
+    Loader.wait_for_uploads()
+
+    assert TextureCache.get_reference_count(request.get_asset()) == 1
+
+    Scene([0.0, 0.0, 0.0, 1.0], CameraPerspective(create_transform(), 70.0, 0.1, 100.0), entity).destroy(entity)
+
+    assert TextureCache.get_reference_count(request.get_asset()) == 0
+
+def test_content_keys_are_consistent_across_threads(tmp_path) -> None:
+    paths = [write_texture(tmp_path / f"{index}.png", (index, 0, 0, 255)) for index in range(16)]
+    expected = [TextureCache.get_content_key(path) for path in paths]
+
+    TextureCache.clear()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        keys = list(executor.map(TextureCache.get_content_key, paths * 8))
+
+    assert keys == expected * 8
\ No newline at end of file
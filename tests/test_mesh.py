@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+from OpenGL.GL import GL_ARRAY_BUFFER, GL_ELEMENT_ARRAY_BUFFER, GL_TRIANGLES, GL_UNSIGNED_SHORT, GL_VERTEX_ARRAY, GL_NORMAL_ARRAY, GL_TEXTURE_COORD_ARRAY, GL_FLOAT, GL_HALF_FLOAT
+
+import ngen.graphics.mesh as mesh_module
+from ngen.graphics.mesh import Mesh
+from ngen.graphics.geometry import Geometry
+from ngen.engine.obj_parser import ObjParser
+from benchmarks.gl_stub import RecordingGL
+
+QUAD = b"v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\nvn 0 0 1\nvt 0 0\nvt 1 0\nvt 1 1\nvt 0 1\nf 1/1/1 2/2/1 3/3/1 4/4/1\n"
+
+def create_geometry() -> tuple[np.ndarray, np.ndarray, int]:
+    return Geometry.build_indexed(*ObjParser.parse_bytes(QUAD))
+
+def names(gl: RecordingGL) -> list[str]:
+    return [name for name, _ in gl.get_log()]
+
+def calls(gl: RecordingGL, name: str) -> list[tuple]:
+    return [arguments for call, arguments in gl.get_log() if call == name]
+
+@pytest.fixture
+def without_vertex_arrays(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(mesh_module, "glGenVertexArrays", None)
+
+@pytest.fixture
+def without_half_float_vertices(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Mesh, "supports_quantization", staticmethod(lambda: False))
+
+def test_creation_uploads_vertex_and_index_buffers() -> None:
+    vertex_buffer, index_buffer, attributes = create_geometry()
+
+    with RecordingGL(True) as gl:
+        mesh = Mesh(vertex_buffer, index_buffer, attributes)
+
+    uploads = calls(gl, "glBufferData")
+
+    assert len(calls(gl, "glGenBuffers")) == 2
+    assert [(target, size) for target, size, *_ in uploads] == [(GL_ARRAY_BUFFER, vertex_buffer.nbytes), (GL_ELEMENT_ARRAY_BUFFER, index_buffer.size * 2)]
+    assert mesh.get_index_count() == 6
+    assert mesh.get_vertex_count() == 4
+
+def test_creation_records_buffer_bindings_inside_vertex_array() -> None:
+    vertex_buffer, index_buffer, attributes = create_geometry()
+
+    with RecordingGL(True) as gl:
+        Mesh(vertex_buffer, index_buffer, attributes)
+
+    log = names(gl)
+    first, last = log.index("glBindVertexArray"), len(log) - 1 - log[::-1].index("glBindVertexArray")
+
+    assert calls(gl, "glBindVertexArray")[-1] == (0,)
+    assert {"glVertexPointer", "glNormalPointer", "glTexCoordPointer"} <= set(log[first:last])
+    assert calls(gl, "glBindBuffer")[-2:] == [(GL_ARRAY_BUFFER, 0), (GL_ELEMENT_ARRAY_BUFFER, 0)]
+
+def test_bind_draw_unbind_with_vertex_array() -> None:
+    vertex_buffer, index_buffer, attributes = create_geometry()
+
+    with RecordingGL(True) as gl:
+        mesh = Mesh(vertex_buffer, index_buffer, attributes)
+        vertex_array = calls(gl, "glBindVertexArray")[0][0]
+        gl.reset()
+
+        mesh.bind()
+        mesh.draw()
+        mesh.unbind()
+
+    assert gl.get_log() == [
+        ("glBindVertexArray", (vertex_array,)),
+        ("glDrawElements", (GL_TRIANGLES, 6, GL_UNSIGNED_SHORT, None)),
+        ("glBindVertexArray", (0,)),
+    ]
+
+def test_bind_draw_unbind_falls_back_to_client_arrays(without_vertex_arrays: None) -> None:
+    vertex_buffer, index_buffer, attributes = create_geometry()
+
+    with RecordingGL(True) as gl:
+        mesh = Mesh(vertex_buffer, index_buffer, attributes)
+
+        assert "glBindVertexArray" not in names(gl)
+        gl.reset()
+
+        mesh.bind()
+        bind_log = names(gl)
+        gl.reset()
+
+        mesh.draw()
+        mesh.unbind()
+
+    assert bind_log[:2] == ["glBindBuffer", "glBindBuffer"]
+    assert {"glVertexPointer", "glNormalPointer", "glTexCoordPointer"} <= set(bind_log)
+    assert gl.get_log()[0] == ("glDrawElements", (GL_TRIANGLES, 6, GL_UNSIGNED_SHORT, None))
+    assert calls(gl, "glDisableClientState") == [(GL_TEXTURE_COORD_ARRAY,), (GL_NORMAL_ARRAY,), (GL_VERTEX_ARRAY,)]
+    assert calls(gl, "glBindBuffer") == [(GL_ARRAY_BUFFER, 0), (GL_ELEMENT_ARRAY_BUFFER, 0)]
+
+def test_free_deletes_buffers_and_vertex_array() -> None:
+    vertex_buffer, index_buffer, attributes = create_geometry()
+
+    with RecordingGL(True) as gl:
+        mesh = Mesh(vertex_buffer, index_buffer, attributes)
+        gl.reset()
+
+        mesh.free()
+        mesh.free()
+
+    assert names(gl) == ["glDeleteVertexArrays", "glDeleteBuffers"]
+
+def test_quantized_mesh_uses_half_float_texcoords() -> None:
+    vertex_buffer, index_buffer, attributes = create_geometry()
+
+    with RecordingGL(True) as gl:
+        mesh = Mesh(vertex_buffer, index_buffer, attributes, True)
+
+    assert mesh.get_is_quantized()
+    assert calls(gl, "glTexCoordPointer")[0][1] == GL_HALF_FLOAT
+
+def test_quantization_falls_back_to_float_without_half_float_vertices(without_half_float_vertices: None) -> None:
+    vertex_buffer, index_buffer, attributes = create_geometry()
+
+    with RecordingGL(True) as gl:
+        mesh = Mesh(vertex_buffer, index_buffer, attributes, True)
+
+    assert not mesh.get_is_quantized()
+    assert calls(gl, "glBufferData")[0][1] == vertex_buffer.nbytes
+    assert calls(gl, "glTexCoordPointer")[0][1] == GL_FLOAT
\ No newline at end of file
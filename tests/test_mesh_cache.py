@@ -0,0 +1,60 @@
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from ngen.engine.mesh_cache import MeshCache
+from ngen.graphics.geometry import Geometry
+from ngen.graphics.file_hasher import FileHasher
+
+def create_levels(vertex_count: int) -> list[tuple[np.ndarray, np.ndarray]]:
+    vertex_buffer = np.arange(vertex_count * Geometry.VERTEX_COMPONENTS, dtype=np.float32).reshape(vertex_count, Geometry.VERTEX_COMPONENTS)
+    return [(vertex_buffer, np.arange(vertex_count, dtype=np.uint32))]
+
+def test_store_then_load_round_trips(tmp_path) -> None:
+    source_path = str(tmp_path / "mesh.obj")
+    (tmp_path / "mesh.obj").write_bytes(b"v 0 0 0\n")
+
+    assert MeshCache.store(source_path, create_levels(6), 3, 1, 0.5)
+
+    levels, attributes = MeshCache.load(source_path, 1, 0.5)
+
+    assert attributes == 3
+    np.testing.assert_array_equal(levels[0][0], create_levels(6)[0][0])
+    np.testing.assert_array_equal(levels[0][1], create_levels(6)[0][1])
+
+def test_concurrent_stores_of_one_path_do_not_collide(tmp_path) -> None:
+    source_path = str(tmp_path / "mesh.obj")
+    (tmp_path / "mesh.obj").write_bytes(b"v 0 0 0\n")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: MeshCache.store(source_path, create_levels(30_000), 3, 1, 0.5), range(16)))
+
+    assert all(results)
+    assert MeshCache.load(source_path, 1, 0.5) is not None
+    assert not [path for path in tmp_path.iterdir() if path.suffix == ".tmp"]
+
+def test_touched_source_keeps_cache_until_content_changes(tmp_path) -> None:
+    source_path = tmp_path / "mesh.obj"
+    source_path.write_bytes(b"v 0 0 0\n")
+
+    assert MeshCache.store(str(source_path), create_levels(6), 3, 1, 0.5)
+
+    os.utime(source_path, ns=(0, 0))
+
+    assert MeshCache.load(str(source_path), 1, 0.5) is not None
+    assert np.fromfile(MeshCache.get_cache_path(str(source_path)), dtype=MeshCache._HEADER, count=1)["source_mtime_ns"][0] == 0
+
+    source_path.write_bytes(b"v 1 0 0\n")
+
+    assert MeshCache.load(str(source_path), 1, 0.5) is None
+
+def test_hash_with_trailing_zero_bytes_survives_round_trip(tmp_path, monkeypatch) -> None:
+    source_path = tmp_path / "mesh.obj"
+    source_path.write_bytes(b"v 0 0 0\n")
+    monkeypatch.setattr(FileHasher, "hash_file", lambda path: b"\x01" * 30 + b"\0\0")
+
+    assert MeshCache.store(str(source_path), create_levels(6), 3, 1, 0.5)
+
+    os.utime(source_path, ns=(0, 0))
+
+    assert MeshCache.load(str(source_path), 1, 0.5) is not None
\ No newline at end of file
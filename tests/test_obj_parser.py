@@ -0,0 +1,31 @@
+import os
+import numpy as np
+
+from ngen.engine.obj_parser import ObjParser
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def parse_fixture(name: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    return ObjParser.parse(os.path.join(FIXTURES, name))
+
+def test_indented_records_and_inline_comments_match_plain_file() -> None:
+    for parsed, expected in zip(parse_fixture("indented_comments.obj"), parse_fixture("plain.obj")):
+        np.testing.assert_array_equal(parsed, expected)
+
+def test_indented_vertices_keep_face_indices_in_range() -> None:
+    faces, _, _, vertices, _ = ObjParser.parse_bytes(b"  v 0 0 0\n\tv 1 0 0\n v 0 1 0\nf 1 2 3\n")
+
+    assert vertices.shape == (3, 3)
+    assert faces[:, 0].tolist() == [0, 1, 2]
+
+def test_inline_comment_after_vertex() -> None:
+    _, _, _, vertices, _ = ObjParser.parse_bytes(b"v 0 0 0 # c\nv 1 2 3#c\n")
+
+    np.testing.assert_array_equal(vertices, [[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]])
+
+def test_comment_only_lines_are_ignored() -> None:
+    faces, face_offsets, _, vertices, _ = ObjParser.parse_bytes(b"# v 9 9 9\n  # f 1 2 3\nv 0 0 0\r\nv 1 0 0\r\nv 0 1 0\r\nf 1 2 3 # tri\r\n")
+
+    assert vertices.shape == (3, 3)
+    assert face_offsets.tolist() == [0, 3]
+    assert faces[:, 0].tolist() == [0, 1, 2]
\ No newline at end of file
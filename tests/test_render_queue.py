@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+from PIL import Image
+from OpenGL.GL import GL_FALSE, GL_TRUE
+
+from ngen.api.entity import Entity
+from ngen.api.transform import Transform
+from ngen.engine.obj_parser import ObjParser
+from ngen.engine.preferences import Preferences
+from ngen.engine.render_queue import RenderQueue
+from ngen.engine.light_manager import LightManager
+from ngen.graphics.mesh import Mesh
+from ngen.graphics.texture import Texture
+from ngen.graphics.geometry import Geometry
+from benchmarks.gl_stub import RecordingGL
+
+TRIANGLE = b"v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n"
+
+@pytest.fixture
+def gl() -> RecordingGL:
+    IS_SHADER_RENDERING_ENABLED = Preferences.get_shader_rendering_enabled()
+    Preferences.set_shader_rendering_enabled(False)
+
+    with RecordingGL(True) as recording:
+        yield recording
+
+    Preferences.set_shader_rendering_enabled(IS_SHADER_RENDERING_ENABLED)
+
+def create_mesh() -> Mesh:
+    return Mesh(*Geometry.build_indexed(*ObjParser.parse_bytes(TRIANGLE)))
+
+def create_texture() -> Texture:
+    return Texture(Image.new("RGBA", (1, 1)))
+
+def create_entity(mesh: Mesh, texture: Texture, position: list[float] = None) -> Entity:
+    return Entity(Transform(position or [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), mesh, texture)
+
+def flush(gl: RecordingGL, render_queue: RenderQueue, entities: list[Entity]) -> None:
+    for entity in entities:
+        render_queue.submit(entity)
+
+    gl.reset()
+    render_queue.flush([0.0, 0.0, 0.0])
+
+def get_calls(gl: RecordingGL, name: str) -> list[tuple]:
+    return [arguments for call, arguments in gl.get_log() if call == name]
+
+def test_identical_state_is_bound_once(gl: RecordingGL) -> None:
+    render_queue = RenderQueue()
+    mesh, texture = create_mesh(), create_texture()
+
+    flush(gl, render_queue, [create_entity(mesh, texture) for _ in range(5)])
+
+    assert render_queue.get_draw_calls() == 5
+    assert render_queue.get_state_changes() == 3
+    assert render_queue.get_texture_binds() == 1
+    assert render_queue.get_binds_avoided() == 12
+    assert len(get_calls(gl, "glDrawElements")) == 5
+
+def test_opaque_draws_are_grouped_by_texture_and_mesh(gl: RecordingGL) -> None:
+    render_queue = RenderQueue()
+    meshes = [create_mesh(), create_mesh()]
+    textures = [create_texture(), create_texture()]
+
+    entities = [create_entity(meshes[index % 2], textures[index // 2 % 2]) for index in range(8)]
+    flush(gl, render_queue, entities)
+
+    bound_textures = [texture_id for _, texture_id in get_calls(gl, "glBindTexture") if texture_id != 0]
+
+    assert bound_textures == sorted(texture.get_id() for texture in textures)
+    assert render_queue.get_texture_binds() == 2
+    assert render_queue.get_state_changes() == 1 + 2 + 4
+    assert render_queue.get_binds_avoided() == 7 + 6 + 4
+
+def test_light_rows_are_grouped_before_textures(gl: RecordingGL, monkeypatch: pytest.MonkeyPatch) -> None:
+    render_queue = RenderQueue()
+    mesh = create_mesh()
+    textures = [create_texture(), create_texture()]
+
+    entities = [create_entity(mesh, textures[index % 2]) for index in range(8)]
+    rows = {entity: (index // 2 % 2,) for index, entity in enumerate(entities)}
+    bound_rows = []
+
+    monkeypatch.setattr(LightManager, "get_row", classmethod(lambda cls, entity: rows[entity]))
+    monkeypatch.setattr(LightManager, "bind", classmethod(lambda cls, entity: bound_rows.append(rows[entity])))
+
+    flush(gl, render_queue, entities)
+
+    assert bound_rows == [(0,)] * 4 + [(1,)] * 4
+    assert render_queue.get_texture_binds() == 4
+
+def test_transparent_draws_run_back_to_front_after_opaque(gl: RecordingGL) -> None:
+    render_queue = RenderQueue()
+    mesh, texture = create_mesh(), create_texture()
+
+    transparent = [create_entity(mesh, texture, [0.0, 0.0, depth]) for depth in (-2.0, -8.0, -5.0)]
+
+    for entity in transparent:
+        entity.set_is_transparent(True)
+
+    flush(gl, render_queue, [*transparent, create_entity(mesh, texture, [0.0, 0.0, -1.0])])
+
+    depths = [float(np.asarray(matrix).reshape(-1)[14]) for matrix, in get_calls(gl, "glLoadMatrixf")]
+    draws = [index for index, (name, _) in enumerate(gl.get_log()) if name == "glDrawElements"]
+    depth_masks = [(index, arguments) for index, (name, arguments) in enumerate(gl.get_log()) if name == "glDepthMask"]
+
+    assert depths == [-1.0, -8.0, -5.0, -2.0]
+    assert draws[0] < depth_masks[0][0] < draws[1] and depth_masks[0][1] == (GL_FALSE,)
+    assert depth_masks[-1][0] > draws[-1] and depth_masks[-1][1] == (GL_TRUE,)
+
+def test_counters_reset_between_flushes(gl: RecordingGL) -> None:
+    render_queue = RenderQueue()
+    mesh, texture = create_mesh(), create_texture()
+
+    flush(gl, render_queue, [create_entity(mesh, texture) for _ in range(3)])
+    flush(gl, render_queue, [create_entity(mesh, texture)])
+
+    assert render_queue.get_draw_calls() == 1
+    assert render_queue.get_binds_avoided() == 0
+    assert render_queue.get_command_count() == 0
+
+def test_shader_programs_receive_the_camera_position(gl: RecordingGL) -> None:
+    Preferences.set_shader_rendering_enabled(True)
+    render_queue = RenderQueue()
+
+    render_queue.submit(create_entity(create_mesh(), create_texture()))
+    gl.reset()
+    render_queue.flush([1.0, 2.0, 3.0])
+
+    assert [list(position) for _, _, position in get_calls(gl, "glUniform3fv")] == [[1.0, 2.0, 3.0]]
\ No newline at end of file
@@ -0,0 +1,46 @@
+import pytest
+
+from ngen.api.scene import Scene
+from ngen.api.entity import Entity
+from ngen.api.transform import Transform
+from ngen.api.camera import CameraPerspective
+from benchmarks.gl_stub import RecordingGL
+
+@pytest.fixture
+def gl() -> RecordingGL:
+    with RecordingGL() as recording:
+        yield recording
+
+def create_transform() -> Transform:
+    return Transform([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0])
+
+def create_scene(*entities: Entity) -> Scene:
+    return Scene([0.0, 0.0, 0.0, 1.0], CameraPerspective(create_transform(), 70.0, 0.1, 100.0), *entities)
+
+def test_get_scene_objects_returns_an_indexable_list(gl: RecordingGL) -> None:
+    entities = [Entity(create_transform(), None) for _ in range(2)]
+    scene = create_scene(*entities)
+
+    assert scene.get_scene_objects()[1] is entities[1]
+    assert scene.get_scene_objects() + [None] == [*entities, None]
+
+def test_destroy_handles_children_that_were_never_instantiated(gl: RecordingGL) -> None:
+    parent = Entity(create_transform(), None)
+    child = Entity(create_transform(), None)
+    child.set_parent(parent)
+
+    scene = create_scene(parent)
+    scene.destroy(parent)
+
+    assert scene.get_scene_objects() == []
+    assert child.get_parent() is None
+
+def test_destroy_removes_instantiated_children(gl: RecordingGL) -> None:
+    parent = Entity(create_transform(), None)
+    child = Entity(create_transform(), None)
+    child.set_parent(parent)
+
+    scene = create_scene(parent, child)
+    scene.destroy(parent)
+
+    assert scene.get_scene_objects() == []
\ No newline at end of file
@@ -0,0 +1,75 @@
+import pytest
+
+from ngen.api.scene import Scene
+from ngen.api.entity import Entity
+from ngen.api.transform import Transform
+from ngen.api.camera import CameraPerspective
+from ngen.engine.obj_parser import ObjParser
+from ngen.graphics.mesh import Mesh
+from ngen.graphics.geometry import Geometry
+from benchmarks.gl_stub import RecordingGL
+
+TRIANGLE = b"v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n"
+
+@pytest.fixture
+def gl() -> RecordingGL:
+    with RecordingGL() as recording:
+        yield recording
+
+@pytest.fixture
+def freed(monkeypatch: pytest.MonkeyPatch) -> list[Mesh]:
+    meshes = []
+    monkeypatch.setattr(Mesh, "free", lambda self: meshes.append(self))
+    return meshes
+
+def create_mesh() -> Mesh:
+    return Mesh(*Geometry.build_indexed(*ObjParser.parse_bytes(TRIANGLE)))
+
+def create_entity(mesh: Mesh, position: list[float], is_transparent: bool = False) -> Entity:
+    entity = Entity(Transform(position, [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), mesh)
+    entity.set_is_static(True)
+    entity.set_is_transparent(is_transparent)
+    return entity
+
+def create_scene(*entities: Entity) -> Scene:
+    camera = CameraPerspective(Transform([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), 70.0, 0.1, 100.0)
+    scene = Scene([0.0, 0.0, 0.0, 1.0], camera, *entities)
+    scene.build_static_batches(100.0)
+    return scene
+
+def test_transparent_entities_are_not_batched(gl: RecordingGL) -> None:
+    mesh = create_mesh()
+    opaque = [create_entity(mesh, [float(index), 0.0, 0.0]) for index in range(2)]
+    transparent = create_entity(mesh, [3.0, 0.0, 0.0], True)
+
+    scene = create_scene(*opaque, transparent)
+
+    assert scene.get_static_batcher().get_members() == opaque
+    assert not transparent.get_is_batched()
+    assert not any(chunk.get_is_transparent() for chunk in scene.get_static_batcher().get_chunks())
+
+def test_member_made_transparent_leaves_its_chunk(gl: RecordingGL) -> None:
+    mesh = create_mesh()
+    entities = [create_entity(mesh, [float(index), 0.0, 0.0]) for index in range(3)]
+    scene = create_scene(*entities)
+
+    entities[0].set_is_transparent(True)
+    scene.update_static_batches()
+
+    assert not entities[0].get_is_batched()
+    assert scene.get_static_batcher().get_members() == entities[1:]
+
+def test_destroy_keeps_meshes_other_members_share(gl: RecordingGL, freed: list[Mesh]) -> None:
+    shared = create_mesh()
+    entities = [create_entity(shared, [float(index), 0.0, 0.0]) for index in range(3)]
+    scene = create_scene(*entities)
+
+    scene.destroy(entities[0])
+
+    assert shared not in freed
+
+    scene.update_static_batches()
+    scene.destroy(entities[1])
+    scene.destroy(entities[2])
+
+    assert freed.count(shared) == 1
\ No newline at end of file
@@ -0,0 +1,30 @@
+import argparse
+
+from benchmarks.suite import get_parameters, compare_parameters, compare
+
+def create_baseline(scale: float) -> dict:
+    return {
+        "parameters": {"gl": "stub", "scale": scale, "frames": 30},
+        "results": {"texture_load": {"seconds": 1.0, "peak_mb": 1.0}},
+    }
+
+def test_parameters_are_taken_from_arguments() -> None:
+    arguments = argparse.Namespace(gl="stub", scale=0.05, frames=3, repeat=1)
+
+    assert get_parameters(arguments) == {"gl": "stub", "scale": 0.05, "frames": 3}
+
+def test_matching_parameters_compare_clean() -> None:
+    assert compare_parameters({"gl": "stub", "scale": 1.0, "frames": 30}, create_baseline(1.0)) == []
+
+def test_mismatched_parameters_are_reported() -> None:
+    mismatches = compare_parameters({"gl": "stub", "scale": 0.05, "frames": 3}, create_baseline(1.0))
+
+    assert mismatches == ["--scale 0.05 vs baseline 1.0", "--frames 3 vs baseline 30"]
+
+def test_baseline_without_parameters_is_a_mismatch() -> None:
+    assert len(compare_parameters({"gl": "stub", "scale": 1.0, "frames": 30}, {"texture_load": {}})) == 3
+
+def test_compare_reads_nested_results() -> None:
+    results = {"texture_load": {"seconds": 2.0, "peak_mb": 1.0}}
+
+    assert compare(results, create_baseline(1.0), 0.25, 0.25) == ["texture_load: 2.0000s vs baseline 1.0000s"]
\ No newline at end of file
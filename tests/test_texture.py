@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from PIL import Image
+from OpenGL.GL import GL_LINEAR, GL_LINEAR_MIPMAP_LINEAR, GL_TEXTURE_MIN_FILTER
+
+from ngen.engine.loader import Loader
+from ngen.engine.preferences import Preferences
+from ngen.graphics.texture import Texture
+from ngen.graphics.texture_cache import TextureCache
+from benchmarks.gl_stub import RecordingGL
+
+@pytest.fixture
+def gl() -> RecordingGL:
+    with RecordingGL(True) as recording:
+        yield recording
+        TextureCache.clear()
+
+@pytest.fixture
+def preferences() -> None:
+    TEXTURE_FORMAT = Preferences.get_texture_format()
+    TEXTURE_MAX_RESOLUTION = Preferences.get_texture_max_resolution()
+    IS_TEXTURE_COOKING_ENABLED = Preferences.get_texture_cooking_enabled()
+
+    yield
+
+    Preferences.set_texture_format(TEXTURE_FORMAT)
+    Preferences.set_texture_max_resolution(TEXTURE_MAX_RESOLUTION)
+    Preferences.set_texture_cooking_enabled(IS_TEXTURE_COOKING_ENABLED)
+
+def get_min_filter(gl: RecordingGL) -> int:
+    parameters = [arguments for name, arguments in gl.get_log() if name == "glTexParameteri"]
+    return [value for _, parameter, value in parameters if parameter == GL_TEXTURE_MIN_FILTER][-1]
+
+def create_levels(count: int) -> list[tuple[int, int, np.ndarray]]:
+    return [(8 >> level, 8 >> level, np.zeros((8 >> level) ** 2 * 4, dtype=np.uint8)) for level in range(count)]
+
+@pytest.mark.parametrize("max_level, expected", [(None, GL_LINEAR_MIPMAP_LINEAR), (2, GL_LINEAR_MIPMAP_LINEAR), (0, GL_LINEAR)])
+def test_generated_mipmaps_are_sampled(gl: RecordingGL, max_level: int | None, expected: int) -> None:
+    Texture.from_pixels(8, 8, bytes(8 * 8 * 4), max_level)
+
+    assert get_min_filter(gl) == expected
+
+@pytest.mark.parametrize("count, expected", [(4, GL_LINEAR_MIPMAP_LINEAR), (1, GL_LINEAR)])
+def test_uploaded_levels_are_sampled(gl: RecordingGL, count: int, expected: int) -> None:
+    Texture.from_levels(create_levels(count), "rgba8")
+
+    assert get_min_filter(gl) == expected
+
+def test_single_texel_texture_has_no_mipmaps(gl: RecordingGL) -> None:
+    Texture.from_pixels(1, 1, bytes(4))
+
+    assert get_min_filter(gl) == GL_LINEAR
+
+def test_cooked_textures_are_cached_per_format_and_resolution(gl: RecordingGL, preferences: None, tmp_path) -> None:
+    path = str(tmp_path / "albedo.png")
+    Image.new("RGBA", (16, 16), (255, 0, 0, 255)).save(path)
+
+    Preferences.set_texture_cooking_enabled(True)
+    Preferences.set_texture_format("rgba8")
+    Preferences.set_texture_max_resolution(None)
+    full = Loader.load_texture(path)
+
+    Preferences.set_texture_max_resolution(4)
+    reduced = Loader.load_texture(path)
+
+    assert reduced is not full
+    assert (full.get_width(), reduced.get_width()) == (16, 4)
+    assert Loader.load_texture(path) is reduced
+
+def test_uncooked_textures_share_the_content_key(gl: RecordingGL, preferences: None, tmp_path) -> None:
+    path = str(tmp_path / "albedo.png")
+    Image.new("RGBA", (16, 16)).save(path)
+
+    Preferences.set_texture_cooking_enabled(False)
+
+    assert Loader.load_texture(path) is TextureCache.load(path)
\ No newline at end of file
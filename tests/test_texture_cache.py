@@ -0,0 +1,75 @@
+import pytest
+from PIL import Image
+
+from ngen.api.scene import Scene
+from ngen.api.entity import Entity
+from ngen.api.transform import Transform
+from ngen.api.camera import CameraPerspective
+from ngen.graphics.texture import Texture
+from ngen.graphics.texture_cache import TextureCache
+from benchmarks.gl_stub import RecordingGL
+
+@pytest.fixture
+def gl() -> RecordingGL:
+    with RecordingGL() as recording:
+        yield recording
+        TextureCache.clear()
+
+def create_transform() -> Transform:
+    return Transform([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0])
+
+def create_texture() -> Texture:
+    return Texture(Image.new("RGBA", (1, 1)))
+
+def destroy(entity: Entity) -> None:
+    Scene([0.0, 0.0, 0.0, 1.0], CameraPerspective(create_transform(), 70.0, 0.1, 100.0), entity).destroy(entity)
+
+def test_cached_texture_survives_its_last_entity_while_the_caller_holds_it(gl: RecordingGL) -> None:
+    texture = TextureCache.get_or_create("key", create_texture)
+    TEXTURE_ID = texture.get_id()
+
+    destroy(Entity(create_transform(), None, texture))
+
+    assert texture.get_id() == TEXTURE_ID
+    assert TextureCache.contains("key")
+
+    entity = Entity(create_transform(), None, texture)
+
+    assert entity.get_texture_albedo().get_id() == TEXTURE_ID
+    assert TextureCache.get_reference_count(texture) == 2
+
+def test_cached_texture_is_freed_after_every_holder_releases_it(gl: RecordingGL) -> None:
+    texture = TextureCache.get_or_create("key", create_texture)
+    entity = Entity(create_transform(), None, texture)
+
+    TextureCache.release(texture)
+    destroy(entity)
+
+    assert texture.get_id() is None
+    assert not TextureCache.contains("key")
+
+def test_each_lookup_hands_out_its_own_reference(gl: RecordingGL) -> None:
+    first = TextureCache.get_or_create("key", create_texture)
+    second = TextureCache.get_or_create("key", create_texture)
+
+    assert first is second
+    assert TextureCache.get_reference_count(first) == 2
+
+def test_uncached_texture_is_left_to_its_creator(gl: RecordingGL) -> None:
+    texture = create_texture()
+    TEXTURE_ID = texture.get_id()
+
+    destroy(Entity(create_transform(), None, texture))
+
+    assert texture.get_id() == TEXTURE_ID
+    assert TextureCache.get_reference_count(texture) == 0
+
+def test_missing_albedo_is_owned_by_the_entity(gl: RecordingGL) -> None:
+    entity = Entity(create_transform(), None)
+    texture = entity.get_texture_albedo()
+
+    assert TextureCache.get_reference_count(texture) == 1
+
+    destroy(entity)
+
+    assert texture.get_id() is None
\ No newline at end of file
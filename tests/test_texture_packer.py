@@ -0,0 +1,138 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from ngen.api.scene import Scene
+from ngen.api.entity import Entity
+from ngen.api.transform import Transform
+from ngen.api.camera import CameraPerspective
+from ngen.engine.obj_parser import ObjParser
+from ngen.engine.texture_packer import TexturePacker
+from ngen.graphics.mesh import Mesh
+from ngen.graphics.texture import Texture
+from ngen.graphics.material import Material
+from ngen.graphics.geometry import Geometry
+from ngen.graphics.texture_atlas import TextureAtlas
+from benchmarks.gl_stub import RecordingGL
+
+TRIANGLE = b"v 0 0 0\nv 1 0 0\nv 0 1 0\nvt 0 0\nvt 1 0\nvt 0 1\nf 1/1 2/2 3/3\n"
+PADDING = 2
+
+def create_images(count: int, seed: int = 0) -> list[tuple[str, np.ndarray]]:
+    random = np.random.default_rng(seed)
+    sizes = random.integers(1, 48, size=(count, 2))
+    return [(f"image{index}", random.integers(0, 256, size=(height, width, 4), dtype=np.uint8)) for index, (height, width) in enumerate(sizes.tolist())]
+
+def get_rectangle(atlas: TextureAtlas, key: str) -> tuple[int, int, int, int]:
+    x, y, width, height = atlas.get_region(key) * [atlas.get_width(), atlas.get_height(), atlas.get_width(), atlas.get_height()]
+    return round(x), round(y), round(width), round(height)
+
+def test_regions_do_not_overlap_including_gutters() -> None:
+    for atlas in TexturePacker._build_atlases(create_images(40), 256, PADDING):
+        occupied = np.zeros((atlas.get_height(), atlas.get_width()), dtype=np.int64)
+
+        for key in atlas.get_keys():
+            x, y, width, height = get_rectangle(atlas, key)
+
+            assert x >= PADDING and y >= PADDING
+            assert x + width + PADDING <= atlas.get_width() and y + height + PADDING <= atlas.get_height()
+
+            occupied[y - PADDING:y + height + PADDING, x - PADDING:x + width + PADDING] += 1
+
+        assert occupied.max() == 1
+
+def test_regions_hold_the_source_pixels() -> None:
+    images = dict(create_images(40))
+
+    for atlas in TexturePacker._build_atlases(list(images.items()), 256, PADDING):
+        for key in atlas.get_keys():
+            x, y, width, height = get_rectangle(atlas, key)
+
+            np.testing.assert_array_equal(atlas.get_pixels()[y:y + height, x:x + width], images[key])
+
+def test_gutters_wrap_the_opposite_edge() -> None:
+    image = np.random.default_rng(1).integers(0, 256, size=(8, 6, 4), dtype=np.uint8)
+    atlas = TextureAtlas(64, 64, PADDING)
+
+    assert atlas.add("image", image)
+
+    x, y, width, height = get_rectangle(atlas, "image")
+    gutter = atlas.get_pixels()[y - PADDING:y + height + PADDING, x - PADDING:x + width + PADDING]
+
+    np.testing.assert_array_equal(gutter, np.pad(image, ((PADDING, PADDING), (PADDING, PADDING), (0, 0)), mode="wrap"))
+    np.testing.assert_array_equal(gutter[:PADDING, PADDING:-PADDING], image[-PADDING:])
+    np.testing.assert_array_equal(gutter[PADDING:-PADDING, :PADDING], image[:, -PADDING:])
+
+def test_oversized_images_are_rejected() -> None:
+    oversized = ("oversized", np.zeros((64, 64, 4), dtype=np.uint8))
+    atlas = TextureAtlas(64, 64, PADDING)
+
+    assert not atlas.add(*oversized)
+    assert atlas.get_region_count() == 0
+
+    atlases = TexturePacker._build_atlases([oversized, *create_images(4)], 64, PADDING)
+
+    assert all("oversized" not in atlas.get_keys() for atlas in atlases)
+    assert sum(atlas.get_region_count() for atlas in atlases) == 4
+
+@pytest.fixture
+def freed(monkeypatch: pytest.MonkeyPatch) -> list[Mesh]:
+    meshes = []
+    FREE = Mesh.free
+
+    def free(mesh: Mesh) -> None:
+        meshes.append(mesh)
+        FREE(mesh)
+
+    monkeypatch.setattr(Mesh, "free", free)
+    return meshes
+
+@pytest.fixture
+def gl() -> RecordingGL:
+    with RecordingGL() as recording:
+        yield recording
+        TexturePacker.reset()
+
+def create_entity(mesh: Mesh, texture: Texture) -> Entity:
+    return Entity(Transform([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), mesh, texture)
+
+def create_scene(*entities: Entity) -> Scene:
+    return Scene([0.0, 0.0, 0.0, 1.0], CameraPerspective(Transform([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]), 70.0, 0.1, 100.0), *entities)
+
+def test_pack_frees_source_meshes_no_entity_uses(gl: RecordingGL, freed: list[Mesh]) -> None:
+    mesh = Mesh(*Geometry.build_indexed(*ObjParser.parse_bytes(TRIANGLE)))
+    entities = [create_entity(mesh, Texture(Image.new("RGBA", (4, 4)))) for _ in range(2)]
+
+    TexturePacker.pack(create_scene(*entities))
+
+    assert entities[0].get_mesh() is not mesh
+    assert freed == [mesh]
+
+def test_destroy_keeps_remapped_meshes_siblings_share(gl: RecordingGL, freed: list[Mesh]) -> None:
+    mesh = Mesh(*Geometry.build_indexed(*ObjParser.parse_bytes(TRIANGLE)))
+    entities = [create_entity(mesh, Texture(Image.new("RGBA", (4, 4)))) for _ in range(2)]
+    scene = create_scene(*entities)
+
+    TexturePacker.pack(scene)
+    remapped = entities[1].get_mesh()
+
+    assert entities[0].get_mesh() is remapped
+
+    scene.destroy(entities[0])
+
+    assert remapped not in freed
+
+    scene.destroy(entities[1])
+
+    assert freed.count(remapped) == 1
+
+def test_pack_keeps_source_meshes_unpacked_entities_share(gl: RecordingGL, freed: list[Mesh]) -> None:
+    mesh = Mesh(*Geometry.build_indexed(*ObjParser.parse_bytes(TRIANGLE)))
+    entities = [create_entity(mesh, Texture(Image.new("RGBA", (4, 4)))) for _ in range(3)]
+    entities[2].set_material(Material(None, None, {Material.TextureSlot.EMISSIVE: Texture(Image.new("RGBA", (4, 4)))}))
+
+    TexturePacker.pack(create_scene(*entities))
+
+    assert entities[0].get_mesh() is not mesh
+    assert entities[2].get_mesh() is mesh
+    assert freed == []
\ No newline at end of file
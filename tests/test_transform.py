@@ -0,0 +1,40 @@
+import numpy as np
+
+from ngen.api.transform import Transform
+
+def create_transform() -> Transform:
+    return Transform([1.0, 2.0, 3.0], [0.0, 90.0, 0.0], [1.0, 1.0, 1.0])
+
+def test_getters_return_lists() -> None:
+    transform = create_transform()
+
+    assert transform.get_position() + [4.0] == [1.0, 2.0, 3.0, 4.0]
+    assert transform.get_rotation() == [0.0, 90.0, 0.0]
+    assert transform.get_scale() == [1.0, 1.0, 1.0]
+
+def test_getter_results_are_snapshots() -> None:
+    transform = create_transform()
+    position = transform.get_position()
+
+    transform.set_position([5.0, 6.0, 7.0])
+
+    assert position == [1.0, 2.0, 3.0]
+
+def test_editing_a_getter_result_does_not_bypass_the_cached_matrix() -> None:
+    transform = create_transform()
+    matrix = transform.get_model_matrix().copy()
+    revision = transform.get_revision()
+
+    transform.get_position()[1] += 1.0
+
+    assert transform.get_revision() == revision
+    np.testing.assert_array_equal(transform.get_model_matrix(), matrix)
+
+def test_setters_invalidate_the_cached_matrix() -> None:
+    transform = create_transform()
+    revision = transform.get_revision()
+
+    transform.set_position([0.0, 0.0, 0.0])
+
+    assert transform.get_revision() > revision
+    np.testing.assert_allclose(transform.get_model_matrix()[:3, 3], [0.0, 0.0, 0.0])
\ No newline at end of file
@@ -0,0 +1,21 @@
+from ngen.api.transform_store import TransformStore
+
+def test_get_transforms_skips_released_slots() -> None:
+    store = TransformStore(4)
+    transforms = [store.create([float(index), 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]) for index in range(3)]
+
+    store.release(transforms[1])
+
+    assert store.get_transforms() == [transforms[0], transforms[2]]
+    assert [transform.get_position()[0] for transform in store.get_transforms()] == [0.0, 2.0]
+
+def test_released_slot_is_reused() -> None:
+    store = TransformStore(4)
+    transforms = [store.create([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]) for _ in range(2)]
+
+    store.release(transforms[0])
+    replacement = store.create([3.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0])
+
+    assert store.get_count() == 2
+    assert replacement.get_store_index() == 0
+    assert store.get_transforms() == [replacement, transforms[1]]
\ No newline at end of file